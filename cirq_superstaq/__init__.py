@@ -12,9 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cirq_superstaq import compiler_output, serialization
+from cirq_superstaq import (
+    compile_cache,
+    compiler_output,
+    compression,
+    fingerprint,
+    job_store,
+    pulse_summary,
+    result,
+    serialization,
+)
 from cirq_superstaq._init_vars import API_URL, API_VERSION
 from cirq_superstaq._version import __version__
+from cirq_superstaq.compile_cache import CompileCache
 from cirq_superstaq.custom_gates import (
     AceCR,
     AceCRMinusPlus,
@@ -31,30 +41,60 @@ from cirq_superstaq.custom_gates import (
     ZXPowGate,
     ZZSwapGate,
 )
-from cirq_superstaq.job import Job
+from cirq_superstaq.fingerprint import circuit_fingerprint
+from cirq_superstaq.job import Job, PollingStrategy
+from cirq_superstaq.job_group import (
+    ALL_COMPLETED,
+    as_completed,
+    FIRST_COMPLETED,
+    JobGroup,
+    JobPoller,
+    wait,
+)
+from cirq_superstaq.job_store import JobStore
+from cirq_superstaq.pulse_summary import PulseSummary
+from cirq_superstaq.result import CountsResult
 from cirq_superstaq.sampler import Sampler
 from cirq_superstaq.service import Service
 
 __all__ = [
     "__version__",
+    "ALL_COMPLETED",
+    "as_completed",
     "AceCR",
     "AceCRMinusPlus",
     "AceCRPlusMinus",
     "API_URL",
     "API_VERSION",
     "barrier",
+    "circuit_fingerprint",
     "Barrier",
+    "compile_cache",
+    "CompileCache",
     "compiler_output",
+    "compression",
+    "CountsResult",
     "CR",
+    "fingerprint",
+    "FIRST_COMPLETED",
     "AQTICCX",
     "AQTITOFFOLI",
     "Job",
+    "JobGroup",
+    "JobPoller",
+    "job_store",
+    "JobStore",
     "ParallelGates",
     "ParallelRGate",
+    "PollingStrategy",
+    "pulse_summary",
+    "PulseSummary",
+    "result",
     "serialization",
     "RGate",
     "Sampler",
     "Service",
+    "wait",
     "ZX",
     "ZXPowGate",
     "ZZSwapGate",
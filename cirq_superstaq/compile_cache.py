@@ -0,0 +1,233 @@
+# Copyright 2021 The Cirq Developers
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A content-addressed cache of responses from the SuperstaQ API's compilation endpoints."""
+
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional, Union
+
+
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(
+    endpoint: str,
+    request_json: Dict[str, Any],
+    remote_host: Optional[str] = None,
+    api_version: Optional[str] = None,
+) -> str:
+    """Computes the key under which the response to a compile request is cached.
+
+    Args:
+        endpoint: The compilation endpoint, e.g. "/aqt_compile".
+        request_json: The JSON body of the request, containing the serialized circuit(s), the
+            target, and any other options.
+        remote_host: The URL of the API to which the request is sent, so that responses from
+            different deployments (e.g. staging and production) are cached separately.
+        api_version: The version of the API to which the request is sent.
+
+    Returns:
+        The hex SHA-256 digest of a canonical serialization of the request and its destination.
+    """
+    canonical_json = json.dumps(
+        {
+            "endpoint": endpoint,
+            "request": request_json,
+            "remote_host": remote_host,
+            "api_version": api_version,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical_json.encode()).hexdigest()
+
+
+class CompileCache:
+    """A cache of compile responses, keyed by a hash of the request (see `cache_key`).
+
+    Responses are kept as raw JSON in an in-memory LRU tier holding up to `max_entries` responses,
+    and (if a `path` is given) in an on-disk tier, with one file per response. Responses found on
+    disk are promoted to the in-memory tier. Once the total size of the files on disk exceeds
+    `max_disk_bytes`, the least recently used are evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_disk_bytes: Optional[int] = DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        """Constructs a CompileCache.
+
+        Args:
+            max_entries: The maximum number of responses to keep in memory.
+            path: An optional directory in which to also store responses on disk. It is created
+                if it does not already exist.
+            max_disk_bytes: The maximum total size (in bytes) of the responses to keep on disk, or
+                None to never evict them.
+        """
+        self.max_entries = max_entries
+        self.path = None if path is None else os.fspath(path)
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+
+    def _file_path(self, key: str) -> str:
+        assert self.path is not None
+        return os.path.join(self.path, f"{key}.json")
+
+    def _remember(self, key: str, raw_json: str) -> None:
+        """Adds a response to the in-memory tier, evicting the least recently used if full."""
+        self._entries[key] = raw_json
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Looks up a cached response, updating the hit/miss counters.
+
+        Args:
+            key: The key of the request (see `cache_key`).
+
+        Returns:
+            A new copy of the cached response, or None if it is not in the cache.
+        """
+        with self._lock:
+            raw_json = self._entries.get(key)
+            if raw_json is None and self.path is not None:
+                try:
+                    with open(self._file_path(key)) as file:
+                        raw_json = file.read()
+                    # Mark the file as recently used (see `_evict_from_disk`)
+                    os.utime(self._file_path(key))
+                except FileNotFoundError:
+                    pass
+
+            if raw_json is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(key, raw_json)
+        return json.loads(raw_json)
+
+    def put(self, key: str, json_dict: Dict[str, Any]) -> None:
+        """Stores a response in the cache.
+
+        Args:
+            key: The key of the request (see `cache_key`).
+            json_dict: The response returned by the SuperstaQ API.
+        """
+        raw_json = json.dumps(json_dict)
+        with self._lock:
+            self._remember(key, raw_json)
+            if self.path is not None:
+                # Write atomically, so that concurrent readers never see a partial file
+                fd, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+                with os.fdopen(fd, "w") as file:
+                    file.write(raw_json)
+                os.replace(temp_path, self._file_path(key))
+                self._evict_from_disk()
+
+    def _evict_from_disk(self) -> None:
+        """Deletes the least recently used files until the on-disk tier fits `max_disk_bytes`."""
+        if self.path is None or self.max_disk_bytes is None:
+            return
+
+        files = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                files.append((stat.st_mtime_ns, entry.name, stat.st_size))
+
+        total_bytes = sum(num_bytes for _, _, num_bytes in files)
+        for _, file_name, num_bytes in sorted(files):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.path, file_name))
+            except FileNotFoundError:
+                pass
+            total_bytes -= num_bytes
+
+    def get_or_compile(
+        self,
+        endpoint: str,
+        request_json: Dict[str, Any],
+        compile_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+        remote_host: Optional[str] = None,
+        api_version: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Returns the cached response to a compile request, calling `compile_fn` on a miss.
+
+        Args:
+            endpoint: The compilation endpoint, e.g. "/aqt_compile".
+            request_json: The JSON body of the request.
+            compile_fn: A function which sends `request_json` to the endpoint and returns its
+                response.
+            remote_host: The URL of the API to which `compile_fn` sends the request.
+            api_version: The version of the API to which `compile_fn` sends the request.
+
+        Returns:
+            The (possibly cached) response to the request.
+        """
+        key = cache_key(endpoint, request_json, remote_host, api_version)
+        json_dict = self.get(key)
+        if json_dict is None:
+            json_dict = compile_fn(request_json)
+            self.put(key, json_dict)
+        return json_dict
+
+    def invalidate(self, key: str) -> None:
+        """Removes a single response (if present) from both tiers of the cache.
+
+        Args:
+            key: The key of the request (see `cache_key`).
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            if self.path is not None:
+                try:
+                    os.remove(self._file_path(key))
+                except FileNotFoundError:
+                    pass
+
+    def clear(self) -> None:
+        """Removes every response from both tiers of the cache, and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            if self.path is not None:
+                for file_name in os.listdir(self.path):
+                    if file_name.endswith(".json"):
+                        os.remove(os.path.join(self.path, file_name))
+
+    def __len__(self) -> int:
+        """Returns the number of responses in the in-memory tier."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"css.CompileCache(max_entries={self.max_entries!r}, path={self.path!r}, "
+            f"max_disk_bytes={self.max_disk_bytes!r})"
+        )
@@ -0,0 +1,138 @@
+import os
+import pathlib
+from unittest import mock
+
+import cirq_superstaq as css
+
+
+def test_cache_key() -> None:
+    key = css.compile_cache.cache_key("/aqt_compile", {"cirq_circuits": "[]", "backend": "x"})
+    assert len(key) == 64
+    assert key == css.compile_cache.cache_key(
+        "/aqt_compile", {"backend": "x", "cirq_circuits": "[]"}
+    )
+    assert key != css.compile_cache.cache_key(
+        "/cq_compile", {"cirq_circuits": "[]", "backend": "x"}
+    )
+    assert key != css.compile_cache.cache_key(
+        "/aqt_compile", {"cirq_circuits": "[]", "backend": "y"}
+    )
+
+    # Requests to different APIs should be cached separately
+    remote_key = css.compile_cache.cache_key(
+        "/aqt_compile", {"cirq_circuits": "[]", "backend": "x"}, "http://example.com", "v0.1.0"
+    )
+    assert remote_key != key
+    assert remote_key != css.compile_cache.cache_key(
+        "/aqt_compile", {"cirq_circuits": "[]", "backend": "x"}, "http://example.org", "v0.1.0"
+    )
+    assert remote_key != css.compile_cache.cache_key(
+        "/aqt_compile", {"cirq_circuits": "[]", "backend": "x"}, "http://example.com", "v0.2.0"
+    )
+
+
+def test_compile_cache() -> None:
+    cache = css.CompileCache(max_entries=2)
+    assert repr(cache) == (
+        "css.CompileCache(max_entries=2, path=None, "
+        f"max_disk_bytes={css.compile_cache.DEFAULT_MAX_DISK_BYTES})"
+    )
+
+    assert cache.get("a") is None
+    cache.put("a", {"cirq_circuits": "a"})
+    cache.put("b", {"cirq_circuits": "b"})
+    assert cache.get("a") == {"cirq_circuits": "a"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Returned responses should be independent copies
+    cache.get("a")["cirq_circuits"] = "changed"  # type: ignore[index]
+    assert cache.get("a") == {"cirq_circuits": "a"}
+
+    # "b" is now the least recently used
+    cache.put("c", {"cirq_circuits": "c"})
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("c") == {"cirq_circuits": "c"}
+
+    cache.invalidate("c")
+    cache.invalidate("d")
+    assert cache.get("c") is None
+    assert (cache.hits, cache.misses) == (4, 3)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert cache.get("a") is None
+
+
+def test_compile_cache_on_disk(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "compile_cache"
+    cache = css.CompileCache(max_entries=1, path=path, max_disk_bytes=None)
+    assert repr(cache) == (
+        f"css.CompileCache(max_entries=1, path={str(path)!r}, max_disk_bytes=None)"
+    )
+
+    cache.put("a", {"cirq_circuits": "a"})
+    cache.put("b", {"cirq_circuits": "b"})
+    assert len(cache) == 1
+    assert sorted(os.listdir(path)) == ["a.json", "b.json"]
+
+    # Evicted from memory, but still on disk
+    assert cache.get("a") == {"cirq_circuits": "a"}
+    assert css.CompileCache(path=path).get("b") == {"cirq_circuits": "b"}
+
+    cache.invalidate("a")
+    cache.invalidate("c")
+    assert cache.get("a") is None
+    assert sorted(os.listdir(path)) == ["b.json"]
+
+    (path / "unrelated.txt").write_text("")
+    cache.clear()
+    assert cache.get("b") is None
+    assert sorted(os.listdir(path)) == ["unrelated.txt"]
+
+
+def test_compile_cache_disk_limit(tmp_path: pathlib.Path) -> None:
+    entry_bytes = len('{"cirq_circuits": "a"}')
+    cache = css.CompileCache(max_entries=1, path=tmp_path, max_disk_bytes=2 * entry_bytes)
+
+    cache.put("a", {"cirq_circuits": "a"})
+    cache.put("b", {"cirq_circuits": "b"})
+    os.utime(tmp_path / "a.json", ns=(1, 1))
+    os.utime(tmp_path / "b.json", ns=(2, 2))
+
+    # Reading "a" from disk should make "b" the least recently used
+    assert cache.get("a") == {"cirq_circuits": "a"}
+    cache.put("c", {"cirq_circuits": "c"})
+    assert sorted(os.listdir(tmp_path)) == ["a.json", "c.json"]
+    assert cache.get("b") is None
+
+    # Responses larger than the limit are not kept on disk
+    cache.max_disk_bytes = 0
+    cache.put("d", {"cirq_circuits": "d"})
+    assert os.listdir(tmp_path) == []
+    assert cache.get("d") == {"cirq_circuits": "d"}
+
+    # Files removed concurrently (e.g. by another process) should be skipped
+    with mock.patch("os.remove", side_effect=FileNotFoundError):
+        cache.put("e", {"cirq_circuits": "e"})
+    assert os.listdir(tmp_path) == ["e.json"]
+
+
+def test_get_or_compile() -> None:
+    cache = css.CompileCache()
+    compile_fn = mock.MagicMock(return_value={"cirq_circuits": "compiled"})
+    request_json = {"cirq_circuits": "[]", "backend": "x"}
+
+    assert cache.get_or_compile("/cq_compile", request_json, compile_fn) == {
+        "cirq_circuits": "compiled"
+    }
+    assert cache.get_or_compile("/cq_compile", request_json, compile_fn) == {
+        "cirq_circuits": "compiled"
+    }
+    compile_fn.assert_called_once_with(request_json)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.invalidate(css.compile_cache.cache_key("/cq_compile", request_json))
+    cache.get_or_compile("/cq_compile", request_json, compile_fn)
+    assert compile_fn.call_count == 2
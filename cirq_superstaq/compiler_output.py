@@ -1,6 +1,20 @@
+import functools
 import importlib
 import warnings
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 
 import cirq
@@ -13,28 +27,246 @@ try:
 except ModuleNotFoundError:
     pass
 
+T = TypeVar("T")
+
+
+_NOT_LOADED: Any = object()
+
+
+class _LazyList(MutableSequence[T]):
+    """A list whose items are only computed (once each) when they are first accessed.
+
+    `load` is called on first use, and returns a function computing each item. This allows e.g.
+    the extent of each item in a serialized list to only be found once the list is used. Once every
+    item has been computed (or the list is modified), these functions are released, along with
+    anything they reference (such as the serialized list). Lazy lists are pickled as plain lists.
+    """
+
+    def __init__(self, load: Callable[[], Sequence[Callable[[], T]]]) -> None:
+        self._load: Optional[Callable[[], Sequence[Callable[[], T]]]] = load
+        self._getters: Optional[List[Callable[[], T]]] = None
+        self._items: Optional[List[T]] = None
+        self._num_unloaded = 0
+
+    def _loaded_items(self) -> List[T]:
+        """Returns the list of items, in which those which haven't been computed are _NOT_LOADED."""
+        if self._items is None:
+            assert self._load is not None
+            self._getters = list(self._load())
+            self._load = None
+            self._items = [_NOT_LOADED] * len(self._getters)
+            self._num_unloaded = len(self._items)
+            if not self._num_unloaded:
+                self._getters = None
+        return self._items
+
+    def _get(self, index: int) -> T:
+        items = self._loaded_items()
+        if items[index] is _NOT_LOADED:
+            assert self._getters is not None
+            items[index] = self._getters[index]()
+            self._num_unloaded -= 1
+            if not self._num_unloaded:
+                self._getters = None
+        return items[index]
+
+    def _materialize(self) -> List[T]:
+        """Computes every item, returning the (now plain) list of items."""
+        items = self._loaded_items()
+        for index in range(len(items)):
+            self._get(index)
+        return items
+
+    def __len__(self) -> int:
+        return len(self._loaded_items())
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        indices = range(len(self))
+        if isinstance(index, slice):
+            return [self._get(i) for i in indices[index]]
+        if not -len(indices) <= index < len(indices):
+            raise IndexError("list index out of range")
+        return self._get(indices[index])
+
+    @overload
+    def __setitem__(self, index: int, value: T) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None:
+        ...
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        self._materialize()[index] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._materialize()[index]
+
+    def insert(self, index: int, value: T) -> None:
+        self._materialize().insert(index, value)
+
+    def __add__(self, other: object) -> List[T]:
+        if not isinstance(other, (list, _LazyList)):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other: object) -> List[T]:
+        if not isinstance(other, list):
+            return NotImplemented
+        return other + list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, _LazyList)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __reduce__(self) -> Tuple[Callable[..., List[T]], Tuple[List[T]]]:
+        return list, (list(self),)
+
+    def __repr__(self) -> str:
+        if self._items is not None and not self._num_unloaded:
+            return repr(self._items)
+        num_items = "?" if self._items is None else len(self._items)
+        num_loaded = 0 if self._items is None else len(self._items) - self._num_unloaded
+        return f"<lazy list ({num_loaded} of {num_items} items loaded)>"
+
+
+def _read_circuits(
+    serialized_circuits: str, circuits_is_list: bool, lazy: bool
+) -> Union[cirq.Circuit, Sequence[cirq.Circuit]]:
+    """Deserializes the compiled circuit(s) in a response.
+
+    If `lazy`, a list of circuits is returned as a `_LazyList` (which keeps `serialized_circuits`
+    until every circuit has been accessed). Otherwise circuits are decoded incrementally, so that
+    `serialized_circuits` is not retained.
+    """
+    if not circuits_is_list:
+        return next(css.serialization.iter_deserialize_compiled_circuits(serialized_circuits))
+    if lazy:
+        return _LazyList(
+            functools.partial(css.serialization._compiled_circuit_getters, serialized_circuits)
+        )
+    return list(css.serialization.iter_deserialize_compiled_circuits(serialized_circuits))
+
+
+def _deserialize_list(
+    serialized_values: Union[str, List[str]], lazy: bool, max_workers: Optional[int] = 1
+) -> Sequence[Any]:
+    """Deserializes a list serialized with `gss.converters.serialize`.
+
+    If `serialized_values` is a list of separately serialized items, `lazy` is True, and
+    `max_workers` is 1, each is only deserialized when it is accessed. Otherwise the whole list is
+    deserialized at once (when first used, if `lazy` is True), with up to `max_workers` worker
+    processes (see `css.serialization.deserialize_pulses`).
+    """
+
+    def load() -> List[Callable[[], Any]]:
+        if isinstance(serialized_values, list) and max_workers == 1:
+            return [
+                functools.partial(gss.converters.deserialize, value) for value in serialized_values
+            ]
+        values = css.serialization.deserialize_pulses(serialized_values, max_workers)
+        return [functools.partial(values.__getitem__, index) for index in range(len(values))]
+
+    if lazy:
+        return _LazyList(load)
+    return [get_value() for get_value in load()]
+
+
+def _summarize_pulses(serialized_pulses: Union[str, List[str]]) -> "_LazyList[css.PulseSummary]":
+    """Lazily summarizes pulse schedules (each individually, if they are serialized separately)."""
+
+    def load() -> List[Callable[[], "css.PulseSummary"]]:
+        if isinstance(serialized_pulses, list):
+            return [
+                functools.partial(css.pulse_summary.summarize_pulse, pulse)
+                for pulse in serialized_pulses
+            ]
+        summaries = css.pulse_summary.summarize_pulses(serialized_pulses)
+        return [functools.partial(summaries.__getitem__, i) for i in range(len(summaries))]
+
+    return _LazyList(load)
+
+
+def _expand_lazily(values: Sequence[T], indices: Sequence[int]) -> _LazyList[T]:
+    return _LazyList(lambda: [functools.partial(values.__getitem__, index) for index in indices])
+
+
+def _concatenate_lazily(values: Sequence[Sequence[T]]) -> _LazyList[T]:
+    return _LazyList(
+        lambda: [
+            functools.partial(value.__getitem__, index)
+            for value in values
+            for index in range(len(value))
+        ]
+    )
+
 
 class CompilerOutput:
+    """The compiled circuit(s) returned by one of the SuperstaQ API's compilation endpoints.
+
+    When read from a response (e.g. with `read_json_aqt`), the per-circuit attributes of an output
+    for multiple circuits are lazy read-only lists: each compiled circuit (or pulse sequence) is
+    only deserialized when it is first accessed.
+    """
+
     def __init__(
         self,
-        circuits: Union[cirq.Circuit, List[cirq.Circuit]],
+        circuits: Union[cirq.Circuit, Sequence[cirq.Circuit]],
         pulse_sequences: Optional[Any] = None,
         seq: Optional["qtrl.sequencer.Sequence"] = None,
-        jaqal_programs: Optional[Union[List[str], str]] = None,
-        pulse_lists: Optional[Union[List[List], List[List[List]]]] = None,
+        jaqal_programs: Optional[Union[Sequence[str], str]] = None,
+        pulse_lists: Optional[Union[Sequence[List], Sequence[List[List]]]] = None,
     ) -> None:
         if isinstance(circuits, cirq.Circuit):
             self.circuit = circuits
             self.pulse_list = pulse_lists
             self.pulse_sequence = pulse_sequences
+            self.pulse_summary: Optional[css.PulseSummary] = None
             self.jaqal_program = jaqal_programs
         else:
             self.circuits = circuits
             self.pulse_lists = pulse_lists
             self.pulse_sequences = pulse_sequences
+            self.pulse_summaries: Optional[Sequence[css.PulseSummary]] = None
             self.jaqal_programs = jaqal_programs
 
         self.seq = seq
+        self._lazy_attributes: Dict[str, Callable[[], Any]] = {}
+
+    def _set_lazily(self, name: str, load: Callable[[], Any]) -> None:
+        """Sets an attribute to the return value of `load`, which is only called when needed."""
+        self.__dict__.pop(name, None)
+        self._lazy_attributes[name] = load
+
+    def _is_lazy(self, name: str) -> bool:
+        return name in self.__dict__.get("_lazy_attributes", {})
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes which have not been set (or not loaded yet)
+        if self._is_lazy(name):
+            value = self._lazy_attributes[name]()
+            setattr(self, name, value)
+            self._lazy_attributes.pop(name, None)
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Lazy attributes are loaded first, so that their loaders (and data) aren't pickled
+        for name in list(self._lazy_attributes):
+            getattr(self, name)
+        return self.__dict__
+
+    def _repr_attribute(self, name: str) -> str:
+        return "<not yet loaded>" if self._is_lazy(name) else repr(getattr(self, name))
 
     def has_multiple_circuits(self) -> bool:
         """Returns True if this object represents multiple circuits.
@@ -46,35 +278,44 @@ class CompilerOutput:
 
     def __repr__(self) -> str:
         if not self.has_multiple_circuits():
-            return (
-                f"CompilerOutput({self.circuit!r}, {self.pulse_sequence!r}, {self.seq!r}, "
-                f"{self.jaqal_program!r}, {self.pulse_list!r})"
-            )
-        return (
-            f"CompilerOutput({self.circuits!r}, {self.pulse_sequences!r}, {self.seq!r}, "
-            f"{self.jaqal_programs!r}, {self.pulse_lists!r})"
-        )
+            names = ["circuit", "pulse_sequence", "seq", "jaqal_program", "pulse_list"]
+        else:
+            names = ["circuits", "pulse_sequences", "seq", "jaqal_programs", "pulse_lists"]
+        return f"CompilerOutput({', '.join(self._repr_attribute(name) for name in names)})"
 
 
-def read_json_ibmq(json_dict: Dict[str, Any], circuits_is_list: bool) -> CompilerOutput:
+def read_json_ibmq(
+    json_dict: Dict[str, Any],
+    circuits_is_list: bool,
+    lazy: bool = True,
+    max_pulse_workers: Optional[int] = 1,
+) -> CompilerOutput:
     """Reads out returned JSON from SuperstaQ API's IBMQ compilation endpoint.
 
     Args:
         json_dict: a JSON dictionary matching the format returned by /ibmq_compile endpoint
         circuits_is_list: bool flag that controls whether the returned object has a .circuits
             attribute (if True) or a .circuit attribute (False)
+        lazy: whether to only deserialize each compiled circuit and pulse sequence when it is
+            first accessed. If False, everything is deserialized up front, and `json_dict` is not
+            referenced by the returned object.
+        max_pulse_workers: the number of worker processes with which to deserialize the pulse
+            sequences, if they are serialized separately (or None to use one per CPU; see
+            `css.serialization.deserialize_pulses`).
     Returns:
         a CompilerOutput object with the compiled circuit(s). If qiskit is available locally,
         the returned object also stores the pulse sequences in the .pulse_sequence(s) attribute.
+        Regardless, the .pulse_summary (or .pulse_summaries) attribute contains the duration,
+        start time, number of instructions, and channels of each pulse sequence (see
+        `css.pulse_summary.summarize_pulses`), which are read when first accessed.
     """
-    compiled_circuits = css.serialization.deserialize_circuits(json_dict["cirq_circuits"])
     pulses = None
 
     if importlib.util.find_spec("qiskit"):
         import qiskit
 
         if "0.20" < qiskit.__version__ < "0.21":
-            pulses = gss.converters.deserialize(json_dict["pulses"])
+            pulses = _deserialize_list(json_dict["pulses"], lazy, max_pulse_workers)
         else:
             warnings.warn(
                 "ibmq_compile requires Qiskit Terra version 0.20.* to deserialize compiled pulse "
@@ -86,83 +327,200 @@ def read_json_ibmq(json_dict: Dict[str, Any], circuits_is_list: bool) -> Compile
             "sequences."
         )
 
+    compiled_circuits = _read_circuits(json_dict["cirq_circuits"], circuits_is_list, lazy)
     if circuits_is_list:
-        return CompilerOutput(circuits=compiled_circuits, pulse_sequences=pulses)
-    return CompilerOutput(circuits=compiled_circuits[0], pulse_sequences=pulses and pulses[0])
+        output = CompilerOutput(circuits=compiled_circuits, pulse_sequences=pulses)
+    else:
+        output = CompilerOutput(circuits=compiled_circuits, pulse_sequences=pulses and pulses[0])
+
+    if "pulses" in json_dict:
+        summaries = _summarize_pulses(json_dict["pulses"])
+        if circuits_is_list:
+            output.pulse_summaries = summaries if lazy else list(summaries)
+        elif lazy:
+            output._set_lazily("pulse_summary", functools.partial(summaries.__getitem__, 0))
+        else:
+            output.pulse_summary = summaries[0]
+
+    return output
+
+
+def _compile_qtrl_sequence(serialized_state: str) -> "qtrl.sequencer.Sequence":
+    state = gss.converters.deserialize(serialized_state)
+
+    seq = qtrl.sequencer.Sequence(n_elements=1)
+    seq.__setstate__(state)
+    seq.compile()
+    return seq
 
 
-def read_json_aqt(json_dict: Dict[str, Any], circuits_is_list: bool) -> CompilerOutput:
+def read_json_aqt(
+    json_dict: Dict[str, Any],
+    circuits_is_list: bool,
+    include_pulses: bool = True,
+    lazy: bool = True,
+) -> CompilerOutput:
     """Reads out returned JSON from SuperstaQ API's AQT compilation endpoint.
 
     Args:
         json_dict: a JSON dictionary matching the format returned by /aqt_compile endpoint
         circuits_is_list: bool flag that controls whether the returned object has a .circuits
             attribute (if True) or a .circuit attribute (False)
+        include_pulses: if False, the pulse sequence and cycles are skipped entirely (and the
+            .seq and .pulse_list(s) attributes are None)
+        lazy: whether to only deserialize each compiled circuit (and the pulse sequence and
+            cycles) when first accessed. If False, everything is deserialized up front, and
+            `json_dict` is not referenced by the returned object.
     Returns:
         a CompilerOutput object with the compiled circuit(s). If qtrl is available locally,
         the returned object also stores the pulse sequence in the .seq attribute and the
         list(s) of cycles in the .pulse_list(s) attribute.
     """
-    seq = None
-    pulse_lists = None
-
-    if importlib.util.find_spec(
-        "qtrl"
-    ):  # pragma: no cover, b/c qtrl is not open source so it is not in cirq-superstaq reqs
-        state = gss.converters.deserialize(json_dict["state_jp"])
-
-        seq = qtrl.sequencer.Sequence(n_elements=1)
-        seq.__setstate__(state)
-        seq.compile()
-
-        pulse_lists = gss.converters.deserialize(json_dict["pulse_lists_jp"])
+    output = CompilerOutput(_read_circuits(json_dict["cirq_circuits"], circuits_is_list, lazy))
+
+    if include_pulses and importlib.util.find_spec("qtrl"):
+        load_seq = functools.partial(_compile_qtrl_sequence, json_dict["state_jp"])
+        pulse_lists = _deserialize_list(json_dict["pulse_lists_jp"], lazy)
+        if circuits_is_list:
+            output.pulse_lists = pulse_lists
+        elif lazy:
+            output._set_lazily("pulse_list", functools.partial(pulse_lists.__getitem__, 0))
+        else:
+            output.pulse_list = pulse_lists[0]
 
-    compiled_circuits = css.serialization.deserialize_circuits(json_dict["cirq_circuits"])
-    if circuits_is_list:
-        return CompilerOutput(circuits=compiled_circuits, seq=seq, pulse_lists=pulse_lists)
+        if lazy:
+            output._set_lazily("seq", load_seq)
+        else:
+            output.seq = load_seq()
 
-    pulse_list = pulse_lists[0] if pulse_lists is not None else None
-    return CompilerOutput(circuits=compiled_circuits[0], seq=seq, pulse_lists=pulse_list)
+    return output
 
 
-def read_json_qscout(json_dict: Dict[str, Any], circuits_is_list: bool) -> CompilerOutput:
+def read_json_qscout(
+    json_dict: Dict[str, Any], circuits_is_list: bool, lazy: bool = True
+) -> CompilerOutput:
     """Reads out returned JSON from SuperstaQ API's QSCOUT compilation endpoint.
 
     Args:
         json_dict: a JSON dictionary matching the format returned by /qscout_compile endpoint
         circuits_is_list: bool flag that controls whether the returned object has a .circuits
             attribute (if True) or a .circuit attribute (False)
+        lazy: whether to only deserialize each compiled circuit when it is first accessed. If
+            False, every circuit is deserialized up front, and `json_dict` is not referenced by
+            the returned object.
     Returns:
         a CompilerOutput object with the compiled circuit(s) and a list jaqal programs
         represented as strings
     """
 
-    compiled_circuits = css.serialization.deserialize_circuits(json_dict["cirq_circuits"])
+    compiled_circuits = _read_circuits(json_dict["cirq_circuits"], circuits_is_list, lazy)
 
     if circuits_is_list:
         return CompilerOutput(
             circuits=compiled_circuits, jaqal_programs=json_dict["jaqal_programs"]
         )
 
-    return CompilerOutput(
-        circuits=compiled_circuits[0], jaqal_programs=json_dict["jaqal_programs"][0]
-    )
+    return CompilerOutput(circuits=compiled_circuits, jaqal_programs=json_dict["jaqal_programs"][0])
 
 
-def read_json_only_circuits(json_dict: Dict[str, Any], circuits_is_list: bool) -> CompilerOutput:
+def read_json_only_circuits(
+    json_dict: Dict[str, Any], circuits_is_list: bool, lazy: bool = True
+) -> CompilerOutput:
     """Reads out returned JSON from SuperstaQ API's CQ compilation endpoint.
 
     Args:
         json_dict: a JSON dictionary matching the format returned by /cq_compile endpoint
         circuits_is_list: bool flag that controls whether the returned object has a .circuits
             attribute (if True) or a .circuit attribute (False)
+        lazy: whether to only deserialize each compiled circuit when it is first accessed. If
+            False, every circuit is deserialized up front, and `json_dict` is not referenced by
+            the returned object.
     Returns:
         a CompilerOutput object with the compiled circuit(s)
     """
 
-    compiled_circuits = css.serialization.deserialize_circuits(json_dict["cirq_circuits"])
+    return CompilerOutput(_read_circuits(json_dict["cirq_circuits"], circuits_is_list, lazy))
+
+
+def expand_compiler_output(output: CompilerOutput, indices: Sequence[int]) -> CompilerOutput:
+    """Expands the output of compiling a list of unique circuits to a list containing duplicates.
+
+    Args:
+        output: The compiled output for a list of unique circuits.
+        indices: The index of the unique circuit corresponding to each circuit in the expanded
+            list (see `css.fingerprint.deduplicate_circuits`).
+
+    Returns:
+        A CompilerOutput whose per-circuit attributes (`.circuits`, `.pulse_sequences`,
+        `.jaqal_programs`, and `.pulse_lists`) contain an entry for each index in `indices` (which
+        is only looked up in `output` when first accessed). Every compiled circuit is a separate
+        copy, but note that `.seq` (which cannot be split) is unchanged, so it only contains the
+        pulse sequences of the unique circuits.
+    """
+
+    def copy_circuit(index: int) -> cirq.Circuit:
+        return output.circuits[index].copy()
+
+    seen_indices = set()
+    circuit_getters: List[Callable[[], cirq.Circuit]] = []
+    for index in indices:
+        if index in seen_indices:
+            circuit_getters.append(functools.partial(copy_circuit, index))
+        else:
+            circuit_getters.append(functools.partial(output.circuits.__getitem__, index))
+        seen_indices.add(index)
+
+    def expand(values: Any) -> Optional[_LazyList[Any]]:
+        return None if values is None else _expand_lazily(values, indices)
+
+    expanded_output = CompilerOutput(
+        circuits=_LazyList(lambda: circuit_getters),
+        pulse_sequences=expand(output.pulse_sequences),
+        jaqal_programs=expand(output.jaqal_programs),
+        pulse_lists=expand(output.pulse_lists),
+    )
+    expanded_output.pulse_summaries = expand(output.pulse_summaries)
+    if output._is_lazy("seq"):
+        expanded_output._set_lazily("seq", functools.partial(getattr, output, "seq"))
+    else:
+        expanded_output.seq = output.seq
+    return expanded_output
 
-    if circuits_is_list:
-        return CompilerOutput(circuits=compiled_circuits)
 
-    return CompilerOutput(circuits=compiled_circuits[0])
+def merge_compiler_outputs(outputs: Sequence[CompilerOutput]) -> CompilerOutput:
+    """Concatenates the outputs of compiling consecutive chunks of a list of circuits.
+
+    Args:
+        outputs: The compiled outputs for each chunk (each with a `.circuits` attribute), in order.
+
+    Returns:
+        A CompilerOutput whose per-circuit attributes (`.circuits`, `.pulse_sequences`,
+        `.jaqal_programs`, and `.pulse_lists`) are the (lazy) concatenation of those of
+        `outputs`.
+
+    Raises:
+        ValueError: If there is more than one output and any of them has a `.seq` (which cannot be
+            merged).
+    """
+    if len(outputs) == 1:
+        return outputs[0]
+
+    def merge(values: Sequence[Any]) -> Optional[_LazyList[Any]]:
+        if any(value is None for value in values):
+            return None
+        return _concatenate_lazily(values)
+
+    if any(output._is_lazy("seq") or output.seq is not None for output in outputs):
+        raise ValueError(
+            "The compiled circuits were split across multiple requests, so their pulse sequences "
+            "cannot be combined into a single .seq attribute."
+        )
+
+    merged_output = CompilerOutput(
+        circuits=_concatenate_lazily([output.circuits for output in outputs]),
+        pulse_sequences=merge([output.pulse_sequences for output in outputs]),
+        jaqal_programs=merge([output.jaqal_programs for output in outputs]),
+        pulse_lists=merge([output.pulse_lists for output in outputs]),
+    )
+    merged_output.pulse_summaries = merge([output.pulse_summaries for output in outputs])
+    return merged_output
@@ -1,4 +1,5 @@
 import importlib
+import pickle
 import textwrap
 from unittest import mock
 
@@ -24,6 +25,110 @@ def test_compiler_output_repr() -> None:
     )
 
 
+def test_lazy_list() -> None:
+    load = mock.MagicMock(return_value=[lambda: "a", mock.MagicMock(return_value="b")])
+    lazy_list = css.compiler_output._LazyList(load)
+    assert repr(lazy_list) == "<lazy list (0 of ? items loaded)>"
+    load.assert_not_called()
+
+    assert lazy_list[1] == "b"
+    assert lazy_list[-1] == "b"
+    assert repr(lazy_list) == "<lazy list (1 of 2 items loaded)>"
+    load.assert_called_once()
+    load.return_value[1].assert_called_once()
+
+    with pytest.raises(IndexError, match="out of range"):
+        _ = lazy_list[2]
+    with pytest.raises(IndexError, match="out of range"):
+        _ = lazy_list[-3]
+
+    assert lazy_list[::-1] == ["b", "a"]
+    assert len(lazy_list) == 2
+    assert repr(lazy_list) == "['a', 'b']"
+    assert list(lazy_list) == ["a", "b"]
+    assert lazy_list == ["a", "b"]
+    assert lazy_list != ["a"]
+    assert lazy_list != ("a", "b")
+    assert lazy_list == css.compiler_output._LazyList(lambda: [lambda: "a", lambda: "b"])
+    load.assert_called_once()
+
+    # The item functions (and anything they reference) are released once every item is loaded
+    assert lazy_list._load is None and lazy_list._getters is None
+
+    empty_list: css.compiler_output._LazyList[str] = css.compiler_output._LazyList(list)
+    assert empty_list == [] and repr(empty_list) == "[]"
+
+
+def test_lazy_list_is_list_like() -> None:
+    lazy_list = css.compiler_output._LazyList(lambda: [lambda: 1, lambda: 2])
+    assert lazy_list + [3] == [1, 2, 3]
+    assert [0] + lazy_list == [0, 1, 2]
+    assert lazy_list + lazy_list == [1, 2, 1, 2]
+    with pytest.raises(TypeError):
+        _ = lazy_list + (3,)
+    with pytest.raises(TypeError):
+        _ = (0,) + lazy_list
+
+    lazy_list.append(3)
+    assert lazy_list == [1, 2, 3]
+    lazy_list[0] = 0
+    del lazy_list[1]
+    lazy_list.insert(0, -1)
+    lazy_list += [4]
+    assert lazy_list == [-1, 0, 3, 4]
+
+    lazy_list = css.compiler_output._LazyList(lambda: [lambda: 1, lambda: 2])
+    unpickled_list = pickle.loads(pickle.dumps(lazy_list))
+    assert type(unpickled_list) is list
+    assert unpickled_list == [1, 2]
+
+
+def test_read_json_lazily() -> None:
+    qubits = cirq.LineQubit.range(2)
+    circuits = [cirq.Circuit(cirq.X(qubits[0])), cirq.Circuit(cirq.CZ(*qubits))]
+    json_dict = {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits),
+        "jaqal_programs": ["x", "cz"],
+    }
+
+    out = css.compiler_output.read_json_qscout(json_dict, circuits_is_list=True)
+    assert out.has_multiple_circuits()
+    assert repr(out) == (
+        "CompilerOutput(<lazy list (0 of ? items loaded)>, None, None, ['x', 'cz'], None)"
+    )
+
+    assert out.circuits[1] == circuits[1]
+    assert out.circuits[1] is out.circuits[1]
+    assert repr(out.circuits) == "<lazy list (1 of 2 items loaded)>"
+    assert out.circuits == circuits
+
+    # Separately serialized pulse sequences should be deserialized individually
+    with mock.patch("general_superstaq.converters.deserialize", return_value="y") as deserialize:
+        pulse_sequences = css.compiler_output._deserialize_list(["x", "y"], lazy=True)
+        assert pulse_sequences[1] == "y"
+        deserialize.assert_called_once_with("y")
+
+    pulse_sequences = css.compiler_output._deserialize_list(
+        gss.converters.serialize(["x", "y"]), lazy=True
+    )
+    assert pulse_sequences == ["x", "y"]
+    assert css.compiler_output._deserialize_list(
+        [gss.converters.serialize("x"), gss.converters.serialize("y")], lazy=False
+    ) == ["x", "y"]
+
+    # Lazy outputs should be picklable, with every circuit deserialized
+    out = css.compiler_output.read_json_qscout(json_dict, circuits_is_list=True)
+    unpickled_out = pickle.loads(pickle.dumps(out))
+    assert type(unpickled_out.circuits) is list
+    assert unpickled_out.circuits == circuits
+    assert unpickled_out.jaqal_programs == ["x", "cz"]
+
+    # Without laziness, the returned circuits shouldn't reference the serialized circuits
+    out = css.compiler_output.read_json_only_circuits(json_dict, True, lazy=False)
+    assert type(out.circuits) is list
+    assert out.circuits == circuits
+
+
 def test_read_json_ibmq() -> None:
     q0 = cirq.LineQubit(0)
     circuit = cirq.Circuit(cirq.H(q0), cirq.measure(q0))
@@ -61,6 +166,51 @@ def test_read_json_ibmq() -> None:
 
 
 @mock.patch.dict("sys.modules", {"qtrl": None})
+def test_read_json_ibmq_pulse_summaries() -> None:
+    circuits = [cirq.Circuit(cirq.X(cirq.LineQubit(0))), cirq.Circuit()]
+    summaries = [
+        css.PulseSummary(duration=10, start_time=0, num_instructions=1, channels=("d0",)),
+        css.PulseSummary(duration=0, start_time=0, num_instructions=0, channels=()),
+    ]
+    json_dict = {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits),
+        "pulses": ["x", "y"],
+    }
+
+    with mock.patch(
+        "cirq_superstaq.pulse_summary.summarize_pulse",
+        side_effect=lambda pulse: summaries["xy".index(pulse)],
+    ) as summarize_pulse, pytest.warns(UserWarning, match="requires Qiskit Terra"):
+        out = css.compiler_output.read_json_ibmq(json_dict, circuits_is_list=True)
+        assert out.pulse_sequences is None
+        summarize_pulse.assert_not_called()
+
+        expanded = css.compiler_output.expand_compiler_output(out, [1, 0])
+        merged = css.compiler_output.merge_compiler_outputs([out, expanded])
+        assert out.pulse_summaries is not None
+        assert out.pulse_summaries[1] == summaries[1]
+        summarize_pulse.assert_called_once_with("y")
+        assert merged.pulse_summaries == summaries + summaries[::-1]
+
+    json_dict["pulses"] = gss.converters.serialize(["x", "y"])
+    with mock.patch(
+        "cirq_superstaq.pulse_summary.summarize_pulses", return_value=summaries
+    ), pytest.warns(UserWarning, match="requires Qiskit Terra"):
+        out = css.compiler_output.read_json_ibmq(json_dict, True, lazy=False)
+        assert type(out.pulse_summaries) is list
+        assert out.pulse_summaries == summaries
+
+        out = css.compiler_output.read_json_ibmq(json_dict, False)
+        assert out.pulse_summary == summaries[0]
+
+        out = css.compiler_output.read_json_ibmq(json_dict, False, lazy=False)
+        assert out.__dict__["pulse_summary"] == summaries[0]
+
+    out = css.compiler_output.CompilerOutput(circuits)
+    assert out.pulse_summaries is None
+    assert css.compiler_output.CompilerOutput(circuits[0]).pulse_summary is None
+
+
 def test_read_json_aqt() -> None:
     importlib.reload(css.compiler_output)
 
@@ -96,6 +246,71 @@ def test_read_json_aqt() -> None:
     assert not hasattr(out, "circuit")
 
 
+def test_read_json_aqt_lazily() -> None:
+    circuit = cirq.Circuit(cirq.H(cirq.LineQubit(4)))
+    json_dict = {
+        "cirq_circuits": css.serialization.serialize_circuits([circuit, circuit]),
+        "state_jp": gss.converters.serialize({"a": 1}),
+        "pulse_lists_jp": gss.converters.serialize([[["x"]], [["y"]]]),
+    }
+
+    class Sequence:
+        def __init__(self, n_elements: int) -> None:
+            self.compile = mock.MagicMock()
+            self.__setstate__ = mock.MagicMock()
+
+    seq = Sequence(n_elements=1)
+
+    with mock.patch("importlib.util.find_spec", return_value=True), mock.patch(
+        "cirq_superstaq.compiler_output.qtrl", create=True
+    ) as mock_qtrl:
+        mock_qtrl.sequencer.Sequence.return_value = seq
+        out = css.compiler_output.read_json_aqt(json_dict, circuits_is_list=True)
+        assert repr(out) == (
+            "CompilerOutput(<lazy list (0 of ? items loaded)>, None, <not yet loaded>, None, "
+            "<lazy list (0 of ? items loaded)>)"
+        )
+
+        # The pulse sequence should only be compiled once it is needed
+        expanded = css.compiler_output.expand_compiler_output(out, [1, 0, 1])
+        with pytest.raises(ValueError, match="cannot be combined"):
+            _ = css.compiler_output.merge_compiler_outputs([out, out])
+        seq.compile.assert_not_called()
+
+        assert expanded.seq is seq
+        assert out.seq is seq
+        seq.__setstate__.assert_called_once_with({"a": 1})
+        seq.compile.assert_called_once_with()
+
+        assert out.pulse_lists == [[["x"]], [["y"]]]
+        assert expanded.pulse_lists == [[["y"]], [["x"]], [["y"]]]
+
+        out = css.compiler_output.read_json_aqt(json_dict, circuits_is_list=False)
+        assert repr(out) == (
+            f"CompilerOutput({circuit!r}, None, <not yet loaded>, None, <not yet loaded>)"
+        )
+        assert out.pulse_list == [["x"]]
+        assert out.seq is seq
+
+        # Pickling should load every lazy attribute
+        out = css.compiler_output.read_json_aqt(json_dict, circuits_is_list=False)
+        assert out.__getstate__()["pulse_list"] == [["x"]]
+        assert out.__getstate__()["seq"] is seq
+
+        out = css.compiler_output.read_json_aqt(json_dict, False, lazy=False)
+        assert out.pulse_list == [["x"]]
+        assert out.__dict__["seq"] is seq
+
+        out = css.compiler_output.read_json_aqt(json_dict, False, include_pulses=False)
+        assert out.seq is None
+        assert out.pulse_list is None
+
+        out = css.compiler_output.read_json_aqt(json_dict, True, include_pulses=False)
+        assert out.seq is None
+        assert out.pulse_lists is None
+        assert css.compiler_output.expand_compiler_output(out, [0]).seq is None
+
+
 def test_read_json_qscout() -> None:
     q0 = cirq.LineQubit(0)
     circuit = cirq.Circuit(cirq.H(q0), cirq.measure(q0))
@@ -146,3 +361,56 @@ def test_read_json_only_circuits() -> None:
     }
     out = css.compiler_output.read_json_only_circuits(json_dict, circuits_is_list=True)
     assert out.circuits == [circuit, circuit]
+
+
+def test_expand_compiler_output() -> None:
+    q0 = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.Y(q0))]
+    output = css.compiler_output.CompilerOutput(
+        circuits, seq=mock.DEFAULT, jaqal_programs=["x", "y"], pulse_lists=[[["x"]], [["y"]]]
+    )
+
+    expanded = css.compiler_output.expand_compiler_output(output, [0, 1, 0, 0])
+    assert expanded.circuits == [circuits[0], circuits[1], circuits[0], circuits[0]]
+    assert expanded.jaqal_programs == ["x", "y", "x", "x"]
+    assert expanded.pulse_lists == [[["x"]], [["y"]], [["x"]], [["x"]]]
+    assert expanded.pulse_sequences is None
+    assert expanded.seq is mock.DEFAULT
+
+    # Each duplicated circuit should be a separate copy
+    assert expanded.circuits[0] is circuits[0]
+    assert expanded.circuits[2] is not circuits[0]
+    assert expanded.circuits[3] is not expanded.circuits[2]
+
+
+def test_merge_compiler_outputs() -> None:
+    q0 = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.Y(q0)), cirq.Circuit(cirq.Z(q0))]
+    outputs = [
+        css.compiler_output.CompilerOutput(circuits[:2], jaqal_programs=["x", "y"]),
+        css.compiler_output.CompilerOutput(circuits[2:], jaqal_programs=["z"]),
+    ]
+    assert css.compiler_output.merge_compiler_outputs(outputs[:1]) is outputs[0]
+
+    merged = css.compiler_output.merge_compiler_outputs(outputs)
+    assert merged.circuits == circuits
+    assert merged.jaqal_programs == ["x", "y", "z"]
+    assert merged.pulse_lists is None
+    assert merged.pulse_sequences is None
+    assert merged.seq is None
+
+    outputs = [
+        css.compiler_output.CompilerOutput(circuits[:1], seq=mock.DEFAULT, pulse_lists=[[["x"]]]),
+        css.compiler_output.CompilerOutput(
+            circuits[1:], seq=mock.DEFAULT, pulse_lists=[[["y"]], [["z"]]]
+        ),
+    ]
+    with pytest.raises(ValueError, match="cannot be combined into a single .seq"):
+        _ = css.compiler_output.merge_compiler_outputs(outputs)
+
+    for output in outputs:
+        output.seq = None
+    merged = css.compiler_output.merge_compiler_outputs(outputs)
+    assert merged.circuits == circuits
+    assert merged.pulse_lists == [[["x"]], [["y"]], [["z"]]]
+    assert merged.seq is None
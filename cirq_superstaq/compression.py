@@ -0,0 +1,141 @@
+# Copyright 2021 The Cirq Developers
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compression of the payloads of requests to (and responses from) the SuperstaQ API."""
+
+import gzip
+import json
+from typing import Any, Dict, Optional
+
+import general_superstaq as gss
+import requests
+from general_superstaq import superstaq_client
+
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
+
+SUPPORTED_ENCODINGS = ("gzip", "zstd")
+
+# Smaller request bodies are sent uncompressed
+DEFAULT_COMPRESSION_THRESHOLD = 16 * 1024
+
+
+def _check_encoding(encoding: str) -> None:
+    if encoding not in SUPPORTED_ENCODINGS:
+        raise ValueError(
+            f"Unsupported encoding: {encoding!r} (must be one of {SUPPORTED_ENCODINGS})."
+        )
+    if encoding == "zstd" and zstandard is None:
+        raise gss.SuperstaQModuleNotFoundException(name="zstandard", context="zstd compression")
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compresses data with the given content encoding.
+
+    Args:
+        data: The data to compress.
+        encoding: Either "gzip", or "zstd" (which requires the `zstandard` package).
+
+    Returns:
+        The compressed data.
+
+    Raises:
+        ValueError: If `encoding` is not supported.
+        SuperstaQModuleNotFoundException: If `encoding` is "zstd", but `zstandard` is not
+            installed.
+    """
+    _check_encoding(encoding)
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """Decompresses data compressed with the given content encoding (see `compress`).
+
+    Args:
+        data: The compressed data.
+        encoding: Either "gzip", or "zstd" (which requires the `zstandard` package).
+
+    Returns:
+        The decompressed data.
+
+    Raises:
+        ValueError: If `encoding` is not supported.
+        SuperstaQModuleNotFoundException: If `encoding` is "zstd", but `zstandard` is not
+            installed.
+    """
+    _check_encoding(encoding)
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+class _CompressingSuperstaQClient(superstaq_client._SuperstaQClient):
+    """A SuperstaQ client which compresses the bodies of large POST requests.
+
+    Request bodies of at least `compression_threshold` bytes are compressed and sent with a
+    `Content-Encoding` header. Responses are decompressed transparently by `requests`, according
+    to their `Content-Encoding` (zstd responses are only requested if the requests themselves are
+    compressed with zstd).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        compression: Optional[str] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        **kwargs: Any,
+    ) -> None:
+        """Creates the client.
+
+        Args:
+            args: Positional arguments for `general_superstaq.superstaq_client._SuperstaQClient`.
+            compression: The encoding with which to compress requests ("gzip" or "zstd"), or None
+                to send them uncompressed.
+            compression_threshold: The minimum size (in bytes) of the request bodies to compress.
+            kwargs: Keyword arguments for `general_superstaq.superstaq_client._SuperstaQClient`.
+
+        Raises:
+            ValueError: If `compression` is not supported.
+            SuperstaQModuleNotFoundException: If `compression` is "zstd", but `zstandard` is not
+                installed.
+        """
+        super().__init__(*args, **kwargs)
+        if compression is not None:
+            _check_encoding(compression)
+        if compression == "zstd":
+            self.headers["Accept-Encoding"] = "zstd, gzip, deflate"
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+
+    def post_request(self, endpoint: str, json_dict: Dict[str, Any]) -> dict:
+        if self.compression is None:
+            return super().post_request(endpoint, json_dict)
+
+        body = json.dumps(json_dict, allow_nan=False).encode()
+        headers = self.headers
+        if len(body) >= self.compression_threshold:
+            body = compress(body, self.compression)
+            headers = {**self.headers, "Content-Encoding": self.compression}
+
+        def request() -> requests.Response:
+            return requests.post(
+                f"{self.url}{endpoint}",
+                data=body,
+                headers=headers,
+                verify=self.verify_https,
+            )
+
+        return self._make_request(request).json()
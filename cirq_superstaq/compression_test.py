@@ -0,0 +1,109 @@
+import gzip
+import http.server
+import json
+import threading
+import zlib
+from typing import Any, Dict, Iterator, List
+from unittest import mock
+
+import cirq
+import general_superstaq as gss
+import pytest
+
+import cirq_superstaq as css
+
+
+class _StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Decompresses requests and echoes their circuits back, gzipped if the client accepts it."""
+
+    requests: List[Dict[str, Any]] = []
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        encoding = self.headers.get("Content-Encoding")
+        json_dict = json.loads(css.compression.decompress(body, encoding) if encoding else body)
+        self.requests.append({"encoding": encoding, "num_bytes": len(body), "json": json_dict})
+
+        response = json.dumps({"cirq_circuits": json_dict["cirq_circuits"]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            response = gzip.compress(response)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def stand_in_server() -> Iterator[str]:
+    _StandInHandler.requests = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_compress() -> None:
+    data = b"cirq_type" * 1000
+    compressed_data = css.compression.compress(data, "gzip")
+    assert len(compressed_data) < len(data) / 10
+    assert css.compression.decompress(compressed_data, "gzip") == data
+
+    with pytest.raises(ValueError, match="Unsupported encoding"):
+        _ = css.compression.compress(data, "brotli")
+
+
+def test_compress_zstd() -> None:
+    mock_zstandard = mock.MagicMock()
+    mock_zstandard.ZstdCompressor.return_value.compress.side_effect = zlib.compress
+    mock_zstandard.ZstdDecompressor.return_value.decompress.side_effect = zlib.decompress
+
+    data = b"cirq_type" * 1000
+    with mock.patch("cirq_superstaq.compression.zstandard", mock_zstandard):
+        compressed_data = css.compression.compress(data, "zstd")
+        assert css.compression.decompress(compressed_data, "zstd") == data
+
+        client = css.compression._CompressingSuperstaQClient(
+            remote_host="http://example.com", api_key="key", client_name="test", compression="zstd"
+        )
+        assert client.headers["Accept-Encoding"] == "zstd, gzip, deflate"
+
+    with mock.patch("cirq_superstaq.compression.zstandard", None), pytest.raises(
+        gss.SuperstaQModuleNotFoundException, match="zstandard"
+    ):
+        _ = css.Service(api_key="key", remote_host="http://example.com", compression="zstd")
+
+
+def test_service_compression(stand_in_server: str) -> None:
+    service = css.Service(
+        api_key="key",
+        remote_host=stand_in_server,
+        compression="gzip",
+        compression_threshold=1000,
+        max_retry_seconds=0,
+    )
+    q0 = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.X(q0) ** (i / 100)) for i in range(100)]
+
+    assert service.cq_compile(circuits).circuits == circuits
+    (request,) = _StandInHandler.requests
+    assert request["encoding"] == "gzip"
+    assert request["json"]["cirq_circuits"] == css.serialization.serialize_circuits(circuits)
+    assert request["num_bytes"] < len(json.dumps(request["json"])) / 5
+
+    # Small requests should be sent uncompressed
+    assert service.cq_compile(circuits[0]).circuit == circuits[0]
+    assert _StandInHandler.requests[-1]["encoding"] is None
+
+    service = css.Service(api_key="key", remote_host=stand_in_server, max_retry_seconds=0)
+    assert service.cq_compile(circuits).circuits == circuits
+    assert _StandInHandler.requests[-1]["encoding"] is None
+
+    with pytest.raises(ValueError, match="Unsupported encoding"):
+        _ = css.Service(api_key="key", remote_host=stand_in_server, compression="brotli")
@@ -564,24 +564,18 @@ ICCX = IX.controlled(2, [1, 1])
 AQTICCX = AQTITOFFOLI = IX.controlled(2, [0, 0])
 
 
+_CUSTOM_GATE_TYPES: Dict[str, Callable[..., cirq.Gate]] = {
+    "ZZSwapGate": ZZSwapGate,
+    "Barrier": Barrier,
+    "ZXPowGate": ZXPowGate,
+    "AceCR": AceCR,
+    "ParallelGates": ParallelGates,
+    "MSGate": cirq.ops.MSGate,
+    "RGate": RGate,
+    "IXGate": IXGate,
+    "ParallelRGate": ParallelRGate,
+}
+
+
 def custom_resolver(cirq_type: str) -> Union[Callable[..., cirq.Gate], None]:
-    if cirq_type == "ZZSwapGate":
-        return ZZSwapGate
-    if cirq_type == "Barrier":
-        return Barrier
-    if cirq_type == "ZXPowGate":
-        return ZXPowGate
-    if cirq_type == "AceCR":
-        return AceCR
-    if cirq_type == "ParallelGates":
-        return ParallelGates
-    if cirq_type == "MSGate":
-        return cirq.ops.MSGate
-    if cirq_type == "RGate":
-        return RGate
-    if cirq_type == "IXGate":
-        return IXGate
-    if cirq_type == "ParallelRGate":
-        return ParallelRGate
-
-    return None
+    return _CUSTOM_GATE_TYPES.get(cirq_type)
@@ -0,0 +1,181 @@
+# Copyright 2021 The Cirq Developers
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Stable structural hashes of circuits, for caching and deduplication."""
+
+import hashlib
+import numbers
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import cirq
+import numpy as np
+import sympy
+
+DEFAULT_DECIMALS = 8
+
+TCircuit = TypeVar("TCircuit", bound=cirq.AbstractCircuit)
+
+
+def _canonical_number(value: float, decimals: int) -> str:
+    rounded = round(float(value), decimals)
+    return repr(rounded + 0.0)  # adding 0.0 turns -0.0 into 0.0
+
+
+def _canonical_scalar(value: Any, decimals: int) -> Optional[str]:
+    """Returns a canonical string representation of a scalar parameter, or None if not a scalar."""
+    if value is None or isinstance(value, (bool, str, numbers.Integral)):
+        return repr(value)
+    if isinstance(value, numbers.Real):
+        return _canonical_number(float(value), decimals)
+    if isinstance(value, numbers.Complex):
+        real = _canonical_number(float(value.real), decimals)
+        imag = _canonical_number(float(value.imag), decimals)
+        return f"({real}+{imag}j)"
+    if isinstance(value, cirq.PeriodicValue):
+        if cirq.is_parameterized(value.value):
+            return f"({value.value})%{_canonical_value(value.period, decimals)}"
+        reduced = round(float(value.value) % float(value.period), decimals)
+        if reduced == round(float(value.period), decimals):
+            reduced = 0.0
+        return _canonical_number(reduced, decimals)
+    if isinstance(value, sympy.Basic):
+        return str(value)
+    return None
+
+
+def _canonical_value(value: Any, decimals: int) -> str:
+    """Returns a canonical string representation of a gate parameter.
+
+    Floats are rounded to `decimals` decimal places, and periodic values are reduced modulo their
+    period, so that parameters which only differ by floating-point noise (or whole periods) have
+    the same representation.
+    """
+    scalar = _canonical_scalar(value, decimals)
+    if scalar is not None:
+        return scalar
+    if isinstance(value, cirq.Gate):
+        return _gate_token(value, decimals)
+    if isinstance(value, np.ndarray):
+        return _canonical_value(value.tolist(), decimals)
+    if isinstance(value, (tuple, list)):
+        return "(" + ",".join(_canonical_value(val, decimals) for val in value) + ")"
+    if isinstance(value, (frozenset, set)):
+        return "{" + ",".join(sorted(_canonical_value(val, decimals) for val in value)) + "}"
+    return repr(value)
+
+
+def _gate_token(gate: cirq.Gate, decimals: int) -> str:
+    """Returns a canonical string representation of a gate, consistent with its value equality.
+
+    Gates defined with `cirq.value_equality` are represented by their value equality class and
+    (approximate) values, so e.g. `css.ZZSwapGate(theta)` and `css.ZZSwapGate(theta + 2 * np.pi)`
+    have the same representation. Other gates are represented by their unitary (if they have one)
+    or their repr.
+    """
+    if hasattr(gate, "_value_equality_values_"):
+        gate_cls = getattr(gate, "_value_equality_values_cls_")()
+        if hasattr(gate, "_value_equality_approximate_values_"):
+            values = gate._value_equality_approximate_values_()
+        else:
+            values = gate._value_equality_values_()
+    elif cirq.has_unitary(gate):
+        gate_cls, values = type(gate), cirq.unitary(gate)
+    else:
+        return repr(gate)
+
+    return f"{gate_cls.__module__}.{gate_cls.__qualname__}{_canonical_value(values, decimals)}"
+
+
+def _qubits_token(gate: cirq.Gate, qubits: List[cirq.Qid]) -> str:
+    """Returns a canonical string representation of the qubits an operation acts on.
+
+    If `gate` has interchangeable qubits, the qubits in each equivalence group are sorted.
+    """
+    if not isinstance(gate, cirq.InterchangeableQubitsGate):
+        return repr(qubits)
+
+    groups: Dict[int, List[cirq.Qid]] = {}
+    for i, qubit in enumerate(qubits):
+        groups.setdefault(gate.qubit_index_to_equivalence_group_key(i), []).append(qubit)
+    return repr([sorted(group) for _, group in sorted(groups.items())])
+
+
+def circuit_fingerprint(circuit: cirq.AbstractCircuit, decimals: int = DEFAULT_DECIMALS) -> str:
+    """Computes a stable structural hash of a circuit.
+
+    This walks the circuit once, hashing the moment structure, and the gate, parameters, and
+    qubits of each operation (measurement keys are included in the parameters of measurement
+    gates). Unlike hashing `css.serialization.serialize_circuits`, this does not depend on JSON
+    formatting, and follows the same notion of equality as `cirq`:
+
+    * The order of operations within each moment does not matter.
+    * Qubits of gates with interchangeable qubits (e.g. `css.ZZSwapGate`) may be permuted.
+    * Gate parameters are compared using their approximate value equality values (see
+      `cirq.value_equality`), with floats rounded to `decimals` decimal places and periodic
+      values (e.g. `css.AceCR` sandwich angles) reduced modulo their period.
+
+    Note that because of rounding, approximately equal circuits whose parameters straddle a
+    rounding boundary can still have different fingerprints.
+
+    Args:
+        circuit: The circuit to fingerprint.
+        decimals: The number of decimal places to which floating-point parameters are rounded.
+
+    Returns:
+        The hex SHA-256 digest of the canonicalized circuit.
+    """
+    digest = hashlib.sha256()
+    gate_tokens: Dict[int, str] = {}
+
+    for moment in circuit:
+        op_tokens = []
+        for op in moment:
+            gate = op.gate
+            if gate is None:
+                op_tokens.append(repr(op))
+                continue
+
+            # Gates (e.g. `cirq.X`) are often shared between many operations
+            if id(gate) not in gate_tokens:
+                gate_tokens[id(gate)] = _gate_token(gate, decimals)
+            tags = repr(op.tags) if op.tags else ""
+            op_tokens.append(gate_tokens[id(gate)] + _qubits_token(gate, list(op.qubits)) + tags)
+
+        digest.update(("|".join(sorted(op_tokens)) + "\n").encode())
+    return digest.hexdigest()
+
+
+def deduplicate_circuits(
+    circuits: Sequence[TCircuit], decimals: int = DEFAULT_DECIMALS
+) -> Tuple[List[TCircuit], List[int]]:
+    """Finds the unique circuits in a sequence of circuits (see `circuit_fingerprint`).
+
+    Args:
+        circuits: The circuits to deduplicate.
+        decimals: The number of decimal places to which floating-point parameters are rounded when
+            comparing circuits.
+
+    Returns:
+        A tuple `(unique_circuits, indices)`, where `unique_circuits` contains the first occurrence
+        of each distinct circuit (in order), and `circuits[i]` is equivalent to
+        `unique_circuits[indices[i]]`.
+    """
+    unique_circuits: List[TCircuit] = []
+    unique_indices: Dict[str, int] = {}
+    indices = []
+    for circuit in circuits:
+        fingerprint = circuit_fingerprint(circuit, decimals)
+        if fingerprint not in unique_indices:
+            unique_indices[fingerprint] = len(unique_circuits)
+            unique_circuits.append(circuit)
+        indices.append(unique_indices[fingerprint])
+    return unique_circuits, indices
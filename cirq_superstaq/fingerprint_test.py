@@ -0,0 +1,169 @@
+from typing import Dict, Tuple
+
+import cirq
+import numpy as np
+import sympy
+
+import cirq_superstaq as css
+
+
+def test_circuit_fingerprint() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.Moment(css.ZZSwapGate(0.3).on(q0, q1), cirq.X(q2)),
+        cirq.Moment(css.AceCR("+-", np.pi / 2).on(q1, q2)),
+        cirq.Moment(css.RGate(0.1, 0.2).on(q0)),
+        cirq.Moment(cirq.measure(q0, q1, key="a")),
+    )
+    fingerprint = css.circuit_fingerprint(circuit)
+    assert len(fingerprint) == 64
+    assert fingerprint == css.circuit_fingerprint(circuit.copy())
+
+    equivalent_circuits = [
+        # Reordered operations within a moment
+        cirq.Circuit(
+            cirq.Moment(cirq.X(q2), css.ZZSwapGate(0.3).on(q0, q1)),
+            *circuit[1:],
+        ),
+        # Interchangeable qubits
+        cirq.Circuit(cirq.Moment(css.ZZSwapGate(0.3).on(q1, q0), cirq.X(q2)), *circuit[1:]),
+        # Floating-point noise and full periods
+        cirq.Circuit(
+            cirq.Moment(css.ZZSwapGate(0.3 + 1e-12).on(q0, q1), cirq.X(q2) ** 3),
+            cirq.Moment(css.AceCR("+-", np.pi / 2 - 2 * np.pi + 1e-12).on(q1, q2)),
+            cirq.Moment(css.RGate(0.1 + 1e-13, 0.2).on(q0)),
+            circuit[3],
+        ),
+    ]
+    for other in equivalent_circuits:
+        assert cirq.approx_eq(other, circuit)
+        assert css.circuit_fingerprint(other) == fingerprint
+
+    # `css.RGate` is not equal to the equivalent `cirq.PhasedXPowGate`
+    phased_x_gate = cirq.PhasedXPowGate(
+        exponent=0.1 / np.pi, phase_exponent=0.2 / np.pi, global_shift=-0.5
+    )
+    different_circuits = [
+        circuit[:-1],
+        circuit + cirq.Moment(),
+        cirq.Circuit(circuit[:-1], cirq.measure(q0, q1, key="b")),
+        cirq.Circuit(circuit[:-1], cirq.measure(q1, q0, key="a")),
+        cirq.Circuit(circuit[:2], cirq.Moment(css.RGate(0.1, 0.3).on(q0)), circuit[3]),
+        cirq.Circuit(circuit[:1], css.AceCR("-+", np.pi / 2).on(q1, q2), circuit[2:]),
+        cirq.Circuit(circuit[:1], css.AceCR("+-", np.pi / 2).on(q2, q1), circuit[2:]),
+        cirq.Circuit(circuit[:2], cirq.Moment(phased_x_gate.on(q0)), circuit[3]),
+        cirq.Circuit(
+            circuit[:2], cirq.Moment(css.RGate(0.1, 0.2).on(q0).with_tags("tag")), circuit[3]
+        ),
+    ]
+    fingerprints = {fingerprint} | {css.circuit_fingerprint(other) for other in different_circuits}
+    assert len(fingerprints) == len(different_circuits) + 1
+
+    # Fewer decimals should ignore larger differences
+    noisy_moment = cirq.Moment(css.RGate(0.1 + 1e-5, 0.2).on(q0))
+    noisy_circuit = cirq.Circuit(circuit[:2], noisy_moment, circuit[3])
+    assert css.circuit_fingerprint(noisy_circuit) != fingerprint
+    assert css.circuit_fingerprint(noisy_circuit, decimals=3) == css.circuit_fingerprint(
+        circuit, decimals=3
+    )
+
+
+def test_circuit_fingerprint_gates() -> None:
+    q0, q1, q2, q3 = cirq.LineQubit.range(4)
+
+    def fingerprint(*operations: cirq.Operation) -> str:
+        return css.circuit_fingerprint(cirq.Circuit(*operations))
+
+    # Gates are identified by their value equality class
+    assert fingerprint(cirq.rx(np.pi).on(q0)) == fingerprint(
+        cirq.XPowGate(exponent=1, global_shift=-0.5).on(q0)
+    )
+    assert fingerprint(css.Barrier(2).on(q0, q1)) == fingerprint(css.Barrier(2).on(q1, q0))
+
+    # ...but (as in cirq) operations are only equal if their qubits are interchangeable in the same
+    # way, even if their gates are equal
+    assert css.Barrier(2) == cirq.IdentityGate(2)
+    assert fingerprint(css.Barrier(2).on(q0, q1)) != fingerprint(cirq.IdentityGate(2).on(q0, q1))
+    assert fingerprint(cirq.rx(np.pi).on(q0)) != fingerprint(cirq.X(q0))
+
+    # Parallel gates
+    parallel_gates = css.ParallelGates(cirq.X, css.ZZSwapGate(0.2))
+    assert fingerprint(parallel_gates.on(q0, q1, q2)) == fingerprint(parallel_gates.on(q0, q2, q1))
+    assert fingerprint(parallel_gates.on(q0, q1, q2)) != fingerprint(parallel_gates.on(q1, q0, q2))
+    assert fingerprint(css.ParallelRGate(0.1, 0.2, 2).on(q0, q1)) == fingerprint(
+        css.ParallelRGate(0.1, 0.2, 2).on(q1, q0)
+    )
+
+    # Symbolic parameters
+    theta = sympy.Symbol("theta")
+    assert fingerprint(css.ZZSwapGate(theta).on(q0, q1)) == fingerprint(
+        css.ZZSwapGate(theta).on(q1, q0)
+    )
+    assert fingerprint(cirq.X(q0) ** theta) != fingerprint(cirq.X(q0) ** sympy.Symbol("phi"))
+    assert fingerprint(
+        cirq.PhasedXZGate(x_exponent=theta, z_exponent=0, axis_phase_exponent=0).on(q0)
+    )
+
+    # Gates without value equality
+    assert fingerprint(cirq.MatrixGate(np.eye(2)).on(q0)) == fingerprint(
+        cirq.MatrixGate(np.eye(2) + 1e-12).on(q0)
+    )
+    assert fingerprint(cirq.MatrixGate(np.eye(2)).on(q0)) != fingerprint(
+        cirq.MatrixGate(np.diag([1, 1j])).on(q0)
+    )
+    assert fingerprint(cirq.MatrixGate(np.eye(2)).on(q0)) != fingerprint(cirq.I(q0))
+
+    class NoUnitaryGate(cirq.Gate):
+        def _num_qubits_(self) -> int:
+            return 1
+
+        def __repr__(self) -> str:
+            return "NoUnitaryGate()"
+
+    assert fingerprint(NoUnitaryGate().on(q0)) == fingerprint(NoUnitaryGate().on(q0))
+    assert fingerprint(NoUnitaryGate().on(q0)) != fingerprint(NoUnitaryGate().on(q1))
+
+    # Operations without gates
+    subcircuit = cirq.FrozenCircuit(cirq.X(q0), cirq.CZ(q0, q1))
+    assert fingerprint(cirq.CircuitOperation(subcircuit)) == fingerprint(
+        cirq.CircuitOperation(subcircuit)
+    )
+    assert fingerprint(cirq.CircuitOperation(subcircuit)) != fingerprint(
+        cirq.CircuitOperation(subcircuit, repetitions=2)
+    )
+
+    # Measurement gates (including their confusion maps)
+    assert fingerprint(cirq.measure(q0, q1, key="a", invert_mask=(True,))) != fingerprint(
+        cirq.measure(q0, q1, key="a")
+    )
+    confusion_map: Dict[Tuple[int, ...], np.ndarray] = {(0,): np.array([[0.9, 0.1], [0.1, 0.9]])}
+    measurement_gate = cirq.MeasurementGate(2, key="a", confusion_map=confusion_map)
+    assert fingerprint(measurement_gate.on(q0, q1)) != fingerprint(cirq.measure(q0, q1, key="a"))
+
+    # Complex and set-valued parameters
+    assert css.fingerprint._canonical_value(1 + 2j, 2) == "(1.0+2.0j)"
+    assert css.fingerprint._canonical_value(frozenset({2, 1}), 2) == "{1,2}"
+    assert css.fingerprint._canonical_value(cirq.PeriodicValue(theta, 2), 2) == "(Mod(theta, 2))%2"
+    assert css.fingerprint._canonical_value(cirq.PeriodicValue(2 - 1e-9, 2), 2) == "0.0"
+    assert css.fingerprint._canonical_value(q3, 2) == repr(q3)
+
+
+def test_deduplicate_circuits() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuits = [
+        cirq.Circuit(css.ZZSwapGate(0.1).on(q0, q1)),
+        cirq.Circuit(cirq.X(q0)),
+        cirq.Circuit(css.ZZSwapGate(0.1).on(q1, q0)),
+        cirq.Circuit(cirq.X(q0)),
+        cirq.Circuit(css.ZZSwapGate(0.1 + 1e-5).on(q0, q1)),
+    ]
+    unique_circuits, indices = css.fingerprint.deduplicate_circuits(circuits)
+    assert unique_circuits == [circuits[0], circuits[1], circuits[4]]
+    assert unique_circuits[0] is circuits[0]
+    assert indices == [0, 1, 0, 1, 2]
+
+    unique_circuits, indices = css.fingerprint.deduplicate_circuits(circuits, decimals=3)
+    assert unique_circuits == circuits[:2]
+    assert indices == [0, 1, 0, 1, 0]
+
+    assert css.fingerprint.deduplicate_circuits([]) == ([], [])
@@ -13,13 +13,67 @@
 # limitations under the License.
 """Represents a job created via the SuperstaQ API."""
 import collections
+import concurrent.futures
+import random
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional
 
 import general_superstaq as gss
 from cirq._doc import document
 from general_superstaq import superstaq_client
 
+import cirq_superstaq as css
+
+
+class PollingStrategy:
+    """Determines how long to wait between successive polls of the SuperstaQ API.
+
+    The first poll is made after `initial_seconds`, and each subsequent interval is `multiplier`
+    times longer than the last, up to a maximum of `max_seconds`. Each interval is randomly
+    perturbed by up to `jitter` (as a fraction of the interval), so that many jobs being polled at
+    once do not all hit the API at the same time.
+    """
+
+    def __init__(
+        self,
+        initial_seconds: float = 0.1,
+        max_seconds: float = 5.0,
+        multiplier: float = 1.5,
+        jitter: float = 0.1,
+    ) -> None:
+        """Constructs a PollingStrategy.
+
+        Args:
+            initial_seconds: The interval before the first poll.
+            max_seconds: The maximum interval between polls.
+            multiplier: The factor by which the interval grows after each poll.
+            jitter: The maximum random perturbation of each interval, as a fraction of it.
+        """
+        self.initial_seconds = initial_seconds
+        self.max_seconds = max_seconds
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    @classmethod
+    def fixed(cls, polling_seconds: float) -> "PollingStrategy":
+        """Returns a strategy which always waits exactly `polling_seconds` between polls."""
+        return cls(polling_seconds, polling_seconds, multiplier=1.0, jitter=0.0)
+
+    def intervals(self) -> Iterator[float]:
+        """Yields the successive intervals to wait between polls."""
+        interval = self.initial_seconds
+        while True:
+            jitter = random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+            yield min(interval * (1 + jitter), self.max_seconds)
+            interval = min(interval * self.multiplier, self.max_seconds)
+
+    def __repr__(self) -> str:
+        return (
+            f"css.PollingStrategy(initial_seconds={self.initial_seconds!r}, "
+            f"max_seconds={self.max_seconds!r}, multiplier={self.multiplier!r}, "
+            f"jitter={self.jitter!r})"
+        )
+
 
 class Job:
     """A job created on the SuperstaQ API.
@@ -54,7 +108,13 @@ class Job:
         "data associated with it beyond an id and a status.",
     )
 
-    def __init__(self, client: superstaq_client._SuperstaQClient, job_id: str) -> None:
+    def __init__(
+        self,
+        client: superstaq_client._SuperstaQClient,
+        job_id: str,
+        poller: Optional["css.JobPoller"] = None,
+        store: Optional["css.JobStore"] = None,
+    ) -> None:
         """Construct a Job.
 
         Users should not call this themselves. If you only know the `job_id`, use `get_job`
@@ -63,14 +123,26 @@ class Job:
         Args:
             client: The client used for calling the API.
             job_id: unique identifier for the job.
+            poller: The `css.JobPoller` used to drive futures returned by `result_future`. If None,
+                a new poller is created on the first call to `result_future`.
+            store: If provided, the `css.JobStore` in which to save this job once it reaches a
+                terminal state.
         """
         self._client = client
         self._job: Dict[str, Any] = {"job_id": job_id, "status": "Submitted"}
+        self._poller = poller
+        self._store = store
+
+    def _update(self, job_dict: Dict[str, Any]) -> None:
+        """Replaces the last fetched job, saving it to the job store if it is terminal."""
+        self._job = job_dict
+        if self._store is not None:
+            self._store.put(job_dict)
 
     def _refresh_job(self) -> None:
         """If the last fetched job is not terminal, gets the job from the API."""
         if self._job["status"] not in self.TERMINAL_STATES:
-            self._job = self._client.get_job(self.job_id())
+            self._update(self._client.get_job(self.job_id()))
 
     def _check_if_unsuccessful(self) -> None:
         if self.status() in self.UNSUCCESSFUL_STATES:
@@ -136,13 +208,24 @@ class Job:
         return self._job["shots"]
 
     def counts(
-        self, timeout_seconds: int = 7200, polling_seconds: float = 1.0
+        self,
+        timeout_seconds: float = 7200,
+        polling_seconds: Optional[float] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
     ) -> collections.Counter:
         """Polls the SuperstaQ API for results.
 
+        Elapsed time is measured with `time.monotonic`, so time spent waiting on requests counts
+        towards `timeout_seconds`. If the API returns a `retry_after` hint along with a
+        non-terminal job, it is used in place of the next polling interval.
+
         Args:
             timeout_seconds: The total number of seconds to poll for.
-            polling_seconds: The interval with which to poll.
+            polling_seconds: If provided, a fixed interval with which to poll (overriding
+                `polling_strategy`).
+            polling_strategy: The `css.PollingStrategy` determining the intervals with which to
+                poll. Defaults to `css.PollingStrategy()`, which starts polling quickly and then
+                backs off exponentially.
 
         Returns:
             collections.Counter that represents the results of the measurements
@@ -151,13 +234,21 @@ class Job:
             SuperstaQUnsuccessfulJob: If the job has failed, been canceled, or deleted.
             SuperstaQException: If unable to get the results from the API.
         """
-        time_waited_seconds: float = 0.0
-        while time_waited_seconds < timeout_seconds:
-            # Status does a refresh.
-            if self.status() in self.TERMINAL_STATES:
+        if polling_seconds is not None:
+            polling_strategy = PollingStrategy.fixed(polling_seconds)
+        intervals = (polling_strategy or PollingStrategy()).intervals()
+
+        deadline = time.monotonic() + timeout_seconds
+        # Status does a refresh.
+        while self.status() not in self.TERMINAL_STATES:
+            remaining_seconds = deadline - time.monotonic()
+            if remaining_seconds <= 0:
                 break
-            time.sleep(polling_seconds)
-            time_waited_seconds += polling_seconds
+            interval = next(intervals)
+            if self._job.get("retry_after") is not None:
+                interval = float(self._job["retry_after"])
+            time.sleep(min(interval, remaining_seconds))
+
         if self.status() != "Done":
             if "failure" in self._job and "error" in self._job["failure"]:
                 error = self._job["failure"]["error"]
@@ -167,6 +258,20 @@ class Job:
             )
         return self._job["samples"]
 
+    def result_future(self) -> "concurrent.futures.Future[collections.Counter]":
+        """Returns a future which resolves to the results of this job once it has completed.
+
+        Futures for all of the jobs created by a `css.Service` are driven by a single background
+        polling thread (see `css.JobPoller`), which checks the statuses of all of them at once.
+
+        Returns:
+            A `concurrent.futures.Future` resolving to the value that would be returned by
+            `counts()`, or to the exception it would raise.
+        """
+        if self._poller is None:
+            self._poller = css.JobPoller()
+        return self._poller.submit(self)
+
     def __str__(self) -> str:
         return f"Job with job_id={self.job_id()}"
 
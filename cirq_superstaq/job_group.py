@@ -0,0 +1,353 @@
+# Copyright 2021 The Cirq Developers
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tools for tracking many jobs created via the SuperstaQ API at once."""
+
+import collections
+import concurrent.futures
+import threading
+import time
+import weakref
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import general_superstaq as gss
+
+import cirq_superstaq as css
+
+# Errors accessing the API which `JobPoller` retries in its next polling round
+_TRANSIENT_ERRORS = (TimeoutError, ConnectionError)
+
+# Clients whose API does not provide the `/get_jobs` endpoint, so jobs are fetched one at a time
+_UNBATCHED_CLIENTS: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+class JobGroup:
+    """A collection of `css.Job`s whose statuses are refreshed together.
+
+    Rather than each job querying the SuperstaQ API separately, `refresh` fetches all of the jobs
+    which are not yet in a terminal state with a single request (per client) to the `/get_jobs`
+    endpoint, and updates each `css.Job` in place. If the API does not provide that endpoint, each
+    job is fetched separately instead (and the endpoint is not tried again for that client).
+    """
+
+    def __init__(self, jobs: Iterable[css.Job], batched: bool = True) -> None:
+        """Constructs a JobGroup.
+
+        Args:
+            jobs: The jobs to track.
+            batched: Whether to try fetching the jobs with a single request (per client). If
+                False, each job is fetched separately (via `get_job`).
+        """
+        self._jobs = list(jobs)
+        self.batched = batched
+
+    def pending_jobs(self) -> List[css.Job]:
+        """Returns the jobs in this group whose last fetched status was not terminal."""
+        return [job for job in self._jobs if job._job["status"] not in css.Job.TERMINAL_STATES]
+
+    def refresh(self) -> None:
+        """Fetches the latest state of every non-terminal job in this group from the API.
+
+        Raises:
+            SuperstaQNotFoundException: If the API did not return one of the jobs.
+            SuperstaQException: If there was an error accessing the API.
+        """
+        missing_jobs = self._refresh()
+        if missing_jobs:
+            raise gss.SuperstaQNotFoundException(f"Job {missing_jobs[0].job_id()} was not found.")
+
+    def _refresh(self) -> List[css.Job]:
+        """Updates every non-terminal job in this group which is returned by the API.
+
+        Returns:
+            The jobs which the API did not return (which are left unchanged).
+        """
+        jobs_by_client: Dict[int, List[css.Job]] = {}
+        for job in self.pending_jobs():
+            jobs_by_client.setdefault(id(job._client), []).append(job)
+
+        missing_jobs = []
+        for jobs in jobs_by_client.values():
+            job_ids = list(dict.fromkeys(job.job_id() for job in jobs))
+            job_dicts = self._get_jobs(jobs[0]._client, job_ids)
+
+            for job in jobs:
+                if job.job_id() in job_dicts:
+                    job._update(job_dicts[job.job_id()])
+                else:
+                    missing_jobs.append(job)
+        return missing_jobs
+
+    def _get_jobs(self, client: Any, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetches the given jobs, omitting any which were not found."""
+        if self.batched and client not in _UNBATCHED_CLIENTS:
+            try:
+                return client.post_request("/get_jobs", {"job_ids": job_ids})
+            except gss.SuperstaQNotFoundException:
+                # The endpoint itself is missing, so fall back to fetching each job
+                _UNBATCHED_CLIENTS.add(client)
+
+        job_dicts = {}
+        for job_id in job_ids:
+            try:
+                job_dicts[job_id] = client.get_job(job_id)
+            except gss.SuperstaQNotFoundException:
+                pass
+        return job_dicts
+
+    def statuses(self) -> List[str]:
+        """Refreshes all non-terminal jobs in this group, and returns the status of every job.
+
+        Returns:
+            A list containing the status of each job in this group (in order).
+        """
+        self.refresh()
+        return [job._job["status"] for job in self._jobs]
+
+    def done(self) -> bool:
+        """Returns True if the last fetched status of every job in this group is terminal."""
+        return not self.pending_jobs()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __iter__(self) -> Iterator[css.Job]:
+        return iter(self._jobs)
+
+    def __getitem__(self, index: int) -> css.Job:
+        return self._jobs[index]
+
+    def __repr__(self) -> str:
+        return f"css.JobGroup({self._jobs!r}, batched={self.batched!r})"
+
+
+def as_completed(
+    jobs: Iterable[css.Job],
+    timeout: Optional[float] = None,
+    polling_strategy: Optional[css.PollingStrategy] = None,
+    batched: bool = True,
+) -> Iterator[css.Job]:
+    """Yields each of the given jobs as soon as it reaches a terminal state.
+
+    All of the outstanding jobs are polled together (see `css.JobGroup.refresh`), so results can
+    be processed as they arrive without one slow job holding up the rest.
+
+    Args:
+        jobs: The jobs to wait on.
+        timeout: The maximum number of seconds to wait for, or None to wait indefinitely.
+        polling_strategy: The `css.PollingStrategy` determining the intervals with which to poll.
+            Defaults to `css.PollingStrategy()`.
+        batched: Whether to try polling all of the outstanding jobs with a single request (see
+            `css.JobGroup`). If False, each outstanding job is polled separately.
+
+    Yields:
+        Each job, in the order in which they were found to have reached a terminal state.
+
+    Raises:
+        TimeoutError: If not all of the jobs reached a terminal state within `timeout` seconds.
+        SuperstaQException: If there was an error accessing the API.
+    """
+    group = JobGroup(jobs, batched)
+    intervals = (polling_strategy or css.PollingStrategy()).intervals()
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    pending_jobs = list(group)
+    while True:
+        group.refresh()
+
+        still_pending_jobs = []
+        for job in pending_jobs:
+            if job._job["status"] in css.Job.TERMINAL_STATES:
+                yield job
+            else:
+                still_pending_jobs.append(job)
+        pending_jobs = still_pending_jobs
+
+        if not pending_jobs:
+            return
+
+        interval = next(intervals)
+        if deadline is not None:
+            remaining_seconds = deadline - time.monotonic()
+            if remaining_seconds <= 0:
+                raise TimeoutError(
+                    f"{len(pending_jobs)} (of {len(group)}) jobs did not complete within "
+                    f"{timeout} seconds."
+                )
+            interval = min(interval, remaining_seconds)
+        time.sleep(interval)
+
+
+class DoneAndNotDoneJobs(NamedTuple):
+    """The jobs which had and had not reached a terminal state when `css.wait` returned."""
+
+    done: List[css.Job]
+    not_done: List[css.Job]
+
+
+def wait(
+    jobs: Iterable[css.Job],
+    timeout: Optional[float] = None,
+    return_when: str = ALL_COMPLETED,
+    polling_strategy: Optional[css.PollingStrategy] = None,
+    batched: bool = True,
+) -> DoneAndNotDoneJobs:
+    """Waits for the given jobs to reach terminal states.
+
+    Args:
+        jobs: The jobs to wait on.
+        timeout: The maximum number of seconds to wait for, or None to wait indefinitely.
+        return_when: When to return: either `css.FIRST_COMPLETED` (as soon as any job reaches a
+            terminal state) or `css.ALL_COMPLETED` (once every job has).
+        polling_strategy: The `css.PollingStrategy` determining the intervals with which to poll.
+            Defaults to `css.PollingStrategy()`.
+        batched: Whether to try polling all of the outstanding jobs with a single request (see
+            `css.JobGroup`). If False, each outstanding job is polled separately.
+
+    Returns:
+        A named tuple of two lists: the jobs which reached terminal states (`done`) and those which
+        did not (`not_done`), each in the same order as `jobs`. Unlike `as_completed`, no error is
+        raised if the timeout is reached.
+
+    Raises:
+        ValueError: If `return_when` is not `css.FIRST_COMPLETED` or `css.ALL_COMPLETED`.
+        SuperstaQException: If there was an error accessing the API.
+    """
+    if return_when not in (FIRST_COMPLETED, ALL_COMPLETED):
+        raise ValueError(f"Invalid return condition: {return_when!r}")
+
+    jobs = list(jobs)
+    try:
+        for _ in as_completed(jobs, timeout, polling_strategy, batched):
+            if return_when == FIRST_COMPLETED:
+                break
+    except TimeoutError:
+        pass
+
+    done = [job for job in jobs if job._job["status"] in css.Job.TERMINAL_STATES]
+    not_done = [job for job in jobs if job._job["status"] not in css.Job.TERMINAL_STATES]
+    return DoneAndNotDoneJobs(done, not_done)
+
+
+class JobPoller:
+    """Drives futures for the results of many jobs from a single background polling thread.
+
+    Each round, the thread refreshes every job with an outstanding future using a single request
+    (see `css.JobGroup.refresh`), and resolves the futures of those that have reached a terminal
+    state. The thread is started when a job is submitted, and exits once no futures remain.
+
+    If a job is not found, only its future fails. Transient errors (e.g. a `TimeoutError` once the
+    client has run out of retries) are retried in the next round, while any other error accessing
+    the API fails every outstanding future.
+    """
+
+    def __init__(self, polling_strategy: Optional[css.PollingStrategy] = None) -> None:
+        """Constructs a JobPoller.
+
+        Args:
+            polling_strategy: The `css.PollingStrategy` determining the intervals with which to
+                poll. Defaults to `css.PollingStrategy()`. The intervals restart from the beginning
+                whenever a new job is submitted.
+        """
+        self.polling_strategy = polling_strategy or css.PollingStrategy()
+        self._condition = threading.Condition()
+        self._pending: List[Tuple[css.Job, "concurrent.futures.Future[collections.Counter]"]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._new_jobs = False
+
+    def submit(self, job: css.Job) -> "concurrent.futures.Future[collections.Counter]":
+        """Returns a future which resolves to the results of the given job once it has completed.
+
+        Args:
+            job: The job to poll.
+
+        Returns:
+            A `concurrent.futures.Future` resolving to the value that would be returned by
+            `job.counts()`, or to the exception it would raise.
+        """
+        future: "concurrent.futures.Future[collections.Counter]" = concurrent.futures.Future()
+        with self._condition:
+            self._pending.append((job, future))
+            self._new_jobs = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def _run(self) -> None:
+        intervals = self.polling_strategy.intervals()
+        while True:
+            with self._condition:
+                self._pending = [(job, f) for job, f in self._pending if not f.cancelled()]
+                if not self._pending:
+                    self._thread = None
+                    return
+                pending = list(self._pending)
+                self._new_jobs = False
+
+            resolved = self._poll(pending)
+            resolved_futures = {future for _, future in resolved}
+            with self._condition:
+                self._pending = [(j, f) for j, f in self._pending if f not in resolved_futures]
+                if self._new_jobs:
+                    intervals = self.polling_strategy.intervals()
+                elif self._pending:
+                    self._condition.wait(next(intervals))
+
+    def _poll(
+        self, pending: List[Tuple[css.Job, "concurrent.futures.Future[collections.Counter]"]]
+    ) -> List[Tuple[css.Job, "concurrent.futures.Future[collections.Counter]"]]:
+        """Refreshes the given jobs, and resolves the futures of any which can be resolved.
+
+        Returns:
+            The `(job, future)` pairs whose futures were resolved.
+        """
+        try:
+            missing_jobs = JobGroup(job for job, _ in pending)._refresh()
+        except _TRANSIENT_ERRORS:
+            return []
+        except Exception as e:
+            for _, future in pending:
+                self._fail(future, e)
+            return pending
+
+        missing_job_ids = {id(job) for job in missing_jobs}
+        resolved = []
+        for job, future in pending:
+            if id(job) in missing_job_ids:
+                self._fail(
+                    future, gss.SuperstaQNotFoundException(f"Job {job.job_id()} was not found.")
+                )
+                resolved.append((job, future))
+            elif job._job["status"] in css.Job.TERMINAL_STATES:
+                self._resolve(job, future)
+                resolved.append((job, future))
+        return resolved
+
+    @staticmethod
+    def _fail(future: "concurrent.futures.Future[collections.Counter]", e: Exception) -> None:
+        if future.set_running_or_notify_cancel():
+            future.set_exception(e)
+
+    @staticmethod
+    def _resolve(job: css.Job, future: "concurrent.futures.Future[collections.Counter]") -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(job.counts(timeout_seconds=0))
+        except Exception as e:
+            future.set_exception(e)
+
+    def __repr__(self) -> str:
+        return f"css.JobPoller(polling_strategy={self.polling_strategy!r})"
@@ -0,0 +1,328 @@
+import collections
+import concurrent.futures
+import threading
+from typing import Any, Dict, Iterator, List, Union
+from unittest import mock
+
+import general_superstaq as gss
+import pytest
+
+import cirq_superstaq as css
+
+
+def mock_client(*responses: Union[Dict[str, Any], Exception]) -> mock.MagicMock:
+    """Returns a mock client which responds to `/get_jobs` requests with the given responses (or
+    raises the given exceptions)."""
+    client = mock.MagicMock()
+    client.post_request.side_effect = responses
+    return client
+
+
+def job_dicts(statuses: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    return {job_id: {"job_id": job_id, "status": status} for job_id, status in statuses.items()}
+
+
+def test_job_group_refresh() -> None:
+    client = mock_client(
+        job_dicts({"job_0": "Running", "job_1": "Done", "job_2": "Failed"}),
+        job_dicts({"job_0": "Done"}),
+    )
+    jobs = [css.Job(client, f"job_{i}") for i in range(3)]
+    group = css.JobGroup(jobs)
+    assert not group.done()
+
+    group.refresh()
+    client.post_request.assert_called_once_with(
+        "/get_jobs", {"job_ids": ["job_0", "job_1", "job_2"]}
+    )
+    assert [job._job["status"] for job in jobs] == ["Running", "Done", "Failed"]
+    assert group.pending_jobs() == [jobs[0]]
+
+    # Only non-terminal jobs should be refreshed
+    assert group.statuses() == ["Done", "Done", "Failed"]
+    client.post_request.assert_called_with("/get_jobs", {"job_ids": ["job_0"]})
+    assert group.done()
+
+    # Nothing left to refresh, so no more requests should be made
+    group.refresh()
+    assert client.post_request.call_count == 2
+
+    # Jobs are updated in place, so they should not need to query the API themselves
+    assert jobs[0].status() == "Done"
+    client.get_job.assert_not_called()
+
+
+def test_job_group_multiple_clients() -> None:
+    client_a = mock_client(job_dicts({"job_0": "Done", "job_2": "Running"}))
+    client_b = mock_client(job_dicts({"job_1": "Canceled"}))
+    jobs = [css.Job(client_a, "job_0"), css.Job(client_b, "job_1"), css.Job(client_a, "job_2")]
+    group = css.JobGroup(jobs)
+
+    assert group.statuses() == ["Done", "Canceled", "Running"]
+    client_a.post_request.assert_called_once_with("/get_jobs", {"job_ids": ["job_0", "job_2"]})
+    client_b.post_request.assert_called_once_with("/get_jobs", {"job_ids": ["job_1"]})
+
+
+def test_job_group_duplicate_and_missing_jobs() -> None:
+    client = mock_client(job_dicts({"job_0": "Done"}), job_dicts({}))
+    group = css.JobGroup([css.Job(client, "job_0"), css.Job(client, "job_0")])
+    assert group.statuses() == ["Done", "Done"]
+    client.post_request.assert_called_once_with("/get_jobs", {"job_ids": ["job_0"]})
+
+    client = mock_client(job_dicts({"job_2": "Done"}))
+    group = css.JobGroup([css.Job(client, "job_1"), css.Job(client, "job_2")])
+    with pytest.raises(gss.SuperstaQNotFoundException, match="job_1"):
+        group.refresh()
+
+    # Jobs which were found should still have been updated
+    assert group[1]._job["status"] == "Done"
+
+
+def test_job_group_unbatched() -> None:
+    client = mock_client()
+    client.post_request.side_effect = gss.SuperstaQNotFoundException("Not found")
+    client.get_job.side_effect = lambda job_id: {
+        "job_0": {"job_id": "job_0", "status": "Running"},
+        "job_1": {"job_id": "job_1", "status": "Done"},
+    }[job_id]
+
+    # Without the `/get_jobs` endpoint, each job should be fetched separately
+    group = css.JobGroup([css.Job(client, "job_0"), css.Job(client, "job_1")])
+    assert group.statuses() == ["Running", "Done"]
+    assert group.statuses() == ["Running", "Done"]
+    client.post_request.assert_called_once()
+    assert client.get_job.call_args_list == [
+        mock.call("job_0"),
+        mock.call("job_1"),
+        mock.call("job_0"),
+    ]
+
+    # ... which should be remembered for other groups using the same client
+    client.get_job.side_effect = gss.SuperstaQNotFoundException("Not found")
+    with pytest.raises(gss.SuperstaQNotFoundException, match="job_2"):
+        css.JobGroup([css.Job(client, "job_2")]).refresh()
+    client.post_request.assert_called_once()
+
+    client = mock_client()
+    client.get_job.return_value = {"job_id": "job_0", "status": "Done"}
+    assert css.JobGroup([css.Job(client, "job_0")], batched=False).statuses() == ["Done"]
+    client.post_request.assert_not_called()
+
+
+def test_job_group_sequence() -> None:
+    client = mock_client()
+    jobs: List[css.Job] = [css.Job(client, "job_0"), css.Job(client, "job_1")]
+    group = css.JobGroup(iter(jobs))
+
+    assert len(group) == 2
+    assert list(group) == jobs
+    assert group[1] is jobs[1]
+    assert repr(group) == f"css.JobGroup({jobs!r}, batched=True)"
+
+    assert css.JobGroup([]).done()
+    assert css.JobGroup([]).statuses() == []
+    client.post_request.assert_not_called()
+
+
+@pytest.fixture
+def mock_sleep() -> Iterator[mock.MagicMock]:
+    """Patches `time.sleep` to advance a fake `time.monotonic` clock instead of sleeping."""
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    with mock.patch("time.monotonic", lambda: now[0]), mock.patch(
+        "time.sleep", side_effect=sleep
+    ) as sleep_mock:
+        yield sleep_mock
+
+
+def test_as_completed(mock_sleep: mock.MagicMock) -> None:
+    client = mock_client(
+        job_dicts({"job_0": "Running", "job_1": "Running", "job_2": "Done"}),
+        job_dicts({"job_0": "Running", "job_1": "Failed"}),
+        job_dicts({"job_0": "Running"}),
+        job_dicts({"job_0": "Done"}),
+    )
+    jobs = [css.Job(client, f"job_{i}") for i in range(3)]
+    strategy = css.PollingStrategy(initial_seconds=1, multiplier=2, jitter=0)
+
+    completed_jobs = css.as_completed(jobs, polling_strategy=strategy)
+    assert next(completed_jobs) is jobs[2]
+    assert client.post_request.call_count == 1
+    mock_sleep.assert_not_called()
+
+    assert list(completed_jobs) == [jobs[1], jobs[0]]
+    assert [c[0][0] for c in mock_sleep.call_args_list] == [1, 2, 4]
+    assert client.post_request.call_args_list[-1] == mock.call("/get_jobs", {"job_ids": ["job_0"]})
+
+
+def test_as_completed_timeout(mock_sleep: mock.MagicMock) -> None:
+    client = mock_client(*[job_dicts({"job_0": "Done", "job_1": "Running"})] * 10)
+    jobs = [css.Job(client, "job_0"), css.Job(client, "job_1")]
+    strategy = css.PollingStrategy.fixed(2)
+
+    completed_jobs = []
+    with pytest.raises(TimeoutError, match=r"1 \(of 2\) jobs did not complete within 5 seconds"):
+        for job in css.as_completed(jobs, timeout=5, polling_strategy=strategy):
+            completed_jobs.append(job)
+
+    assert completed_jobs == [jobs[0]]
+    assert [c[0][0] for c in mock_sleep.call_args_list] == [2, 2, 1]
+
+
+def test_wait(mock_sleep: mock.MagicMock) -> None:
+    client = mock_client(
+        job_dicts({"job_0": "Running", "job_1": "Running", "job_2": "Running"}),
+        job_dicts({"job_0": "Done", "job_1": "Running", "job_2": "Canceled"}),
+        job_dicts({"job_1": "Done"}),
+    )
+    jobs = [css.Job(client, f"job_{i}") for i in range(3)]
+
+    done, not_done = css.wait(jobs, return_when=css.FIRST_COMPLETED)
+    assert done == [jobs[0], jobs[2]]
+    assert not_done == [jobs[1]]
+
+    result = css.wait(jobs)
+    assert result.done == jobs
+    assert result.not_done == []
+
+
+def test_wait_timeout(mock_sleep: mock.MagicMock) -> None:
+    client = mock_client(*[job_dicts({"job_0": "Done", "job_1": "Running"})] * 10)
+    jobs = [css.Job(client, "job_0"), css.Job(client, "job_1")]
+
+    done, not_done = css.wait(jobs, timeout=1, return_when=css.ALL_COMPLETED)
+    assert done == [jobs[0]]
+    assert not_done == [jobs[1]]
+
+    with pytest.raises(ValueError, match="Invalid return condition"):
+        _ = css.wait(jobs, return_when="FIRST_EXCEPTION")
+
+
+def test_job_poller() -> None:
+    client = mock_client(
+        job_dicts({"job_0": "Running", "job_1": "Running"}),
+        {
+            "job_0": {"job_id": "job_0", "status": "Done", "samples": {"01": 2}},
+            "job_1": {"job_id": "job_1", "status": "Failed", "failure": {"error": "bad qubits"}},
+        },
+        {"job_2": {"job_id": "job_2", "status": "Done", "samples": {"1": 1}}},
+    )
+    poller = css.JobPoller(css.PollingStrategy.fixed(0.001))
+    jobs = [css.Job(client, "job_0", poller), css.Job(client, "job_1", poller)]
+
+    callback_results: List[collections.Counter] = []
+    futures = [job.result_future() for job in jobs]
+    futures[0].add_done_callback(lambda future: callback_results.append(future.result()))
+
+    assert futures[0].result(timeout=10) == {"01": 2}
+    with pytest.raises(RuntimeError, match="bad qubits"):
+        _ = futures[1].result(timeout=10)
+    assert callback_results == [{"01": 2}]
+
+    # Status checks for all jobs should have been batched into the same requests
+    assert client.post_request.call_args_list == [
+        mock.call("/get_jobs", {"job_ids": ["job_0", "job_1"]}),
+        mock.call("/get_jobs", {"job_ids": ["job_0", "job_1"]}),
+    ]
+
+    # Jobs which are already terminal resolve without being refreshed
+    assert jobs[0].result_future().result(timeout=10) == {"01": 2}
+    assert client.post_request.call_count == 2
+
+    # The polling thread should be restarted for jobs submitted after it exits
+    assert css.Job(client, "job_2", poller).result_future().result(timeout=10) == {"1": 1}
+    assert client.post_request.call_count == 3
+
+
+def test_job_poller_request_error() -> None:
+    client = mock_client()
+    client.post_request.side_effect = gss.SuperstaQException("server is down")
+    poller = css.JobPoller()
+
+    future = poller.submit(css.Job(client, "job_0"))
+    with pytest.raises(gss.SuperstaQException, match="server is down"):
+        _ = future.result(timeout=10)
+
+
+def test_job_poller_missing_job() -> None:
+    client = mock_client(
+        job_dicts({"job_0": "Running"}),
+        {"job_0": {"job_id": "job_0", "status": "Done", "samples": {"1": 1}}},
+    )
+    poller = css.JobPoller(css.PollingStrategy.fixed(0.001))
+    futures = [poller.submit(css.Job(client, job_id)) for job_id in ("job_0", "job_1")]
+
+    # Only the future of the job which wasn't found should fail
+    with pytest.raises(gss.SuperstaQNotFoundException, match="job_1"):
+        _ = futures[1].result(timeout=10)
+    assert futures[0].result(timeout=10) == {"1": 1}
+
+
+def test_job_poller_transient_error() -> None:
+    client = mock_client(
+        TimeoutError("Reached maximum number of retries"),
+        {"job_0": {"job_id": "job_0", "status": "Done", "samples": {"1": 1}}},
+    )
+    poller = css.JobPoller(css.PollingStrategy.fixed(0.001))
+
+    # The request should be retried in the next round, rather than failing the future
+    future = poller.submit(css.Job(client, "job_0"))
+    assert future.result(timeout=10) == {"1": 1}
+    assert client.post_request.call_count == 2
+
+
+def test_job_poller_cancel() -> None:
+    requested = threading.Event()
+
+    def get_jobs(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        requested.set()
+        return job_dicts({job_id: "Running" for job_id in json_dict["job_ids"]})
+
+    client = mock_client()
+    client.post_request.side_effect = get_jobs
+    poller = css.JobPoller(css.PollingStrategy.fixed(0.001))
+
+    future = poller.submit(css.Job(client, "job_0"))
+    assert requested.wait(timeout=10)
+    assert future.cancel()
+
+    thread = poller._thread
+    if thread is not None:
+        thread.join(timeout=10)
+    assert poller._thread is None
+    assert poller._pending == []
+    assert repr(poller) == f"css.JobPoller(polling_strategy={poller.polling_strategy!r})"
+
+
+def test_job_poller_submit_during_refresh() -> None:
+    poller = css.JobPoller(css.PollingStrategy.fixed(0.001))
+    client = mock_client()
+    futures: List["concurrent.futures.Future[collections.Counter]"] = []
+
+    def get_jobs(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        if len(futures) == 1:
+            futures.append(poller.submit(css.Job(client, "job_1")))
+        return {
+            job_id: {"job_id": job_id, "status": "Done", "samples": {"1": 1}}
+            for job_id in json_dict["job_ids"]
+        }
+
+    client.post_request.side_effect = get_jobs
+    futures.append(poller.submit(css.Job(client, "job_0")))
+
+    for future in futures:
+        assert future.result(timeout=10) == {"1": 1}
+    assert client.post_request.call_count == 2
+
+
+def test_job_poller_resolve_cancelled() -> None:
+    job = css.Job(mock_client(), "job_0")
+    job._job = {"job_id": "job_0", "status": "Done", "samples": {"1": 1}}
+    future: "concurrent.futures.Future[collections.Counter]" = concurrent.futures.Future()
+    future.cancel()
+
+    css.JobPoller._resolve(job, future)
+    assert future.cancelled()
@@ -0,0 +1,188 @@
+# Copyright 2021 The Cirq Developers
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A persistent on-disk cache of jobs created via the SuperstaQ API."""
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import cirq_superstaq as css
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    num_bytes INTEGER NOT NULL,
+    last_access INTEGER NOT NULL
+)
+"""
+
+
+class JobStore:
+    """A SQLite-backed store of the jobs submitted by a `css.Service`.
+
+    Every submitted job is recorded by id, and the final state of each job (including its samples)
+    is saved once it reaches a terminal state, so that it can be reloaded later (e.g. after a
+    process restart) without any requests to the SuperstaQ API.
+
+    Once the total size of the stored jobs exceeds `max_bytes`, the least recently used jobs are
+    evicted.
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], max_bytes: Optional[int] = DEFAULT_MAX_BYTES
+    ) -> None:
+        """Constructs a JobStore, creating the database at `path` if it does not already exist.
+
+        Args:
+            path: The path of the SQLite database file.
+            max_bytes: The maximum total size (in bytes) of the serialized jobs to keep, or None
+                to never evict jobs.
+        """
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        with self._connect() as connection:
+            connection.execute(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection to the database, committing any changes made with it on exit.
+
+        A new connection is used for each operation, so that the store can be used from multiple
+        threads (e.g. by a `css.JobPoller`).
+        """
+        with self._lock, contextlib.closing(sqlite3.connect(self.path)) as connection:
+            with connection:
+                yield connection
+
+    @staticmethod
+    def _next_access(connection: sqlite3.Connection) -> int:
+        (last_access,) = connection.execute("SELECT MAX(last_access) FROM jobs").fetchone()
+        return (last_access or 0) + 1
+
+    def add(self, job_ids: Iterable[str]) -> None:
+        """Records newly submitted jobs.
+
+        Args:
+            job_ids: The ids of the submitted jobs. Ids which are already in the store are ignored.
+        """
+        with self._connect() as connection:
+            access = self._next_access(connection)
+            for job_id in job_ids:
+                payload = json.dumps({"job_id": job_id, "status": "Submitted"})
+                connection.execute(
+                    "INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?)",
+                    (job_id, "Submitted", payload, len(payload), access),
+                )
+            self._evict(connection)
+
+    def put(self, job_dict: Dict[str, Any]) -> None:
+        """Saves the state of a job, if it is terminal.
+
+        Args:
+            job_dict: The job, as returned by the SuperstaQ API (i.e. `css.Job._job`).
+        """
+        if job_dict["status"] not in css.Job.TERMINAL_STATES:
+            return
+
+        payload = json.dumps(job_dict)
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?) ON CONFLICT (job_id) DO UPDATE SET "
+                "status = excluded.status, payload = excluded.payload, "
+                "num_bytes = excluded.num_bytes, last_access = excluded.last_access",
+                (
+                    job_dict["job_id"],
+                    job_dict["status"],
+                    payload,
+                    len(payload),
+                    self._next_access(connection),
+                ),
+            )
+            self._evict(connection)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Loads the final state of a job.
+
+        Args:
+            job_id: The id of the job.
+
+        Returns:
+            The saved job dictionary if the job has reached a terminal state, otherwise None.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT status, payload FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None or row[0] not in css.Job.TERMINAL_STATES:
+                return None
+
+            connection.execute(
+                "UPDATE jobs SET last_access = ? WHERE job_id = ?",
+                (self._next_access(connection), job_id),
+            )
+            return json.loads(row[1])
+
+    def job_ids(self) -> List[str]:
+        """Returns the ids of all stored jobs, in the order in which they were first recorded."""
+        with self._connect() as connection:
+            return [
+                job_id for (job_id,) in connection.execute("SELECT job_id FROM jobs ORDER BY rowid")
+            ]
+
+    def remove(self, job_id: str) -> None:
+        """Removes a job from the store (if it is present)."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def clear(self) -> None:
+        """Removes all jobs from the store."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM jobs")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Deletes the least recently used jobs until the store fits within `max_bytes`."""
+        if self.max_bytes is None:
+            return
+
+        (total_bytes,) = connection.execute(
+            "SELECT COALESCE(SUM(num_bytes), 0) FROM jobs"
+        ).fetchone()
+        if total_bytes <= self.max_bytes:
+            return
+
+        evicted_ids = []
+        for job_id, num_bytes in connection.execute(
+            "SELECT job_id, num_bytes FROM jobs ORDER BY last_access, rowid"
+        ):
+            if total_bytes <= self.max_bytes:
+                break
+            evicted_ids.append((job_id,))
+            total_bytes -= num_bytes
+        connection.executemany("DELETE FROM jobs WHERE job_id = ?", evicted_ids)
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            (num_jobs,) = connection.execute("SELECT COUNT(*) FROM jobs").fetchone()
+            return num_jobs
+
+    def __repr__(self) -> str:
+        return f"css.JobStore({self.path!r}, max_bytes={self.max_bytes!r})"
@@ -0,0 +1,118 @@
+import json
+import pathlib
+import threading
+from typing import Any, Dict
+from unittest import mock
+
+import pytest
+
+import cirq_superstaq as css
+
+
+def test_job_store(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "jobs.db"
+    store = css.JobStore(path)
+    assert (
+        repr(store) == f"css.JobStore({str(path)!r}, max_bytes={css.job_store.DEFAULT_MAX_BYTES})"
+    )
+    assert len(store) == 0
+
+    store.add(["job_0", "job_1"])
+    store.add(["job_0"])
+    assert store.job_ids() == ["job_0", "job_1"]
+    assert len(store) == 2
+
+    # Only terminal jobs should be loaded
+    assert store.get("job_0") is None
+    assert store.get("job_2") is None
+    store.put({"job_id": "job_0", "status": "Running"})
+    assert store.get("job_0") is None
+
+    job_dict = {"job_id": "job_0", "status": "Done", "samples": {"01": 5}, "shots": 5}
+    store.put(job_dict)
+    store.put({"job_id": "job_2", "status": "Failed", "failure": {"error": "bad"}})
+    assert store.get("job_0") == job_dict
+    assert store.job_ids() == ["job_0", "job_1", "job_2"]
+
+    # Stored jobs should persist between instances
+    assert css.JobStore(path).get("job_0") == job_dict
+    assert css.JobStore(path).get("job_2") == {
+        "job_id": "job_2",
+        "status": "Failed",
+        "failure": {"error": "bad"},
+    }
+
+    store.remove("job_1")
+    store.remove("job_3")
+    assert store.job_ids() == ["job_0", "job_2"]
+
+    store.clear()
+    assert store.job_ids() == []
+    assert css.JobStore(path).get("job_0") is None
+
+
+def test_job_store_eviction(tmp_path: pathlib.Path) -> None:
+    def job_dict(job_id: str) -> Dict[str, Any]:
+        return {"job_id": job_id, "status": "Done", "samples": {"0": 1}}
+
+    max_bytes = 3 * len(json.dumps(job_dict("job_0")))
+    store = css.JobStore(tmp_path / "jobs.db", max_bytes=max_bytes)
+
+    for job_id in ["job_0", "job_1", "job_2"]:
+        store.put(job_dict(job_id))
+    assert store.job_ids() == ["job_0", "job_1", "job_2"]
+
+    # Accessing job_0 should make job_1 the least recently used
+    assert store.get("job_0") == job_dict("job_0")
+    store.put(job_dict("job_3"))
+    assert store.job_ids() == ["job_0", "job_2", "job_3"]
+
+    # Adding a submitted job should evict the least recently used job
+    store.add(["job_4"])
+    assert store.job_ids() == ["job_0", "job_3", "job_4"]
+
+    # A single job larger than the store should not be kept
+    store.put({"job_id": "job_5", "status": "Done", "samples": {"0" * max_bytes: 1}})
+    assert store.job_ids() == []
+
+    unbounded_store = css.JobStore(tmp_path / "unbounded.db", max_bytes=None)
+    for i in range(10):
+        unbounded_store.put(job_dict(f"job_{i}"))
+    assert len(unbounded_store) == 10
+
+
+def test_job_store_threads(tmp_path: pathlib.Path) -> None:
+    store = css.JobStore(tmp_path / "jobs.db")
+
+    def put_jobs(thread_index: int) -> None:
+        for i in range(10):
+            store.put({"job_id": f"job_{thread_index}_{i}", "status": "Done", "samples": {}})
+
+    threads = [threading.Thread(target=put_jobs, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(store) == 40
+
+
+def test_job_saved_when_terminal(tmp_path: pathlib.Path) -> None:
+    store = css.JobStore(tmp_path / "jobs.db")
+    client = mock.MagicMock()
+    client.get_job.side_effect = [
+        {"job_id": "job_0", "status": "Running"},
+        {"job_id": "job_0", "status": "Done", "samples": {"1": 3}},
+    ]
+    job = css.Job(client, "job_0", store=store)
+
+    assert job.status() == "Running"
+    assert store.get("job_0") is None
+    assert job.status() == "Done"
+    assert store.get("job_0") == {"job_id": "job_0", "status": "Done", "samples": {"1": 3}}
+
+
+@pytest.mark.parametrize("status", ["Submitted", "Ready"])
+def test_job_store_put_non_terminal(tmp_path: pathlib.Path, status: str) -> None:
+    store = css.JobStore(tmp_path / "jobs.db")
+    store.put({"job_id": "job_0", "status": status})
+    assert len(store) == 0
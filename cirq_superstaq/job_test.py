@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List
 from unittest import mock
 
 import cirq
@@ -105,6 +105,22 @@ def test_job_counts() -> None:
         assert job.counts() == {"11": 1}
 
 
+def test_job_result_future() -> None:
+    job_dict = {"job_id": "my_id", "samples": {"11": 1}, "status": "Done"}
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.post_request",
+        return_value={"my_id": job_dict},
+    ) as mocked_request:
+        job = new_job()
+        assert job.result_future().result(timeout=10) == {"11": 1}
+        mocked_request.assert_called_once_with("/get_jobs", {"job_ids": ["my_id"]})
+
+        # Subsequent futures should reuse the same poller
+        poller = job._poller
+        assert job.result_future().result(timeout=10) == {"11": 1}
+        assert job._poller is poller
+
+
 def test_job_counts_failed() -> None:
     job_dict = {
         "data": {"histogram": {"11": 1}},
@@ -147,8 +163,29 @@ def test_job_counts_poll(mock_sleep: mock.MagicMock) -> None:
         mock_sleep.assert_called_once()
 
 
-@mock.patch("time.sleep", return_value=None)
-def test_job_counts_poll_timeout(mock_sleep: mock.MagicMock) -> None:
+class FakeClock:
+    """Stands in for `time.monotonic` and `time.sleep`, advancing only when explicitly told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock() -> Iterator[FakeClock]:
+    clock = FakeClock()
+    with mock.patch("time.monotonic", clock.monotonic), mock.patch("time.sleep", clock.sleep):
+        yield clock
+
+
+def test_job_counts_poll_timeout(fake_clock: FakeClock) -> None:
     ready_job = {
         "job_id": "my_id",
         "status": "ready",
@@ -156,18 +193,68 @@ def test_job_counts_poll_timeout(mock_sleep: mock.MagicMock) -> None:
     with mocked_get_job_requests(*[ready_job] * 20):
         job = new_job()
         with pytest.raises(RuntimeError, match="ready"):
-            _ = job.counts(timeout_seconds=1, polling_seconds=0.1)
-    assert mock_sleep.call_count == 11
+            _ = job.counts(timeout_seconds=1, polling_seconds=0.25)
+    assert fake_clock.sleeps == [0.25] * 4
 
 
-@mock.patch("time.sleep", return_value=None)
-def test_job_results_poll_timeout_with_error_message(mock_sleep: mock.MagicMock) -> None:
+def test_job_results_poll_timeout_with_error_message(fake_clock: FakeClock) -> None:
     ready_job = {"job_id": "my_id", "status": "failure", "failure": {"error": "too many qubits"}}
     with mocked_get_job_requests(*[ready_job] * 20):
         job = new_job()
         with pytest.raises(RuntimeError, match="too many qubits"):
-            _ = job.counts(timeout_seconds=1, polling_seconds=0.1)
-    assert mock_sleep.call_count == 11
+            _ = job.counts(timeout_seconds=1, polling_seconds=0.25)
+    assert fake_clock.sleeps == [0.25] * 4
+
+
+def test_job_counts_poll_request_latency(fake_clock: FakeClock) -> None:
+    ready_job = {"job_id": "my_id", "status": "ready"}
+
+    def slow_get_job(job_id: str) -> Dict[str, Any]:
+        fake_clock.now += 0.3
+        return ready_job
+
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job", side_effect=slow_get_job
+    ):
+        job = new_job()
+        with pytest.raises(RuntimeError, match="ready"):
+            _ = job.counts(timeout_seconds=1, polling_seconds=0.25)
+
+    # Time spent waiting on requests should count towards the timeout
+    assert fake_clock.sleeps == [0.25, pytest.approx(0.15)]
+
+
+def test_job_counts_poll_backoff(fake_clock: FakeClock) -> None:
+    ready_job = {"job_id": "my_id", "status": "ready"}
+    completed_job = {"job_id": "my_id", "samples": {"11": 1}, "status": "Done"}
+    strategy = css.PollingStrategy(initial_seconds=0.5, max_seconds=3, multiplier=2, jitter=0)
+
+    with mocked_get_job_requests(*[ready_job] * 5, completed_job):
+        job = new_job()
+        assert job.counts(polling_strategy=strategy) == {"11": 1}
+    assert fake_clock.sleeps == [0.5, 1, 2, 3, 3]
+
+    # Server-provided hints should override the polling strategy
+    retry_job = {"job_id": "my_id", "status": "ready", "retry_after": 7}
+    with mocked_get_job_requests(ready_job, retry_job, ready_job, completed_job):
+        fake_clock.sleeps.clear()
+        job = new_job()
+        assert job.counts(polling_strategy=strategy) == {"11": 1}
+    assert fake_clock.sleeps == [0.5, 7, 2]
+
+
+def test_polling_strategy() -> None:
+    strategy = css.PollingStrategy(initial_seconds=1, max_seconds=10, multiplier=2, jitter=0.5)
+    intervals = strategy.intervals()
+    for expected_interval in [1, 2, 4, 8, 10, 10]:
+        assert 0.5 * expected_interval <= next(intervals) <= min(1.5 * expected_interval, 10)
+
+    intervals = css.PollingStrategy.fixed(0.3).intervals()
+    assert [next(intervals) for _ in range(3)] == [0.3, 0.3, 0.3]
+
+    assert repr(strategy) == (
+        "css.PollingStrategy(initial_seconds=1, max_seconds=10, multiplier=2, jitter=0.5)"
+    )
 
 
 def test_job_fields_unsuccessful() -> None:
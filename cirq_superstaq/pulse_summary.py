@@ -0,0 +1,144 @@
+# Copyright 2021 The Cirq Developers
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Summaries of the pulse schedules returned by `ibmq_compile`, readable without qiskit."""
+
+import codecs
+import functools
+import io
+import pickle
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# The prefixes with which qiskit names each type of channel (e.g. "d0" for `DriveChannel(0)`)
+_CHANNEL_PREFIXES = {
+    "DriveChannel": "d",
+    "ControlChannel": "u",
+    "MeasureChannel": "m",
+    "AcquireChannel": "a",
+    "MemorySlot": "m",
+    "RegisterSlot": "c",
+    "SnapshotChannel": "s",
+}
+
+
+class PulseSummary(NamedTuple):
+    """A summary of a compiled pulse schedule (see `summarize_pulses`)."""
+
+    duration: Optional[int]
+    start_time: Optional[int]
+    num_instructions: int
+    channels: Tuple[str, ...]
+
+
+class _StubType(type):
+    def __getattr__(cls, name: str) -> Any:
+        # e.g. enum members, which are pickled as `getattr(EnumClass, name)`
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return cls(name)
+
+
+class _Stub(metaclass=_StubType):
+    """Stands in for an object of a class which is not (or should not be) imported."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._stub_args = args
+
+    def __setstate__(self, state: Any) -> None:
+        # `state` is either the object's __dict__, or a tuple of its __dict__ and slot values
+        for attributes in state if isinstance(state, tuple) else (state,):
+            if isinstance(attributes, dict):
+                self.__dict__.update(attributes)
+
+
+@functools.lru_cache(maxsize=None)
+def _stub_class(module: str, name: str) -> _StubType:
+    return _StubType(name, (_Stub,), {"__module__": module})
+
+
+class _StubUnpickler(pickle.Unpickler):
+    """Unpickles qiskit objects (and any others whose classes can't be imported) as stubs."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        if module != "qiskit" and not module.startswith("qiskit."):
+            try:
+                return super().find_class(module, name)
+            except (ImportError, AttributeError):
+                pass
+        return _stub_class(module, name)
+
+
+def _load_stubs(serialized_obj: str) -> Any:
+    """Deserializes the output of `gss.converters.serialize`, stubbing out qiskit objects."""
+    data = codecs.decode(serialized_obj.encode(), "base64")
+    return _StubUnpickler(io.BytesIO(data)).load()
+
+
+def _channel_name(channel: Any) -> str:
+    prefix = _CHANNEL_PREFIXES.get(type(channel).__name__, type(channel).__name__)
+    return f"{prefix}{getattr(channel, '_index', '')}"
+
+
+def _num_instructions(schedule: Any) -> int:
+    """Counts the instructions in a (possibly nested) `Schedule` or `ScheduleBlock`."""
+    children = getattr(schedule, "_children", getattr(schedule, "_blocks", None))
+    if children is None:
+        return 1
+
+    # `Schedule` children are `(start_time, child)` tuples
+    return sum(
+        _num_instructions(child[1] if isinstance(child, tuple) else child) for child in children
+    )
+
+
+def _summarize(schedule: Any) -> PulseSummary:
+    timeslots: Dict[Any, List[Tuple[int, int]]] = getattr(schedule, "_timeslots", None) or {}
+    start_times = [intervals[0][0] for intervals in timeslots.values() if intervals]
+    return PulseSummary(
+        duration=getattr(schedule, "_duration", None),
+        start_time=min(start_times, default=0) if hasattr(schedule, "_timeslots") else None,
+        num_instructions=_num_instructions(schedule),
+        channels=tuple(sorted({_channel_name(channel) for channel in timeslots})),
+    )
+
+
+def summarize_pulses(serialized_pulses: Union[str, Sequence[str]]) -> List[PulseSummary]:
+    """Summarizes the pulse schedules returned by `ibmq_compile`, without qiskit.
+
+    Rather than reconstructing each `qiskit.pulse.Schedule` (which requires a compatible version
+    of qiskit-terra), the serialized schedules are unpickled into lightweight stand-ins, from
+    which just their duration, start time, instruction count and channels are read.
+
+    Args:
+        serialized_pulses: The "pulses" field of the response: either a list of schedules
+            serialized as a whole with `gss.converters.serialize`, or a list of separately
+            serialized schedules (one per circuit).
+
+    Returns:
+        A summary of each schedule, in order. Fields which can't be read (e.g. if the schedules
+        were serialized by an incompatible version of qiskit) are None.
+    """
+    if isinstance(serialized_pulses, str):
+        return [_summarize(schedule) for schedule in _load_stubs(serialized_pulses)]
+    return [summarize_pulse(serialized_pulse) for serialized_pulse in serialized_pulses]
+
+
+def summarize_pulse(serialized_pulse: str) -> PulseSummary:
+    """Summarizes one pulse schedule serialized with `gss.converters.serialize`, without qiskit.
+
+    Args:
+        serialized_pulse: The serialized `qiskit.pulse.Schedule`.
+
+    Returns:
+        A summary of the schedule (see `summarize_pulses`).
+    """
+    return _summarize(_load_stubs(serialized_pulse))
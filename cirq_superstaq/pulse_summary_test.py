@@ -0,0 +1,106 @@
+import enum
+import sys
+import types
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest import mock
+
+import general_superstaq as gss
+import pytest
+
+import cirq_superstaq as css
+
+
+class Channel:
+    def __init__(self, index: int) -> None:
+        self._index = index
+
+
+class DriveChannel(Channel):
+    pass
+
+
+class ControlChannel(Channel):
+    pass
+
+
+class Play:
+    __slots__ = ("_operands", "_name")
+
+    def __init__(self, channel: Channel) -> None:
+        self._operands = (channel,)
+        self._name = "play"
+
+
+class Schedule:
+    def __init__(self, *children: Tuple[int, Any], duration: int) -> None:
+        self._duration = duration
+        self._children = list(children)
+        self._timeslots: Dict[Channel, List[Tuple[int, int]]] = {}
+        self._metadata = {"phase": Phase.ZERO}
+
+
+class Phase(enum.Enum):
+    ZERO = 0
+
+
+@pytest.fixture
+def fake_qiskit() -> Iterator[None]:
+    """Makes the classes above picklable as if they were defined in qiskit."""
+    modules = {name: types.ModuleType(name) for name in ("qiskit", "qiskit.pulse", "lib")}
+    for cls in (DriveChannel, ControlChannel, Play, Schedule):
+        cls.__module__ = "qiskit.pulse"
+        setattr(modules["qiskit.pulse"], cls.__name__, cls)
+
+    # A class from another library, which is only imported if it is installed
+    Phase.__module__ = "lib"
+    setattr(modules["lib"], "Phase", Phase)
+
+    with mock.patch.dict(sys.modules, modules):
+        yield
+
+
+def _schedule() -> Schedule:
+    d0, u1 = DriveChannel(0), ControlChannel(1)
+    inner = Schedule((0, Play(u1)), (10, Play(u1)), duration=20)
+    inner._timeslots = {u1: [(5, 15), (20, 30)]}
+    schedule = Schedule((4, Play(d0)), (8, inner), duration=40)
+    schedule._timeslots = {d0: [(4, 12)], u1: [(13, 23), (28, 38)]}
+    return schedule
+
+
+def test_summarize_pulses(fake_qiskit: None) -> None:
+    serialized_pulses = gss.converters.serialize([_schedule(), Schedule(duration=0)])
+    serialized_pulse = gss.converters.serialize(_schedule())
+
+    with mock.patch.dict(sys.modules, {"lib": None}):
+        summary = css.PulseSummary(
+            duration=40, start_time=4, num_instructions=3, channels=("d0", "u1")
+        )
+        empty_summary = css.PulseSummary(duration=0, start_time=0, num_instructions=0, channels=())
+        assert css.pulse_summary.summarize_pulses(serialized_pulses) == [summary, empty_summary]
+        assert css.pulse_summary.summarize_pulses([serialized_pulse]) == [summary]
+        assert css.pulse_summary.summarize_pulse(serialized_pulse) == summary
+
+    # The qiskit classes should never be imported, even if they are available
+    schedule: Any = css.pulse_summary._load_stubs(serialized_pulse)
+    assert type(schedule._metadata["phase"]) is Phase
+    assert type(schedule).__name__ == "Schedule"
+    assert isinstance(schedule, css.pulse_summary._Stub)
+    assert css.pulse_summary.summarize_pulse(serialized_pulse) == summary
+
+
+def test_summarize_unknown_objects() -> None:
+    # Objects which aren't schedules have no duration or start time
+    assert css.pulse_summary.summarize_pulse(
+        gss.converters.serialize("not a schedule")
+    ) == css.PulseSummary(duration=None, start_time=None, num_instructions=1, channels=())
+
+    stub_class = css.pulse_summary._stub_class("qiskit.pulse", "Kind")
+    assert stub_class is css.pulse_summary._stub_class("qiskit.pulse", "Kind")
+    assert stub_class.ZERO._stub_args == ("ZERO",)
+    with pytest.raises(AttributeError):
+        _ = stub_class.__wrapped__
+
+    stub = stub_class()
+    stub.__setstate__(({"_a": 1}, {"_b": 2}))
+    assert stub._a == 1 and stub._b == 2
@@ -0,0 +1,247 @@
+# Copyright 2021 The Cirq Developers
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A `cirq.Result` backed by the histogram of counts returned by the SuperstaQ API."""
+
+import collections
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import cirq
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from cirq.study.result import _key_to_str, _tuple_of_big_endian_int, TMeasurementKey
+
+
+def bitstrings_to_array(bitstrings: Sequence[str], dtype: npt.DTypeLike = np.uint8) -> np.ndarray:
+    """Decodes equal-length bitstrings into a 2D array with one row per bitstring.
+
+    Args:
+        bitstrings: The bitstrings to decode, e.g. ["01", "11"].
+        dtype: The dtype of the returned array.
+
+    Returns:
+        A `len(bitstrings)` x `len(bitstrings[0])` array of zeros and ones.
+
+    Raises:
+        ValueError: If the bitstrings have different lengths, or contain characters other than
+            "0" and "1".
+    """
+    if not bitstrings:
+        return np.zeros((0, 0), dtype=dtype)
+
+    num_bits = len(bitstrings[0])
+    if any(len(bitstring) != num_bits for bitstring in bitstrings):
+        raise ValueError("Bitstrings must all have the same length.")
+
+    # Decode all bitstrings at once: b"0111" -> [48, 49, 49, 49] -> [0, 1, 1, 1]
+    try:
+        encoded = "".join(bitstrings).encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Bitstrings may only contain '0' and '1'.")
+    bits = np.frombuffer(encoded, dtype=np.uint8) - ord("0")
+    if bits.size and bits.max() > 1:
+        raise ValueError("Bitstrings may only contain '0' and '1'.")
+    return bits.reshape(len(bitstrings), num_bits).astype(dtype, copy=False)
+
+
+def measurement_indices(circuit: cirq.AbstractCircuit) -> Dict[str, List[int]]:
+    """Maps each measurement key in a circuit to the bitstring indices of its measured qubits.
+
+    Bitstrings returned by the SuperstaQ API contain one bit for each qubit of each measurement
+    operation, in the order in which the measurements appear in the circuit. A qubit which is
+    measured more than once (e.g. mid-circuit, and again at the end) therefore has more than one
+    bit. This map only depends on the circuit, so it can be computed once and shared between all
+    of the results of a parameter sweep.
+
+    Args:
+        circuit: The circuit that was run.
+
+    Returns:
+        A dictionary mapping each measurement key name to the list of indices (into the returned
+        bitstrings) of the qubits measured with that key. If the same key is used for more than
+        one measurement, its indices are those of each of these measurements in turn.
+    """
+    indices: Dict[str, List[int]] = {}
+    num_bits = 0
+    for op in circuit.all_operations():
+        if cirq.is_measurement(op):
+            key = cirq.measurement_key_name(op)
+            indices.setdefault(key, []).extend(range(num_bits, num_bits + len(op.qubits)))
+            num_bits += len(op.qubits)
+    return indices
+
+
+class CountsResult(cirq.Result):
+    """A `cirq.Result` which stores the histogram of counts returned by the SuperstaQ API.
+
+    Histogram queries are answered directly from the stored counts, in time proportional to the
+    number of unique outcomes. The per-shot `measurements` and `records` arrays are only built
+    when they are first accessed.
+
+    If `packed` is True, per-shot measurements are instead stored bit-packed (see
+    `packed_measurements`), using one bit per measured qubit rather than one byte. The
+    `measurements` and `records` arrays are then unpacked on every access, but never stored.
+    """
+
+    def __init__(
+        self,
+        counts: Mapping[str, int],
+        indices: Mapping[str, Sequence[int]],
+        params: Optional[cirq.ParamResolver] = None,
+        dtype: npt.DTypeLike = np.uint8,
+        packed: bool = False,
+    ) -> None:
+        """Constructs a CountsResult.
+
+        Args:
+            counts: The histogram of counts for the run, e.g. `css.Job.counts()`.
+            indices: A map from each measurement key name to the bitstring indices of the qubits
+                it measured (see `css.result.measurement_indices`).
+            params: The `cirq.ParamResolver` used for this result.
+            dtype: The dtype of the `measurements` and `records` arrays. Defaults to `np.uint8`.
+            packed: Whether to store per-shot measurements bit-packed instead of unpacked.
+
+        Raises:
+            ValueError: If the bitstrings in `counts` do not have exactly one bit for each index in
+                `indices` (unless `indices` is empty, in which case no bits are read).
+        """
+        self._counts = collections.Counter(counts)
+        self._indices = {key: list(qubit_indices) for key, qubit_indices in indices.items()}
+
+        num_bits = len(
+            {index for qubit_indices in self._indices.values() for index in qubit_indices}
+        )
+        for bitstring in self._counts:
+            if self._indices and len(bitstring) != num_bits:
+                raise ValueError(
+                    f"Expected bitstrings with one bit for each of the {num_bits} measured qubits "
+                    f"(in the order in which they were measured), but got {bitstring!r}."
+                )
+        self._params = params if params is not None else cirq.ParamResolver({})
+        self._dtype = dtype
+        self._packed = packed
+
+        self._unique_samples: Optional[np.ndarray] = None
+        self._packed_measurements: Optional[Dict[str, np.ndarray]] = None
+        self._measurements: Optional[Dict[str, np.ndarray]] = None
+        self._records: Optional[Dict[str, np.ndarray]] = None
+        self._data: Optional[pd.DataFrame] = None
+
+    @property
+    def params(self) -> cirq.ParamResolver:
+        return self._params
+
+    @property
+    def counts(self) -> collections.Counter:
+        """The raw histogram of bitstring counts returned by the SuperstaQ API."""
+        return self._counts
+
+    @property
+    def repetitions(self) -> int:
+        return sum(self._counts.values())
+
+    def _get_unique_samples(self) -> np.ndarray:
+        """Returns a matrix with one row for each unique bitstring in the stored counts."""
+        if self._unique_samples is None and not self._counts:
+            num_bits = len({index for indices in self._indices.values() for index in indices})
+            self._unique_samples = np.zeros((0, num_bits), dtype=self._dtype)
+        elif self._unique_samples is None:
+            self._unique_samples = bitstrings_to_array(list(self._counts), dtype=self._dtype)
+        return self._unique_samples
+
+    def _get_repeats(self) -> np.ndarray:
+        """Returns the number of times each unique bitstring in the stored counts was measured."""
+        return np.fromiter(self._counts.values(), dtype=np.int64, count=len(self._counts))
+
+    @property
+    def packed_measurements(self) -> Mapping[str, np.ndarray]:
+        """A mapping from measurement key to bit-packed measurement results.
+
+        The value for each key is a 2-D `np.uint8` array with one row per repetition, holding the
+        measured bits of that key packed with `np.packbits`. Use `unpack_measurements` (or just
+        `measurements`) to recover the unpacked bits.
+        """
+        if self._packed_measurements is None:
+            unique_samples = self._get_unique_samples()
+            repeats = self._get_repeats()
+            self._packed_measurements = {
+                key: np.repeat(np.packbits(unique_samples[:, qubit_indices], axis=1), repeats, 0)
+                for key, qubit_indices in self._indices.items()
+            }
+        return self._packed_measurements
+
+    def unpack_measurements(self, key: str) -> np.ndarray:
+        """Unpacks the measurement results for a single key from `packed_measurements`.
+
+        Args:
+            key: The measurement key name.
+
+        Returns:
+            A 2-D array with one row per repetition and one column per qubit measured by `key`.
+        """
+        num_bits = len(self._indices[key])
+        bits = np.unpackbits(self.packed_measurements[key], axis=1, count=num_bits)
+        return bits.astype(self._dtype, copy=False)
+
+    @property
+    def measurements(self) -> Mapping[str, np.ndarray]:
+        if self._packed:
+            return {key: self.unpack_measurements(key) for key in self._indices}
+
+        if self._measurements is None:
+            samples = np.repeat(self._get_unique_samples(), self._get_repeats(), axis=0)
+            self._measurements = {
+                key: samples[:, qubit_indices] for key, qubit_indices in self._indices.items()
+            }
+        return self._measurements
+
+    @property
+    def records(self) -> Mapping[str, np.ndarray]:
+        if self._packed:
+            return {key: val[:, np.newaxis, :] for key, val in self.measurements.items()}
+
+        if self._records is None:
+            self._records = {key: val[:, np.newaxis, :] for key, val in self.measurements.items()}
+        return self._records
+
+    @property
+    def data(self) -> pd.DataFrame:
+        if self._data is None:
+            self._data = self.dataframe_from_measurements(self.measurements)
+        return self._data
+
+    def multi_measurement_histogram(
+        self,
+        *,
+        keys: Iterable[TMeasurementKey],
+        fold_func: Callable[[Tuple], Any] = _tuple_of_big_endian_int,
+    ) -> collections.Counter:
+        """Counts the number of times combined measurement results occurred.
+
+        This produces the same output as `cirq.Result.multi_measurement_histogram`, but folds
+        each unique bitstring only once instead of iterating over every repetition.
+        """
+        key_names = [_key_to_str(key) for key in keys]
+        unique_samples = self._get_unique_samples()
+
+        histogram: collections.Counter = collections.Counter()
+        for row, count in zip(unique_samples, self._counts.values()):
+            sample = tuple(row[self._indices[key]] for key in key_names)
+            histogram[fold_func(sample)] += count
+        return histogram
+
+    def __repr__(self) -> str:
+        return (
+            f"css.CountsResult(counts={dict(self._counts)!r}, indices={self._indices!r}, "
+            f"params={self._params!r}, packed={self._packed!r})"
+        )
@@ -0,0 +1,163 @@
+import collections
+
+import cirq
+import numpy as np
+import pandas as pd
+import pytest
+
+import cirq_superstaq as css
+
+
+def test_bitstrings_to_array() -> None:
+    bits = css.result.bitstrings_to_array(["01", "11", "00"])
+    np.testing.assert_array_equal(bits, [[0, 1], [1, 1], [0, 0]])
+    assert bits.dtype == np.uint8
+    assert css.result.bitstrings_to_array(["1"], dtype=bool).tolist() == [[True]]
+    assert css.result.bitstrings_to_array([]).shape == (0, 0)
+    assert css.result.bitstrings_to_array(["", ""]).shape == (2, 0)
+
+    with pytest.raises(ValueError, match="same length"):
+        _ = css.result.bitstrings_to_array(["01", "1", "011"])
+    with pytest.raises(ValueError, match="only contain"):
+        _ = css.result.bitstrings_to_array(["01", "21"])
+    with pytest.raises(ValueError, match="only contain"):
+        _ = css.result.bitstrings_to_array(["0/"])
+    with pytest.raises(ValueError, match="only contain"):
+        _ = css.result.bitstrings_to_array(["0é"])
+
+
+def test_measurement_indices() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(q0),
+        cirq.measure(q2, q0, key="b"),
+        cirq.measure(q1, key="a"),
+    )
+    # `measure(q1)` is placed in the first moment, before `measure(q2, q0)`
+    assert css.result.measurement_indices(circuit) == {"a": [0], "b": [1, 2]}
+    assert css.result.measurement_indices(cirq.Circuit(cirq.H(q0))) == {}
+
+    # Each measurement has its own bits, even if it measures the same qubit as another
+    circuit = cirq.Circuit(
+        cirq.measure(q0, key="x"),
+        cirq.X(q0),
+        cirq.measure(q0, key="y"),
+        cirq.measure(q1, q0, key="x"),
+    )
+    assert css.result.measurement_indices(circuit) == {"x": [0, 2, 3], "y": [1]}
+
+
+def test_counts_result() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.measure(q0, key="a"),
+        cirq.measure(q2, q1, key="b"),
+    )
+    counts = collections.Counter({"010": 2, "101": 1})
+    params = cirq.ParamResolver({"x": 1})
+    result = css.CountsResult(counts, css.result.measurement_indices(circuit), params)
+
+    assert result.params == params
+    assert result.counts == counts
+    assert result.repetitions == 3
+    assert result.histogram(key="a") == collections.Counter({0: 2, 1: 1})
+    assert result.histogram(key="b") == collections.Counter({2: 2, 1: 1})
+    assert result.histogram(key="b", fold_func=tuple) == collections.Counter({(1, 0): 2, (0, 1): 1})
+    assert result.multi_measurement_histogram(keys=["a", "b"]) == collections.Counter(
+        {(0, 2): 2, (1, 1): 1}
+    )
+    assert result.multi_measurement_histogram(keys=[]) == collections.Counter({(): 3})
+
+    # Histograms should not have built any per-shot arrays
+    assert result._measurements is None
+
+    np.testing.assert_array_equal(result.measurements["a"], [[0], [0], [1]])
+    np.testing.assert_array_equal(result.measurements["b"], [[1, 0], [1, 0], [0, 1]])
+    assert result.measurements["a"].dtype == np.uint8
+    assert result.records["b"].shape == (3, 1, 2)
+    pd.testing.assert_frame_equal(result.data, pd.DataFrame({"a": [0, 0, 1], "b": [2, 2, 1]}))
+
+    expected = cirq.ResultDict(
+        params=params,
+        measurements={"a": np.array([[0], [0], [1]]), "b": np.array([[1, 0], [1, 0], [0, 1]])},
+    )
+    assert result == expected
+    assert result.histogram(key="b") == expected.histogram(key="b")
+
+    assert repr(result) == (
+        "css.CountsResult(counts={'010': 2, '101': 1}, indices={'a': [0], 'b': [1, 2]}, "
+        "params=cirq.ParamResolver({'x': 1}), packed=False)"
+    )
+
+
+def test_counts_result_bitstring_layout() -> None:
+    # Bitstrings contain one bit per measured qubit, in the order in which they were measured
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.measure(q2, q0, key="a"), cirq.measure(q1, key="b"))
+    result = css.CountsResult({"101": 5}, css.result.measurement_indices(circuit))
+    assert result.histogram(key="a", fold_func=tuple) == collections.Counter({(1, 0): 5})
+    assert result.histogram(key="b") == collections.Counter({1: 5})
+
+    with pytest.raises(ValueError, match="each of the 3 measured qubits.*'1100'"):
+        _ = css.CountsResult({"110": 1, "1100": 1}, css.result.measurement_indices(circuit))
+    with pytest.raises(ValueError, match="each of the 3 measured qubits.*'11'"):
+        _ = css.CountsResult({"11": 1}, css.result.measurement_indices(circuit))
+
+
+def test_counts_result_repeated_measurements() -> None:
+    # A qubit measured mid-circuit and again at the end, under different keys
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.measure(q0, key="x"),
+        cirq.X(q0),
+        cirq.measure(q0, q1, key="y"),
+    )
+    result = css.CountsResult({"010": 3, "101": 1}, css.result.measurement_indices(circuit))
+    assert result.histogram(key="x") == collections.Counter({0: 3, 1: 1})
+    assert result.histogram(key="y", fold_func=tuple) == collections.Counter({(1, 0): 3, (0, 1): 1})
+
+    # The same qubit measured twice in a row, under different keys
+    circuit = cirq.Circuit(cirq.measure(q0, key="x"), cirq.measure(q0, key="y"))
+    result = css.CountsResult({"01": 2}, css.result.measurement_indices(circuit))
+    assert result.histogram(key="x") == collections.Counter({0: 2})
+    assert result.histogram(key="y") == collections.Counter({1: 2})
+
+
+def test_counts_result_no_measurements() -> None:
+    # Without any measurement keys, no bits are read (so the bitstrings aren't validated)
+    result = css.CountsResult({"11": 2}, css.result.measurement_indices(cirq.Circuit()))
+    assert result.repetitions == 2
+    assert result.measurements == {}
+
+
+def test_counts_result_empty() -> None:
+    result = css.CountsResult({}, {"a": [0], "b": [1]}, dtype=bool)
+    assert result.params == cirq.ParamResolver({})
+    assert result.repetitions == 0
+    assert result.histogram(key="a") == collections.Counter()
+    assert result.measurements["a"].shape == (0, 1)
+    assert result.measurements["b"].dtype == bool
+
+
+def test_counts_result_packed() -> None:
+    counts = collections.Counter({"0" * 9 + "1": 2, "1" * 10: 1})
+    indices = {"a": list(range(9)), "b": [9]}
+    result = css.CountsResult(counts, indices, packed=True)
+    unpacked_result = css.CountsResult(counts, indices)
+
+    assert result.packed_measurements["a"].dtype == np.uint8
+    assert result.packed_measurements["a"].shape == (3, 2)
+    assert result.packed_measurements["b"].shape == (3, 1)
+    np.testing.assert_array_equal(result.packed_measurements["b"], [[128], [128], [128]])
+
+    np.testing.assert_array_equal(
+        result.unpack_measurements("a"), unpacked_result.measurements["a"]
+    )
+    for key in indices:
+        np.testing.assert_array_equal(result.measurements[key], unpacked_result.measurements[key])
+        np.testing.assert_array_equal(result.records[key], unpacked_result.records[key])
+    assert result == unpacked_result
+    assert result.histogram(key="a") == unpacked_result.histogram(key="a")
+
+    # Unpacked measurements should never be stored
+    assert result._measurements is None and result._records is None
@@ -12,9 +12,10 @@
 # limitations under the License.
 """A `cirq.Sampler` implementation for the SuperstaQ API."""
 
-from typing import List
+from typing import Dict, List
 
 import cirq
+import general_superstaq as gss
 
 import cirq_superstaq as css
 
@@ -43,6 +44,9 @@ class Sampler(cirq.Sampler):
         self,
         service: "css.service.Service",
         target: str,
+        packed: bool = False,
+        symbolic_sweeps: bool = False,
+        batched_polling: bool = False,
     ) -> None:
         """Constructs the sampler. Uers should get a sampler from the `sampler` method on
         `css.Service`.
@@ -50,22 +54,39 @@ class Sampler(cirq.Sampler):
         Args:
             service: The service used to create this sample.
             target: Backend on which to run the job.
+            packed: Whether returned results should store per-shot measurements bit-packed (see
+                `css.CountsResult`).
+            symbolic_sweeps: Whether to upload parameterized circuits along with their sweeps
+                (see `css.Service.create_sweep_jobs`) instead of resolving each point locally.
+            batched_polling: Whether to poll all of the outstanding jobs of a sweep with a single
+                request, if the API supports it (see `css.JobGroup`). By default, each outstanding
+                job is polled separately.
 
         Returns:
             None.
         """
         self._service = service
         self._target = target
+        self._packed = packed
+        self._symbolic_sweeps = symbolic_sweeps
+        self._batched_polling = batched_polling
 
     def run_sweep(
         self,
         program: cirq.AbstractCircuit,
         params: cirq.Sweepable,
         repetitions: int = 1,
-    ) -> List[cirq.ResultDict]:
+    ) -> List[css.CountsResult]:
         """Runs a sweep for the given Circuit. Note that this creates jobs for each of the sweeps in
         the given sweepable, and then blocks until all of jobs are complete.
 
+        All of the resolved circuits are submitted together (in as few requests as possible, see
+        `css.Service.create_jobs`) before any of the resulting jobs are polled. If this sampler
+        was constructed with `symbolic_sweeps=True`, the circuit is instead submitted once along
+        with a compact description of the sweep (see `css.Service.create_sweep_jobs`). The jobs are
+        then polled in rounds (see `css.as_completed`), and each result is processed as soon as its
+        job completes rather than in order.
+
         Ags:
             program: The circuit to sample from.
             params: The parameters to run with program.
@@ -73,18 +94,40 @@ class Sampler(cirq.Sampler):
 
         Returns:
             A list of Cirq results, one for each parameter resolver.
+
+        Raises:
+            SuperstaQException: If the API did not create exactly one job per parameter resolver.
+            TimeoutError: If not all of the jobs completed within two hours.
+            RuntimeError: If any of the jobs failed or was canceled.
         """
         resolvers = [resolver for resolver in cirq.to_resolvers(params)]
-        jobs = [
-            self._service.create_job(
-                circuit=cirq.resolve_parameters(program, resolver),
+        if self._symbolic_sweeps:
+            jobs = self._service.create_sweep_jobs(
+                circuit=program, params=params, repetitions=repetitions, target=self._target
+            )
+        else:
+            jobs = self._service.create_jobs(
+                circuits=[cirq.resolve_parameters(program, resolver) for resolver in resolvers],
                 repetitions=repetitions,
                 target=self._target,
             )
-            for resolver in resolvers
-        ]
-        job_counters = [job.counts() for job in jobs]
-        cirq_results = []
-        for counts, resolver in zip(job_counters, resolvers):
-            cirq_results.append(css.service.counts_to_results(counts, program, resolver))
-        return cirq_results
+        if len(jobs) != len(resolvers):
+            raise gss.SuperstaQException(
+                f"Expected {len(resolvers)} jobs (one per parameter resolver), but the API "
+                f"created {len(jobs)}."
+            )
+
+        # The positions of each job in `jobs` (the same `css.Job` may appear more than once)
+        positions: Dict[int, List[int]] = {}
+        for i, job in enumerate(jobs):
+            positions.setdefault(id(job), []).append(i)
+
+        indices = css.result.measurement_indices(program)
+        results_by_position: Dict[int, css.CountsResult] = {}
+        for job in css.as_completed(jobs, timeout=7200, batched=self._batched_polling):
+            i = positions[id(job)].pop(0)
+            counts = job.counts(timeout_seconds=0)
+            results_by_position[i] = css.CountsResult(
+                counts, indices, resolvers[i], packed=self._packed
+            )
+        return [results_by_position[i] for i in range(len(jobs))]
@@ -1,22 +1,68 @@
+import concurrent.futures
+import functools
 import json
-from typing import List, Sequence, Union
+import os
+import re
+import struct
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import cirq
+import general_superstaq as gss
+import numpy as np
+from cirq.protocols.json_serialization import CirqEncoder, SerializableByKey
 
 import cirq_superstaq as css
 
+DEFAULT_MAX_CHUNK_BYTES = 8 * 1024 * 1024
 
-def serialize_circuits(
-    circuits: Union[cirq.AbstractCircuit, Sequence[cirq.AbstractCircuit]]
-) -> str:
-    """Serialize Circuit(s) into a json string
+# Smaller batches of pulses are deserialized serially (see `deserialize_pulses`)
+DEFAULT_MIN_PARALLEL_PULSES = 64
 
-    Args:
-        circuits: a Circuit or list of Circuits to be serialized
+# The name under which the binary circuit format is advertised (see `serialize_circuits_binary`)
+BINARY_CIRCUIT_FORMAT = "css-binary-v1"
+_BINARY_MAGIC = b"CSSB\x01"
 
-    Returns:
-        str representing the serialized circuit(s)
+
+class _SerializableByKeyFound(Exception):
+    """Raised by `_CircuitEncoder` if it encounters an object which cirq serializes by key."""
+
+
+class _CircuitEncoder(CirqEncoder):
+    """A `CirqEncoder` which encodes circuits in a single pass, without indentation.
+
+    The JSON representation of each gate and qubit is memoized, so gates and qubits shared by many
+    operations (e.g. `cirq.X` or `css.AceCRPlusMinus`) are only converted once.
     """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Values are (object, json_dict) pairs, keeping objects alive so that ids are not reused
+        self._memo: Dict[int, Tuple[Any, Any]] = {}
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, (cirq.Gate, cirq.Qid)):
+            memo_entry = self._memo.get(id(o))
+            if memo_entry is None:
+                memo_entry = self._memo[id(o)] = (o, super().default(o))
+            return memo_entry[1]
+        if isinstance(o, SerializableByKey):
+            raise _SerializableByKeyFound
+        return super().default(o)
+
+    def circuit_to_dict(self, circuit: cirq.AbstractCircuit) -> Dict[str, Any]:
+        """Converts a circuit to a JSON dictionary, adding an `_UnconstrainedDevice` if needed."""
+        if isinstance(circuit, SerializableByKey):
+            raise _SerializableByKeyFound
+        circuit_dict = super().default(circuit)
+        if "device" not in circuit_dict:
+            circuit_dict["device"] = {"cirq_type": "_UnconstrainedDevice"}
+        return circuit_dict
+
+
+def _serialize_circuits_via_to_json(
+    circuits: Union[cirq.AbstractCircuit, Sequence[cirq.AbstractCircuit]]
+) -> str:
+    """Serialize Circuit(s) with `cirq.to_json`, then add any missing `device` attributes."""
     dt = json.loads(cirq.to_json(circuits))
     if isinstance(dt, list):
         for circuit_dt in dt:
@@ -29,6 +75,343 @@ def serialize_circuits(
     return json.dumps(dt)
 
 
+def _encode_circuits(
+    circuits: Union[cirq.AbstractCircuit, Sequence[cirq.AbstractCircuit]], encoder: _CircuitEncoder
+) -> str:
+    try:
+        if isinstance(circuits, cirq.AbstractCircuit):
+            return encoder.encode(encoder.circuit_to_dict(circuits))
+        return encoder.encode([encoder.circuit_to_dict(circuit) for circuit in circuits])
+    except _SerializableByKeyFound:
+        # e.g. circuits containing `cirq.CircuitOperation`s, which cirq serializes with context
+        return _serialize_circuits_via_to_json(circuits)
+
+
+def serialize_circuits(
+    circuits: Union[cirq.AbstractCircuit, Sequence[cirq.AbstractCircuit]]
+) -> str:
+    """Serialize Circuit(s) into a json string
+
+    The output is identical to serializing with `cirq.to_json` (and adding an `_UnconstrainedDevice`
+    to each circuit which doesn't have a device), but is generated in a single pass.
+
+    Args:
+        circuits: a Circuit or list of Circuits to be serialized
+
+    Returns:
+        str representing the serialized circuit(s)
+    """
+    return _encode_circuits(circuits, _CircuitEncoder())
+
+
+def serialize_circuit_chunks(
+    circuits: Sequence[cirq.AbstractCircuit],
+    max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+    max_chunk_size: Optional[int] = None,
+) -> List[Tuple[int, str]]:
+    """Serialize a list of Circuits into one or more json strings of bounded size
+
+    Each chunk is serialized exactly as `serialize_circuits` would serialize the corresponding
+    (contiguous) sublist of `circuits`, so chunks can be sent anywhere a serialized list of
+    circuits is expected (chunks containing e.g. `cirq.CircuitOperation`s are serialized as a
+    whole, since `cirq.to_json` shares serialization context between circuits). A circuit which is
+    larger than `max_chunk_bytes` on its own is placed in a chunk by itself.
+
+    Args:
+        circuits: a list of Circuits to be serialized
+        max_chunk_bytes: the maximum size in bytes of each serialized chunk
+        max_chunk_size: the maximum number of circuits in each chunk (or None for no limit)
+
+    Returns:
+        list of (number of circuits, serialized chunk) tuples, in the same order as `circuits`
+    """
+    chunks: List[Tuple[int, str]] = []
+    chunk: List[str] = []
+    chunk_start = chunk_bytes = 0
+
+    def _close_chunk(chunk_end: int) -> None:
+        serialized_chunk = "[" + ", ".join(chunk) + "]"
+        if '"_ContextualSerialization"' in serialized_chunk:
+            # `cirq.to_json` shares one serialization context across a whole list of circuits, so
+            # these can't be serialized independently of the rest of their chunk
+            serialized_chunk = _serialize_circuits_via_to_json(circuits[chunk_start:chunk_end])
+        chunks.append((len(chunk), serialized_chunk))
+
+    # Share memoized gates and qubits between circuits
+    encoder = _CircuitEncoder()
+    for i, circuit in enumerate(circuits):
+        serialized_circuit = _encode_circuits(circuit, encoder)
+        # Each circuit is accompanied by either a separating ", " or one of the enclosing "[]"
+        circuit_bytes = len(serialized_circuit) + 2
+
+        if chunk and (
+            chunk_bytes + circuit_bytes > max_chunk_bytes
+            or (max_chunk_size is not None and len(chunk) >= max_chunk_size)
+        ):
+            _close_chunk(i)
+            chunk, chunk_start, chunk_bytes = [], i, 0
+
+        chunk.append(serialized_circuit)
+        chunk_bytes += circuit_bytes
+
+    if chunk:
+        _close_chunk(len(circuits))
+
+    return chunks
+
+
+# Placeholder for each float parameter extracted from the JSON of a gate in the binary format
+_BINARY_PARAM = {"cirq_type": "_BinaryParam"}
+_BINARY_GATE, _BINARY_OPERATION = 0, 1
+
+
+def _extract_params(value: Any, params: List[float]) -> Any:
+    """Replaces every float in a JSON value with `_BINARY_PARAM`, appending it to `params`."""
+    if isinstance(value, float):
+        params.append(value)
+        return _BINARY_PARAM
+    if isinstance(value, dict):
+        return {key: _extract_params(val, params) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_extract_params(val, params) for val in value]
+    return value
+
+
+def _insert_params(value: Any, params: Iterator[float]) -> Any:
+    """Inverse of `_extract_params`: replaces each `_BINARY_PARAM` with the next parameter."""
+    if value == _BINARY_PARAM:
+        return next(params)
+    if isinstance(value, dict):
+        return {key: _insert_params(val, params) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_insert_params(val, params) for val in value]
+    return value
+
+
+class _BinaryCircuitWriter:
+    """Builds the interned tables and integer/float streams of the binary circuit format."""
+
+    def __init__(self) -> None:
+        self._encoder = _CircuitEncoder()
+        self._template_indices: Dict[str, int] = {}
+        self._entry_indices: Dict[Tuple[int, int, Tuple[float, ...]], int] = {}
+        # Indices of gates and qubits by id, keeping a reference to each so that ids are not reused
+        self._object_indices: Dict[int, Tuple[Any, int]] = {}
+        self._qubit_indices: Dict[cirq.Qid, int] = {}
+        self._tag_indices: Dict[str, int] = {}
+
+        self.entries: List[List[int]] = []
+        self.qubits: List[Any] = []
+        self.tags: List[Any] = []
+        self.params: List[float] = []
+        self.ints: List[int] = []
+
+    def _to_json_dict(self, obj: Any) -> Any:
+        try:
+            return json.loads(self._encoder.encode(obj))
+        except _SerializableByKeyFound:
+            return json.loads(cirq.to_json(obj))
+
+    def _entry_index(self, obj: Any, kind: int) -> int:
+        """Returns the index of a gate (or operation) in the gate table, adding it if necessary."""
+        memo_entry = self._object_indices.get(id(obj))
+        if memo_entry is None:
+            params: List[float] = []
+            template = json.dumps(_extract_params(self._to_json_dict(obj), params))
+            template_index = self._template_indices.setdefault(
+                template, len(self._template_indices)
+            )
+            key = (kind, template_index, tuple(params))
+            if key not in self._entry_indices:
+                self._entry_indices[key] = len(self.entries)
+                self.entries.append([kind, template_index, len(params)])
+                self.params.extend(params)
+            memo_entry = self._object_indices[id(obj)] = (obj, self._entry_indices[key])
+        return memo_entry[1]
+
+    def _qubit_index(self, qubit: cirq.Qid) -> int:
+        memo_entry = self._object_indices.get(id(qubit))
+        if memo_entry is None:
+            if qubit not in self._qubit_indices:
+                self._qubit_indices[qubit] = len(self.qubits)
+                self.qubits.append(self._to_json_dict(qubit))
+            memo_entry = self._object_indices[id(qubit)] = (qubit, self._qubit_indices[qubit])
+        return memo_entry[1]
+
+    def _tags_index(self, tags: Tuple[Any, ...]) -> int:
+        """Returns one plus the index of the given tags in the tag table (0 means no tags)."""
+        if not tags:
+            return 0
+        tags_dict = self._to_json_dict(list(tags))
+        key = json.dumps(tags_dict)
+        if key not in self._tag_indices:
+            self._tag_indices[key] = len(self.tags)
+            self.tags.append(tags_dict)
+        return self._tag_indices[key] + 1
+
+    def write_circuit(self, circuit: cirq.AbstractCircuit) -> None:
+        self.ints += [isinstance(circuit, cirq.FrozenCircuit), len(circuit)]
+        for moment in circuit:
+            self.ints.append(len(moment))
+            for op in moment:
+                tags_index = self._tags_index(op.tags)
+                op = op.untagged
+                if type(op) is cirq.GateOperation:
+                    gate_index = self._entry_index(op.gate, _BINARY_GATE)
+                    self.ints += [gate_index, tags_index, len(op.qubits)]
+                    self.ints.extend(self._qubit_index(qubit) for qubit in op.qubits)
+                else:
+                    self.ints += [self._entry_index(op, _BINARY_OPERATION), tags_index, 0]
+
+    def to_bytes(self) -> bytes:
+        header = {
+            "templates": [json.loads(template) for template in self._template_indices],
+            "entries": self.entries,
+            "qubits": self.qubits,
+            "tags": self.tags,
+        }
+        header_bytes = json.dumps(header).encode()
+        return b"".join(
+            [
+                _BINARY_MAGIC,
+                struct.pack("<I", len(header_bytes)),
+                header_bytes,
+                struct.pack("<I", len(self.params)),
+                np.asarray(self.params, dtype="<f8").tobytes(),
+                struct.pack("<I", len(self.ints)),
+                np.asarray(self.ints, dtype="<u4").tobytes(),
+            ]
+        )
+
+
+def serialize_circuits_binary(
+    circuits: Union[cirq.AbstractCircuit, Sequence[cirq.AbstractCircuit]]
+) -> bytes:
+    """Serialize Circuit(s) into the compact binary circuit format
+
+    Rather than repeating the JSON of every gate and qubit for each operation, this format stores
+    each distinct qubit, tag, and gate (with its float parameters replaced by placeholders) once
+    in a JSON header, followed by a packed array of the float parameters of each gate and a packed
+    array of integers describing the moments and operations of each circuit (with gates, qubits,
+    and tags referenced by their index in the header). Operations which are not applications of a
+    gate (e.g. `cirq.CircuitOperation`) are stored as a whole in place of a gate.
+
+    Args:
+        circuits: a Circuit or list of Circuits to be serialized
+
+    Returns:
+        bytes representing the serialized circuit(s)
+    """
+    writer = _BinaryCircuitWriter()
+    if isinstance(circuits, cirq.AbstractCircuit):
+        writer.ints += [1, 1]
+        writer.write_circuit(circuits)
+    else:
+        writer.ints += [0, len(circuits)]
+        for circuit in circuits:
+            writer.write_circuit(circuit)
+    return writer.to_bytes()
+
+
+def serialize_circuit_chunks_binary(
+    circuits: Sequence[cirq.AbstractCircuit],
+    max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+    max_chunk_size: Optional[int] = None,
+) -> List[Tuple[int, bytes]]:
+    """Serialize a list of Circuits into one or more binary chunks of bounded size
+
+    Circuits are first split into chunks of `max_chunk_size`, and any chunk whose serialization is
+    larger than `max_chunk_bytes` is then repeatedly halved. A circuit which is larger than
+    `max_chunk_bytes` on its own is placed in a chunk by itself.
+
+    Args:
+        circuits: a list of Circuits to be serialized
+        max_chunk_bytes: the maximum size in bytes of each serialized chunk
+        max_chunk_size: the maximum number of circuits in each chunk (or None for no limit)
+
+    Returns:
+        list of (number of circuits, serialized chunk) tuples, in the same order as `circuits`
+    """
+    chunk_size = max_chunk_size or max(len(circuits), 1)
+    # Stack of (start, stop) ranges of circuits still to be serialized, with the first on top
+    pending = [
+        (start, min(start + chunk_size, len(circuits)))
+        for start in range(0, len(circuits), chunk_size)
+    ][::-1]
+
+    chunks: List[Tuple[int, bytes]] = []
+    while pending:
+        start, stop = pending.pop()
+        serialized_chunk = serialize_circuits_binary(circuits[start:stop])
+        if len(serialized_chunk) > max_chunk_bytes and stop - start > 1:
+            middle = (start + stop) // 2
+            pending += [(middle, stop), (start, middle)]
+        else:
+            chunks.append((stop - start, serialized_chunk))
+    return chunks
+
+
+def deserialize_circuits_binary(serialized_circuits: bytes) -> List[cirq.AbstractCircuit]:
+    """Deserialize Circuit(s) serialized in the binary circuit format
+
+    Args:
+        serialized_circuits: bytes generated via serialize_circuits_binary()
+
+    Returns:
+        the list of Circuits that was serialized (containing a single Circuit if a single Circuit
+        was serialized)
+
+    Raises:
+        ValueError: if `serialized_circuits` is not in the binary circuit format.
+    """
+    if not serialized_circuits.startswith(_BINARY_MAGIC):
+        raise ValueError("Serialized circuits are not in the binary circuit format.")
+
+    header_start = len(_BINARY_MAGIC) + 4
+    (header_size,) = struct.unpack_from("<I", serialized_circuits, header_start - 4)
+    header_end = header_start + header_size
+    header = json.loads(serialized_circuits[header_start:header_end])
+    (num_params,) = struct.unpack_from("<I", serialized_circuits, header_end)
+    params = np.frombuffer(serialized_circuits, "<f8", num_params, header_end + 4).tolist()
+    params_end = header_end + 4 + 8 * num_params
+    (num_ints,) = struct.unpack_from("<I", serialized_circuits, params_end)
+    ints = iter(np.frombuffer(serialized_circuits, "<u4", num_ints, params_end + 4).tolist())
+
+    resolvers = [css.custom_gates.custom_resolver, *cirq.DEFAULT_RESOLVERS]
+
+    def read_json(json_value: Any) -> Any:
+        return cirq.read_json(json_text=json.dumps(json_value), resolvers=resolvers)
+
+    param_iter = iter(params)
+    entries = [
+        read_json(_insert_params(header["templates"][template_index], param_iter))
+        for _, template_index, _ in header["entries"]
+    ]
+    is_gate = [kind == _BINARY_GATE for kind, _, _ in header["entries"]]
+    qubits = read_json(header["qubits"])
+    tags = [(), *(tuple(tags) for tags in read_json(header["tags"]))]
+
+    next(ints)  # Whether a single circuit was serialized
+    circuits: List[cirq.AbstractCircuit] = []
+    for _ in range(next(ints)):
+        circuit_type = cirq.FrozenCircuit if next(ints) else cirq.Circuit
+        moments = []
+        for _ in range(next(ints)):
+            ops = []
+            for _ in range(next(ints)):
+                entry_index, tags_index, num_qubits = next(ints), next(ints), next(ints)
+                op_qubits = [qubits[next(ints)] for _ in range(num_qubits)]
+                op = (
+                    entries[entry_index].on(*op_qubits)
+                    if is_gate[entry_index]
+                    else entries[entry_index]
+                )
+                ops.append(op.with_tags(*tags[tags_index]) if tags_index else op)
+            moments.append(cirq.Moment(ops))
+        circuits.append(circuit_type(moments))
+    return circuits
+
+
 def deserialize_circuits(serialized_circuits: str) -> List[cirq.Circuit]:
     """Deserialize serialized Circuit(s)
 
@@ -38,8 +421,383 @@ def deserialize_circuits(serialized_circuits: str) -> List[cirq.Circuit]:
     Returns:
         the Circuit or list of Circuits that was serialized
     """
-    resolvers = [css.custom_gates.custom_resolver, *cirq.DEFAULT_RESOLVERS]
-    circuits = cirq.read_json(json_text=serialized_circuits, resolvers=resolvers)
+    circuits = cirq.read_json(json_text=serialized_circuits, resolvers=_resolvers())
     if isinstance(circuits, cirq.Circuit):
         return [circuits]
     return circuits
+
+
+def _trusted_gate_operation(json_dict: Dict[str, Any]) -> cirq.GateOperation:
+    """Builds a `cirq.GateOperation` without validating its qubits against its gate."""
+    op = cirq.GateOperation.__new__(cirq.GateOperation)
+    op._gate = json_dict["gate"]
+    op._qubits = tuple(json_dict["qubits"])
+    return op
+
+
+# The attributes of a `cirq.Moment` set by `_trusted_moment`, and the rest (which `cirq.Moment`
+# uses to cache values computed on demand, and so are left unset)
+_MOMENT_ATTRIBUTES = ("_operations", "_qubit_to_op", "_qubits")
+_MOMENT_CACHE_ATTRIBUTES = tuple(
+    attribute for attribute in vars(cirq.Moment()) if attribute not in _MOMENT_ATTRIBUTES
+)
+
+
+def _trusted_moment(json_dict: Dict[str, Any]) -> cirq.Moment:
+    """Builds a `cirq.Moment` without flattening its operations or checking them for overlaps."""
+    moment = cirq.Moment.__new__(cirq.Moment)
+    moment._operations = tuple(json_dict["operations"])
+    moment._qubit_to_op = {qubit: op for op in moment._operations for qubit in op.qubits}
+    moment._qubits = frozenset(moment._qubit_to_op)
+    for attribute in _MOMENT_CACHE_ATTRIBUTES:
+        setattr(moment, attribute, None)
+    return moment
+
+
+def _trusted_circuit(json_dict: Dict[str, Any]) -> cirq.Circuit:
+    """Builds a `cirq.Circuit` from a list of moments, without reinserting their operations."""
+    return cirq.Circuit()._with_sliced_moments(json_dict["moments"])
+
+
+@functools.lru_cache(maxsize=None)
+def _line_qubit(x: int) -> cirq.LineQubit:
+    return cirq.LineQubit(x)
+
+
+@functools.lru_cache(maxsize=None)
+def _grid_qubit(row: int, col: int) -> cirq.GridQubit:
+    return cirq.GridQubit(row, col)
+
+
+def _trusted_constructors_supported() -> bool:
+    """Returns whether `_trusted_gate_operation`, `_trusted_moment`, and `_trusted_circuit` build
+    valid objects with the installed version of cirq.
+
+    These set private attributes of cirq objects directly, so if the internals of any of these
+    classes have changed, the (slower) public constructors should be used instead.
+    """
+    q0, q1 = cirq.LineQubit.range(2)
+    expected_op = cirq.CZ(q0, q1)
+    expected_circuit = cirq.Circuit(cirq.Moment(expected_op), cirq.Moment())
+    empty_moment_attributes = vars(cirq.Moment())
+    if not (
+        {"_gate", "_qubits"} <= vars(expected_op).keys()
+        and set(_MOMENT_ATTRIBUTES) <= empty_moment_attributes.keys()
+        and all(empty_moment_attributes[name] is None for name in _MOMENT_CACHE_ATTRIBUTES)
+    ):
+        return False
+
+    try:
+        op = _trusted_gate_operation({"gate": cirq.CZ, "qubits": [q0, q1]})
+        moment = _trusted_moment({"operations": [op]})
+        circuit = _trusted_circuit({"moments": [moment, _trusted_moment({"operations": []})]})
+        return (
+            circuit == expected_circuit
+            and hash(op) == hash(expected_op)
+            and moment.operation_at(q1) == expected_op
+            and circuit.all_qubits() == expected_circuit.all_qubits()
+        )
+    except Exception:
+        return False
+
+
+# Constructors for the types which make up the bulk of compiled circuits
+_TRUSTED_CONSTRUCTORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "LineQubit": lambda json_dict: _line_qubit(json_dict["x"]),
+    "GridQubit": lambda json_dict: _grid_qubit(json_dict["row"], json_dict["col"]),
+}
+if _trusted_constructors_supported():
+    _TRUSTED_CONSTRUCTORS.update(
+        GateOperation=_trusted_gate_operation,
+        Moment=_trusted_moment,
+        Circuit=_trusted_circuit,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _resolvers() -> Tuple[cirq.JsonResolver, ...]:
+    return (css.custom_gates.custom_resolver, *cirq.DEFAULT_RESOLVERS)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_constructor(cirq_type: str) -> Callable[[Dict[str, Any]], Any]:
+    """Returns a function which builds an object of the given type from its JSON dictionary.
+
+    Raises:
+        ValueError: if `cirq_type` cannot be resolved.
+    """
+    for resolver in _resolvers():
+        cls = resolver(cirq_type)
+        if cls is not None:
+            break
+    else:
+        raise ValueError(f"Could not resolve type '{cirq_type}' during deserialization")
+
+    from_json_dict = getattr(cls, "_from_json_dict_", None)
+    if from_json_dict is not None:
+        return lambda json_dict: from_json_dict(**json_dict)
+    return lambda json_dict: cls(
+        **{key: val for key, val in json_dict.items() if key != "cirq_type"}
+    )
+
+
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+class _CompiledObjectHook:
+    """A `json.loads` object hook which builds each distinct object with primitive fields once.
+
+    Compiled circuits tend to repeat a few (immutable) gates, so these are shared. To bound memory
+    usage (e.g. with many distinct rotation angles), the shared objects are forgotten once there
+    are `max_shared_objects` of them.
+    """
+
+    def __init__(self, max_shared_objects: int = 4096) -> None:
+        self.max_shared_objects = max_shared_objects
+        self._objects: Dict[Tuple[Any, ...], Any] = {}
+
+    def __call__(self, json_dict: Dict[str, Any]) -> Any:
+        cirq_type = json_dict.get("cirq_type")
+        if cirq_type is None:
+            return json_dict
+
+        constructor = _TRUSTED_CONSTRUCTORS.get(cirq_type)
+        if constructor is not None:
+            return constructor(json_dict)
+
+        if not all(type(val) in _PRIMITIVE_TYPES for val in json_dict.values()):
+            return _json_constructor(cirq_type)(json_dict)
+
+        # Include types, so that e.g. `1` and `1.0` are distinguished
+        key = tuple((key, type(val), val) for key, val in json_dict.items())
+        obj = self._objects.get(key)
+        if obj is None:
+            if len(self._objects) >= self.max_shared_objects:
+                self._objects.clear()
+            obj = self._objects[key] = _json_constructor(cirq_type)(json_dict)
+        return obj
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_whitespace(json_text: str, index: int) -> int:
+    return _WHITESPACE.match(json_text, index).end()  # type: ignore[union-attr]
+
+
+def _iter_json_list(json_text: str, decoder: json.JSONDecoder) -> Iterator[Tuple[Any, int, int]]:
+    """Incrementally decodes the elements of a JSON list.
+
+    Args:
+        json_text: The JSON text of a list (or of a single value, which is treated as a list
+            containing only that value).
+        decoder: The decoder with which to decode each element.
+
+    Yields:
+        Tuples `(element, start, end)`, where `json_text[start:end]` is the text of `element`.
+
+    Raises:
+        JSONDecodeError: If `json_text` is not valid JSON.
+    """
+    index = _skip_whitespace(json_text, 0)
+    if not json_text.startswith("[", index):
+        value, index = decoder.raw_decode(json_text, index)
+        yield value, _skip_whitespace(json_text, 0), index
+    else:
+        index = _skip_whitespace(json_text, index + 1)
+        while not json_text.startswith("]", index):
+            value, end = decoder.raw_decode(json_text, index)
+            yield value, index, end
+            index = _skip_whitespace(json_text, end)
+            if json_text.startswith(",", index):
+                index = _skip_whitespace(json_text, index + 1)
+                if json_text.startswith("]", index):
+                    raise json.JSONDecodeError("Expecting value", json_text, index)
+            elif not json_text.startswith("]", index):
+                raise json.JSONDecodeError("Expecting ',' delimiter", json_text, index)
+        index += 1
+
+    if _skip_whitespace(json_text, index) != len(json_text):
+        raise json.JSONDecodeError("Extra data", json_text, index)
+
+
+def iter_deserialize_compiled_circuits(serialized_circuits: str) -> Iterator[cirq.Circuit]:
+    """Incrementally deserialize Circuit(s) returned by the SuperstaQ API
+
+    Like `deserialize_compiled_circuits`, but the circuits of a serialized list are decoded one at
+    a time as the iterator is advanced, so that the list is never held in memory as a whole.
+
+    Args:
+        serialized_circuits: json str generated via serialize_circuits()
+
+    Yields:
+        each Circuit that was serialized
+    """
+    if '"_ContextualSerialization"' in serialized_circuits:
+        yield from deserialize_circuits(serialized_circuits)
+        return
+
+    decoder = json.JSONDecoder(object_hook=_CompiledObjectHook())
+    for circuit, _, _ in _iter_json_list(serialized_circuits, decoder):
+        yield circuit
+
+
+def _compiled_circuit_getters(serialized_circuits: str) -> List[Callable[[], cirq.Circuit]]:
+    """Finds the circuits in the output of `serialize_circuits`, without deserializing them.
+
+    Args:
+        serialized_circuits: json str generated via serialize_circuits()
+
+    Returns:
+        A function for each serialized circuit, which deserializes (only) that circuit (as in
+        `deserialize_compiled_circuits`) when called.
+    """
+    if '"_ContextualSerialization"' in serialized_circuits:
+        circuits = deserialize_circuits(serialized_circuits)
+        return [functools.partial(circuits.__getitem__, index) for index in range(len(circuits))]
+
+    # The shared hook lets circuits decoded from the same list share their gates and qubits
+    decoder = json.JSONDecoder(object_hook=_CompiledObjectHook())
+
+    def decode(start: int) -> cirq.Circuit:
+        return decoder.raw_decode(serialized_circuits, start)[0]
+
+    # Only the extent of each circuit is needed here, so its (nested) objects are discarded
+    scanner = json.JSONDecoder(object_pairs_hook=lambda pairs: None)
+    return [
+        functools.partial(decode, start)
+        for _, start, _ in _iter_json_list(serialized_circuits, scanner)
+    ]
+
+
+def deserialize_compiled_circuits(serialized_circuits: str) -> List[cirq.Circuit]:
+    """Deserialize Circuit(s) returned by the SuperstaQ API
+
+    This is equivalent to `deserialize_circuits`, but around twice as fast for large numbers of
+    circuits. Each type is resolved only once, and (if the installed version of cirq is
+    compatible) circuits are assembled directly from their serialized moments, without validating
+    them. It should therefore only be used for trusted input, such as the compiled circuits
+    returned by the SuperstaQ API.
+
+    Args:
+        serialized_circuits: json str generated via serialize_circuits()
+
+    Returns:
+        the Circuit or list of Circuits that was serialized
+    """
+    return list(iter_deserialize_compiled_circuits(serialized_circuits))
+
+
+def deserialize_pulses(
+    serialized_pulses: Union[str, Sequence[str]],
+    max_workers: Optional[int] = 1,
+    min_parallel_size: int = DEFAULT_MIN_PARALLEL_PULSES,
+) -> List[Any]:
+    """Deserializes the pulse sequences (or schedules) returned by the SuperstaQ API.
+
+    Args:
+        serialized_pulses: Either a list of pulses serialized as a whole with
+            `gss.converters.serialize`, or a list of separately serialized pulses (one per
+            circuit).
+        max_workers: The number of worker processes with which to deserialize separately
+            serialized pulses (or None to use one per CPU). If this is 1, pulses are deserialized
+            in this process.
+        min_parallel_size: The minimum number of separately serialized pulses to deserialize in
+            worker processes. Smaller batches are deserialized in this process, because starting
+            the workers would take longer.
+
+    Returns:
+        The deserialized pulses, in order.
+
+    Note that the deserialized pulses are sent back from the workers by pickling them, so the
+    speedup is limited by the time taken to unpickle them in this process.
+    """
+    if isinstance(serialized_pulses, str):
+        # A list serialized as a whole can't be split between workers
+        return gss.converters.deserialize(serialized_pulses)
+
+    num_workers = max_workers or os.cpu_count() or 1
+    if num_workers == 1 or len(serialized_pulses) < max(min_parallel_size, 2):
+        return [gss.converters.deserialize(pulse) for pulse in serialized_pulses]
+
+    # Send each worker a few batches, to balance the load without a round trip per pulse
+    chunksize = -(-len(serialized_pulses) // (4 * num_workers))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        return list(
+            executor.map(gss.converters.deserialize, serialized_pulses, chunksize=chunksize)
+        )
+
+
+def _sweep_to_dict(sweep: cirq.Sweep) -> Optional[Dict[str, Any]]:
+    """Returns a compact description of a Linspace, Points, Product or Zip sweep, if possible."""
+    if isinstance(sweep, cirq.Linspace):
+        return {"linspace": [str(sweep.key), float(sweep.start), float(sweep.stop), sweep.length]}
+    if isinstance(sweep, cirq.Points):
+        return {"points": [str(sweep.key), [float(point) for point in sweep.points]]}
+    if isinstance(sweep, (cirq.Product, cirq.Zip)):
+        factors = [
+            _sweep_to_dict(factor)
+            for factor in (sweep.factors if isinstance(sweep, cirq.Product) else sweep.sweeps)
+        ]
+        if factors and None not in factors:
+            return {"product" if isinstance(sweep, cirq.Product) else "zip": factors}
+    return None
+
+
+def _dict_to_sweep(sweep_dict: Dict[str, Any]) -> cirq.Sweep:
+    """Rebuilds a Linspace, Points, Product or Zip sweep from its compact description."""
+    if "linspace" in sweep_dict:
+        key, start, stop, length = sweep_dict["linspace"]
+        return cirq.Linspace(key, start, stop, length)
+    if "points" in sweep_dict:
+        key, points = sweep_dict["points"]
+        return cirq.Points(key, points)
+    if "product" in sweep_dict:
+        return cirq.Product(*(_dict_to_sweep(factor) for factor in sweep_dict["product"]))
+    return cirq.Zip(*(_dict_to_sweep(factor) for factor in sweep_dict["zip"]))
+
+
+def serialize_sweep(circuit: cirq.AbstractCircuit, params: cirq.Sweepable) -> str:
+    """Serialize a sweep over the parameters of a Circuit into a compact json string
+
+    Linspace, Points, and Products or Zips thereof are serialized as a compact description of the
+    sweep itself. Any other Sweepable is serialized as a table containing the value of each of the
+    circuit's symbols at every point of the sweep.
+
+    Args:
+        circuit: the (parameterized) Circuit to be swept
+        params: the Sweepable defining the parameter values at each point of the sweep
+
+    Returns:
+        str representing the serialized sweep
+    """
+    if isinstance(params, cirq.Sweep):
+        sweep_dict = _sweep_to_dict(params)
+        if sweep_dict is not None:
+            return json.dumps(sweep_dict)
+
+    resolvers = list(cirq.to_resolvers(params))
+    symbols = sorted(cirq.parameter_names(circuit))
+    values = np.array(
+        [[resolver.value_of(symbol) for symbol in symbols] for resolver in resolvers],
+        dtype=float,
+    ).reshape(len(resolvers), len(symbols))
+
+    return json.dumps({"table": {"symbols": symbols, "values": values.tolist()}})
+
+
+def deserialize_sweep(serialized_sweep: str) -> List[cirq.ParamResolver]:
+    """Deserialize a serialized sweep into the ParamResolvers for each of its points
+
+    Args:
+        serialized_sweep: json str generated via serialize_sweep()
+
+    Returns:
+        a list of ParamResolvers, one for each point of the sweep (in order)
+    """
+    sweep_dict = json.loads(serialized_sweep)
+    if "table" not in sweep_dict:
+        return list(cirq.to_resolvers(_dict_to_sweep(sweep_dict)))
+
+    symbols = sweep_dict["table"]["symbols"]
+    return [cirq.ParamResolver(dict(zip(symbols, row))) for row in sweep_dict["table"]["values"]]
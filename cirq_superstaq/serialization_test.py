@@ -1,6 +1,11 @@
+import json
+from typing import List, Sequence, Union
 from unittest import mock
 
 import cirq
+import general_superstaq as gss
+import pytest
+import sympy
 
 import cirq_superstaq as css
 
@@ -37,3 +42,407 @@ def test_removed_device_circuit_atrribute(mock_cirq_to_json: mock.MagicMock) ->
     serialized_circuits = css.serialization.serialize_circuits(circuits)
     assert isinstance(serialized_circuits, str)
     assert css.serialization.deserialize_circuits(serialized_circuits) == circuits
+
+
+def test_serialize_circuits_matches_to_json() -> None:
+    qubits = cirq.LineQubit.range(3)
+    theta = sympy.Symbol("theta")
+    circuit = cirq.Circuit(
+        css.ZZSwapGate(0.3).on(qubits[0], qubits[1]),
+        css.AceCRMinusPlus(qubits[0], qubits[1]),
+        css.AceCR("+-", 1.2).on(qubits[1], qubits[2]),
+        css.ParallelRGate(0.1, 0.2, 2).on(qubits[0], qubits[2]),
+        css.Barrier(3).on(*qubits),
+        css.ParallelGates(cirq.X, css.ZX).on(*qubits),
+        css.RGate(theta, 0.2).on(qubits[0]).with_tags("tag"),
+        cirq.PhasedXZGate(x_exponent=0.1, z_exponent=0.2, axis_phase_exponent=0.3)(qubits[1]),
+        cirq.measure(*qubits, key="m"),
+    )
+    circuits = [circuit, cirq.testing.random_circuit(qubits, 10, 0.8, random_state=1234)]
+
+    cases: List[Union[cirq.AbstractCircuit, Sequence[cirq.AbstractCircuit]]] = [
+        circuit,
+        circuits,
+        circuits[::-1],
+        [],
+        cirq.Circuit(),
+    ]
+    for circuits_to_serialize in cases:
+        serialized_circuits = css.serialization.serialize_circuits(circuits_to_serialize)
+        assert serialized_circuits == css.serialization._serialize_circuits_via_to_json(
+            circuits_to_serialize
+        )
+
+    serialized_circuits = css.serialization.serialize_circuits(circuits)
+    assert css.serialization.deserialize_circuits(serialized_circuits) == circuits
+
+
+def test_serialize_circuits_serializable_by_key() -> None:
+    qubits = cirq.LineQubit.range(2)
+    subcircuit = cirq.FrozenCircuit(cirq.CX(*qubits), css.ZX(*qubits))
+    circuits = [cirq.Circuit(cirq.CircuitOperation(subcircuit)), cirq.Circuit(cirq.H(qubits[0]))]
+
+    cases: List[Union[cirq.AbstractCircuit, Sequence[cirq.AbstractCircuit]]] = [
+        circuits,
+        circuits[0],
+        subcircuit,
+    ]
+    for circuits_to_serialize in cases:
+        serialized_circuits = css.serialization.serialize_circuits(circuits_to_serialize)
+        assert serialized_circuits == css.serialization._serialize_circuits_via_to_json(
+            circuits_to_serialize
+        )
+
+    chunks = css.serialization.serialize_circuit_chunks(circuits, max_chunk_size=1)
+    assert [num_circuits for num_circuits, _ in chunks] == [1, 1]
+    for (_, serialized_circuits), circuit in zip(chunks, circuits):
+        assert css.serialization.deserialize_circuits(serialized_circuits) == [circuit]
+
+
+def test_deserialize_compiled_circuits() -> None:
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        css.ZZSwapGate(0.3).on(qubits[0], qubits[1]),
+        css.AceCRMinusPlus(qubits[0], qubits[1]),
+        css.Barrier(3).on(*qubits),
+        css.ParallelGates(cirq.X, css.ZX).on(*qubits),
+        css.RGate(sympy.Symbol("theta"), 0.2).on(qubits[0]).with_tags("tag"),
+        cirq.CZPowGate(exponent=1).on(*qubits[:2]),
+        cirq.CZPowGate(exponent=1.0).on(*qubits[:2]),
+        cirq.CZPowGate(exponent=1.0).on(*qubits[1:]),
+        cirq.rz(0.1).on(cirq.GridQubit(1, 2)),
+        cirq.measure(*qubits, key="m"),
+    )
+    circuits = [circuit, cirq.testing.random_circuit(qubits, 10, 0.8, random_state=1234)]
+
+    serialized_circuits = css.serialization.serialize_circuits(circuits)
+    compiled_circuits = css.serialization.deserialize_compiled_circuits(serialized_circuits)
+    assert compiled_circuits == css.serialization.deserialize_circuits(serialized_circuits)
+    assert cirq.measurement_key_names(compiled_circuits[0]) == {"m"}
+    for compiled_moment, moment in zip(compiled_circuits[0], circuit):
+        assert compiled_moment.qubits == moment.qubits
+        for qubit in moment.qubits:
+            assert compiled_moment.operation_at(qubit) == moment.operation_at(qubit)
+
+    # Repeated gates should be shared, but only between identical serializations
+    cz_gates = [
+        gate
+        for _, _, gate in compiled_circuits[0].findall_operations_with_gate_type(cirq.CZPowGate)
+    ]
+    assert [type(gate.exponent) for gate in cz_gates] == [int, float, float]
+    assert cz_gates[1] is cz_gates[2]
+
+    serialized_circuit = css.serialization.serialize_circuits(circuit)
+    assert css.serialization.deserialize_compiled_circuits(serialized_circuit) == [circuit]
+
+    subcircuit_op = cirq.CircuitOperation(cirq.FrozenCircuit(cirq.CX(*qubits[:2])))
+    serialized_circuit = css.serialization.serialize_circuits(cirq.Circuit(subcircuit_op))
+    assert css.serialization.deserialize_compiled_circuits(serialized_circuit) == [
+        cirq.Circuit(subcircuit_op)
+    ]
+
+    serialized_circuit = '{"cirq_type": "Circuit", "moments": [], "metadata": {"key": "value"}}'
+    assert css.serialization.deserialize_compiled_circuits(serialized_circuit) == [cirq.Circuit()]
+
+    with pytest.raises(ValueError, match="Could not resolve type 'NotAGate'"):
+        _ = css.serialization.deserialize_compiled_circuits('{"cirq_type": "NotAGate"}')
+
+
+def test_trusted_moment() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    moments = [
+        css.serialization._trusted_moment({"operations": [cirq.measure(q0, key="m")]}),
+        css.serialization._trusted_moment({"operations": [cirq.X(q1)]}),
+    ]
+
+    for moment in moments:
+        for attribute in css.serialization._MOMENT_CACHE_ATTRIBUTES:
+            assert getattr(moment, attribute) is None
+
+    # Values cached by one moment should not leak into any other
+    assert cirq.measurement_key_names(moments[0]) == {"m"}
+    assert cirq.measurement_key_names(moments[1]) == set()
+    assert moments[1] == cirq.Moment(cirq.X(q1))
+
+
+def test_trusted_constructors_fallback() -> None:
+    assert css.serialization._trusted_constructors_supported()
+    assert "Moment" in css.serialization._TRUSTED_CONSTRUCTORS
+
+    # Incompatible versions of cirq should be detected
+    with mock.patch("cirq_superstaq.serialization.vars", return_value={}, create=True):
+        assert not css.serialization._trusted_constructors_supported()
+    with mock.patch("cirq_superstaq.serialization._MOMENT_CACHE_ATTRIBUTES", ("_operations",)):
+        assert not css.serialization._trusted_constructors_supported()
+    with mock.patch.object(cirq.Circuit, "_with_sliced_moments", side_effect=AttributeError):
+        assert not css.serialization._trusted_constructors_supported()
+    with mock.patch("cirq_superstaq.serialization._trusted_moment", return_value=cirq.Moment()):
+        assert not css.serialization._trusted_constructors_supported()
+    with mock.patch(
+        "cirq_superstaq.serialization._trusted_gate_operation", side_effect=AttributeError
+    ):
+        assert not css.serialization._trusted_constructors_supported()
+
+    # ... in which case circuits should be built with the public constructors
+    qubits = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(qubits[0]), cirq.CX(*qubits), cirq.measure(*qubits, key="m"))
+    serialized_circuits = css.serialization.serialize_circuits([circuit, circuit])
+    with mock.patch.dict(css.serialization._TRUSTED_CONSTRUCTORS, clear=True):
+        assert css.serialization.deserialize_compiled_circuits(serialized_circuits) == [
+            circuit,
+            circuit,
+        ]
+
+
+def test_iter_deserialize_compiled_circuits() -> None:
+    qubits = cirq.LineQubit.range(2)
+    circuits = [
+        cirq.Circuit(cirq.X(qubits[0]) ** 0.5, css.ZX(*qubits), cirq.X(qubits[1]) ** 0.25),
+        cirq.Circuit(),
+        cirq.Circuit(cirq.measure(*qubits)),
+    ]
+    serialized_circuits = css.serialization.serialize_circuits(circuits)
+
+    circuit_iter = css.serialization.iter_deserialize_compiled_circuits(serialized_circuits)
+    assert next(circuit_iter) == circuits[0]
+    assert list(circuit_iter) == circuits[1:]
+
+    serialized_circuit = css.serialization.serialize_circuits(circuits[0])
+    assert list(css.serialization.iter_deserialize_compiled_circuits(serialized_circuit)) == [
+        circuits[0]
+    ]
+
+    subcircuit_op = cirq.CircuitOperation(cirq.FrozenCircuit(cirq.CX(*qubits)))
+    serialized_circuits = css.serialization.serialize_circuits([cirq.Circuit(subcircuit_op)])
+    assert list(css.serialization.iter_deserialize_compiled_circuits(serialized_circuits)) == [
+        cirq.Circuit(subcircuit_op)
+    ]
+
+    # Shared objects should be forgotten once there are too many of them
+    hook = css.serialization._CompiledObjectHook(max_shared_objects=1)
+    decoder = json.JSONDecoder(object_hook=hook)
+    serialized_circuit = css.serialization.serialize_circuits(circuits[0])
+    assert decoder.decode(serialized_circuit) == circuits[0]
+    assert len(hook._objects) == 1
+
+
+def test_compiled_circuit_getters() -> None:
+    qubits = cirq.LineQubit.range(2)
+    circuits = [cirq.Circuit(cirq.X(qubits[0]) ** 0.5, css.ZX(*qubits)), cirq.Circuit()]
+    serialized_circuits = css.serialization.serialize_circuits(circuits)
+
+    getters = css.serialization._compiled_circuit_getters(serialized_circuits)
+    assert len(getters) == 2
+    assert getters[1]() == circuits[1]
+    assert getters[0]() == circuits[0]
+
+    serialized_circuit = css.serialization.serialize_circuits(circuits[0])
+    getters = css.serialization._compiled_circuit_getters(serialized_circuit)
+    assert [getter() for getter in getters] == [circuits[0]]
+
+    subcircuit_op = cirq.CircuitOperation(cirq.FrozenCircuit(cirq.CX(*qubits)))
+    serialized_circuits = css.serialization.serialize_circuits([cirq.Circuit(subcircuit_op)])
+    getters = css.serialization._compiled_circuit_getters(serialized_circuits)
+    assert [getter() for getter in getters] == [cirq.Circuit(subcircuit_op)]
+
+
+def test_iter_json_list() -> None:
+    decoder = json.JSONDecoder()
+    json_text = ' [ 1, {"a": [2]} ,"3"] '
+    assert list(css.serialization._iter_json_list(json_text, decoder)) == [
+        (1, 3, 4),
+        ({"a": [2]}, 6, 16),
+        ("3", 18, 21),
+    ]
+    assert list(css.serialization._iter_json_list(" [ ] ", decoder)) == []
+    assert list(css.serialization._iter_json_list(' {"a": 1} ', decoder)) == [({"a": 1}, 1, 9)]
+
+    for invalid_json, message in [
+        ("[1 2]", "Expecting ',' delimiter"),
+        ("[1,]", "Expecting value"),
+        ("[1,", "Expecting value"),
+        ("[", "Expecting value"),
+        ("[1] 2", "Extra data"),
+        ("1 2", "Extra data"),
+    ]:
+        with pytest.raises(json.JSONDecodeError, match=message):
+            _ = list(css.serialization._iter_json_list(invalid_json, decoder))
+
+
+def test_serialize_circuit_chunks() -> None:
+    qubits = cirq.LineQubit.range(2)
+    circuits = [cirq.Circuit(cirq.X(qubits[0])), cirq.Circuit(cirq.CX(*qubits)), cirq.Circuit()]
+
+    assert css.serialization.serialize_circuit_chunks(circuits) == [
+        (3, css.serialization.serialize_circuits(circuits))
+    ]
+    assert css.serialization.serialize_circuit_chunks([]) == []
+
+    chunks = css.serialization.serialize_circuit_chunks(circuits, max_chunk_size=2)
+    assert chunks == [
+        (2, css.serialization.serialize_circuits(circuits[:2])),
+        (1, css.serialization.serialize_circuits(circuits[2:])),
+    ]
+
+    # Circuits larger than max_chunk_bytes each get their own chunk
+    chunks = css.serialization.serialize_circuit_chunks(circuits, max_chunk_bytes=1)
+    assert [num_circuits for num_circuits, _ in chunks] == [1, 1, 1]
+    for (_, serialized_circuits), circuit in zip(chunks, circuits):
+        assert css.serialization.deserialize_circuits(serialized_circuits) == [circuit]
+
+    max_chunk_bytes = len(css.serialization.serialize_circuits(circuits[1:]))
+    chunks = css.serialization.serialize_circuit_chunks(circuits, max_chunk_bytes=max_chunk_bytes)
+    assert chunks == [
+        (1, css.serialization.serialize_circuits(circuits[:1])),
+        (2, css.serialization.serialize_circuits(circuits[1:])),
+    ]
+
+    # Circuits containing CircuitOperations share serialization context with the rest of the chunk
+    subcircuit = cirq.FrozenCircuit(cirq.X(qubits[0]))
+    circuits = [
+        cirq.Circuit(cirq.CircuitOperation(subcircuit)),
+        cirq.Circuit(cirq.CircuitOperation(subcircuit), cirq.CX(*qubits)),
+        cirq.Circuit(cirq.X(qubits[0])),
+    ]
+    assert css.serialization.serialize_circuit_chunks(circuits) == [
+        (3, css.serialization.serialize_circuits(circuits))
+    ]
+    chunks = css.serialization.serialize_circuit_chunks(circuits, max_chunk_size=2)
+    assert chunks == [
+        (2, css.serialization.serialize_circuits(circuits[:2])),
+        (1, css.serialization.serialize_circuits(circuits[2:])),
+    ]
+    assert css.serialization.deserialize_circuits(chunks[0][1]) == circuits[:2]
+
+
+def test_serialize_circuits_binary() -> None:
+    qubits = cirq.LineQubit.range(3)
+    custom_gates = [
+        css.ZZSwapGate(0.3),
+        css.Barrier(3),
+        css.ZX**0.25,
+        css.AceCR("+-", sandwich_rx_rads=1.2),
+        css.ParallelGates(cirq.X, css.ZX),
+        cirq.ms(0.5),
+        css.RGate(sympy.Symbol("theta"), 0.2),
+        css.custom_gates.IX,
+        css.ParallelRGate(0.1, 0.2, 2),
+    ]
+    # Every gate in the custom resolver should be covered
+    assert all(
+        css.custom_gates.custom_resolver(cirq.json_cirq_type(type(gate))) is type(gate)
+        for gate in custom_gates
+    )
+
+    circuit = cirq.Circuit(gate.on(*qubits[: cirq.num_qubits(gate)]) for gate in custom_gates)
+    circuit += cirq.Moment()
+    circuit += cirq.CircuitOperation(cirq.FrozenCircuit(cirq.CX(*qubits[:2]))).with_tags("tag")
+    circuit += cirq.measure(cirq.GridQubit(1, 2), qubits[0], key="m").with_tags("tag", 1)
+    circuits = [circuit, cirq.Circuit(), cirq.FrozenCircuit(cirq.H(qubits[0]))]
+
+    serialized_circuits = css.serialization.serialize_circuits_binary(circuits)
+    assert isinstance(serialized_circuits, bytes)
+    deserialized_circuits = css.serialization.deserialize_circuits_binary(serialized_circuits)
+    assert deserialized_circuits == circuits
+    assert [type(circuit) for circuit in deserialized_circuits] == [
+        cirq.Circuit,
+        cirq.Circuit,
+        cirq.FrozenCircuit,
+    ]
+
+    serialized_circuit = css.serialization.serialize_circuits_binary(circuit)
+    assert css.serialization.deserialize_circuits_binary(serialized_circuit) == [circuit]
+
+    # Repeated gates and qubits should be much smaller than in json
+    circuit = cirq.testing.random_circuit(qubits, 100, 0.8, random_state=1234)
+    serialized_circuit = css.serialization.serialize_circuits_binary(circuit)
+    assert css.serialization.deserialize_circuits_binary(serialized_circuit) == [circuit]
+    assert 4 * len(serialized_circuit) < len(css.serialization.serialize_circuits(circuit))
+
+    with pytest.raises(ValueError, match="not in the binary circuit format"):
+        _ = css.serialization.deserialize_circuits_binary(b"[]")
+
+
+def test_serialize_circuit_chunks_binary() -> None:
+    qubits = cirq.LineQubit.range(2)
+    circuits = [cirq.Circuit(cirq.X(qubits[0])), cirq.Circuit(cirq.CX(*qubits)), cirq.Circuit()]
+
+    assert css.serialization.serialize_circuit_chunks_binary(circuits) == [
+        (3, css.serialization.serialize_circuits_binary(circuits))
+    ]
+    assert css.serialization.serialize_circuit_chunks_binary([]) == []
+
+    chunks = css.serialization.serialize_circuit_chunks_binary(circuits, max_chunk_size=2)
+    assert chunks == [
+        (2, css.serialization.serialize_circuits_binary(circuits[:2])),
+        (1, css.serialization.serialize_circuits_binary(circuits[2:])),
+    ]
+
+    # Chunks larger than max_chunk_bytes are halved until they fit (or contain a single circuit)
+    chunks = css.serialization.serialize_circuit_chunks_binary(circuits, max_chunk_bytes=1)
+    assert [num_circuits for num_circuits, _ in chunks] == [1, 1, 1]
+    for (_, serialized_circuits), circuit in zip(chunks, circuits):
+        assert css.serialization.deserialize_circuits_binary(serialized_circuits) == [circuit]
+
+    max_chunk_bytes = len(css.serialization.serialize_circuits_binary(circuits[1:]))
+    chunks = css.serialization.serialize_circuit_chunks_binary(
+        circuits, max_chunk_bytes=max_chunk_bytes
+    )
+    assert chunks == [
+        (1, css.serialization.serialize_circuits_binary(circuits[:1])),
+        (2, css.serialization.serialize_circuits_binary(circuits[1:])),
+    ]
+
+
+def test_deserialize_pulses() -> None:
+    pulses = [{"duration": 10}, {"duration": 20}, {"duration": 30}]
+    assert css.serialization.deserialize_pulses(gss.converters.serialize(pulses)) == pulses
+
+    serialized_pulses = [gss.converters.serialize(pulse) for pulse in pulses]
+    assert css.serialization.deserialize_pulses(serialized_pulses) == pulses
+
+    # Small batches should be deserialized serially
+    with mock.patch("concurrent.futures.ProcessPoolExecutor") as mock_executor:
+        assert css.serialization.deserialize_pulses(serialized_pulses, max_workers=None) == pulses
+        mock_executor.assert_not_called()
+
+    assert (
+        css.serialization.deserialize_pulses(serialized_pulses, max_workers=2, min_parallel_size=2)
+        == pulses
+    )
+
+
+def test_serialize_sweep() -> None:
+    a, b = sympy.symbols("a b")
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0) ** a, cirq.Z(q0) ** b)
+
+    compact_sweeps = [
+        cirq.Linspace("a", 0, 1, 3),
+        cirq.Points(b, [0.5, 1]),
+        cirq.Linspace(a, 0, 1, 3) * cirq.Points("b", [0.5, 1]),
+        cirq.Linspace("a", 0, 1, 2) + cirq.Points("b", [0.5, 1]),
+    ]
+    for sweep in compact_sweeps:
+        serialized_sweep = css.serialization.serialize_sweep(circuit, sweep)
+        assert "table" not in json.loads(serialized_sweep)
+        resolvers = css.serialization.deserialize_sweep(serialized_sweep)
+        assert resolvers == list(cirq.to_resolvers(sweep))
+
+    tabulated_sweeps: List[cirq.Sweepable] = [
+        {"a": 0.25, "b": 1},
+        [{"a": 0.25, "b": 1}, cirq.ParamResolver({"a": 0.5, "b": 0.0, "c": 4})],
+        cirq.ListSweep([{"a": 1, "b": 0}]),
+    ]
+    for sweepable in tabulated_sweeps:
+        serialized_sweep = css.serialization.serialize_sweep(circuit, sweepable)
+        assert json.loads(serialized_sweep)["table"]["symbols"] == ["a", "b"]
+        resolvers = css.serialization.deserialize_sweep(serialized_sweep)
+        assert [cirq.resolve_parameters(circuit, resolver) for resolver in resolvers] == [
+            cirq.resolve_parameters(circuit, resolver) for resolver in cirq.to_resolvers(sweepable)
+        ]
+
+    for sweepable in [None, cirq.Product(), [{}, {}]]:
+        serialized_sweep = css.serialization.serialize_sweep(cirq.Circuit(), sweepable)
+        resolvers = css.serialization.deserialize_sweep(serialized_sweep)
+        assert resolvers == list(cirq.to_resolvers(sweepable))
@@ -12,36 +12,58 @@
 # limitations under the License.
 """Service to access SuperstaQs API."""
 
+import base64
 import collections
+import concurrent.futures
+import functools
+import itertools
 import os
-from typing import Any, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 
 import cirq
 import general_superstaq as gss
 import numpy as np
+import numpy.typing as npt
 from general_superstaq import finance
 from general_superstaq import logistics
 from general_superstaq import ResourceEstimate
-from general_superstaq import superstaq_client
 from general_superstaq import user_config
 
 import cirq_superstaq as css
 
 
 def counts_to_results(
-    counter: collections.Counter, circuit: cirq.AbstractCircuit, param_resolver: cirq.ParamResolver
+    counter: collections.Counter,
+    circuit: cirq.AbstractCircuit,
+    param_resolver: cirq.ParamResolver,
+    dtype: npt.DTypeLike = np.uint8,
 ) -> cirq.ResultDict:
     """Converts a collections.Counter to a cirq.ResultDict.
 
-    Args:
-            counter: The collections.Counter of counts for the run.
-            circuit: The circuit to run.
-            param_resolver: A `cirq.ParamResolver` to resolve parameters in `circuit`.
+    Each unique bitstring in `counter` is decoded only once, and then repeated by its count.
 
-        Returns:
-            A `cirq.ResultDict` for the given circuit and counter.
+    Args:
+        counter: The collections.Counter of counts for the run.
+        circuit: The circuit to run.
+        param_resolver: A `cirq.ParamResolver` to resolve parameters in `circuit`.
+        dtype: The dtype of the returned measurement array. Defaults to `np.uint8`.
 
+    Returns:
+        A `cirq.ResultDict` for the given circuit and counter.
     """
 
     measurement_key_names = list(circuit.all_measurement_key_names())
@@ -49,28 +71,16 @@ def counts_to_results(
     # Combines all the measurement key names into a string: {'0', '1'} -> "01"
     combine_key_names = "".join(measurement_key_names)
 
-    samples: List[List[int]] = []
-    for key in counter.keys():
-        keys_as_list: List[int] = []
-
-        # Combines the keys of the counter into a list. If key = "01", keys_as_list = [0, 1]
-        for index in key:
-            keys_as_list.append(int(index))
-
-        # Gets the number of counts of the key
-        # counter = collections.Counter({"01": 48, "11": 52})["01"] -> 48
-        counts_of_key = counter[key]
-
-        # Appends all the keys onto 'samples' list number-of-counts-in-the-key times
-        # If collections.Counter({"01": 48, "11": 52}), [0, 1] is appended to 'samples` 48 times and
-        # [1, 1] is appended to 'samples' 52 times
-        for key in range(counts_of_key):
-            samples.append(keys_as_list)
+    # If collections.Counter({"01": 48, "11": 52}), the row [0, 1] is repeated 48 times and the
+    # row [1, 1] is repeated 52 times
+    unique_samples = css.result.bitstrings_to_array(list(counter.keys()), dtype=dtype)
+    repeats = np.fromiter(counter.values(), dtype=np.int64, count=len(counter))
+    samples = np.repeat(unique_samples, repeats, axis=0)
 
     result = cirq.ResultDict(
         params=param_resolver,
         measurements={
-            combine_key_names: np.array(samples),
+            combine_key_names: samples,
         },
     )
 
@@ -94,6 +104,16 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
         api_version: str = css.API_VERSION,
         max_retry_seconds: int = 3600,
         verbose: bool = False,
+        job_store: Optional[Union[str, "os.PathLike[str]", css.JobStore]] = None,
+        compile_cache: Optional[css.CompileCache] = None,
+        max_compile_chunk_size: Optional[int] = 500,
+        max_compile_chunk_bytes: int = css.serialization.DEFAULT_MAX_CHUNK_BYTES,
+        max_compile_workers: int = 4,
+        compile_chunk_retries: int = 2,
+        circuit_format: str = "json",
+        compression: Optional[str] = None,
+        compression_threshold: int = css.compression.DEFAULT_COMPRESSION_THRESHOLD,
+        max_pulse_workers: Optional[int] = 1,
     ) -> None:
         """Creates the Service to access SuperstaQ's API.
 
@@ -113,19 +133,59 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             api_version: Version of the api.
             max_retry_seconds: The number of seconds to retry calls for. Defaults to one hour.
             verbose: Whether to print to stdio and stderr on retriable errors.
+            job_store: An optional `css.JobStore` (or the path of one) in which to record the jobs
+                created by this service. Jobs which have reached a terminal state are then loaded
+                from the store by `get_job`, instead of being fetched from the API.
+            compile_cache: An optional `css.CompileCache` in which to cache the responses of
+                `aqt_compile`, `qscout_compile`, `cq_compile`, and `ibmq_compile`, so that
+                repeatedly compiling the same circuit(s) for the same target does not require
+                further requests to the API.
+            max_compile_chunk_size: The maximum number of circuits to send in each compile
+                request. Larger lists of circuits are split into chunks which are compiled
+                concurrently, and the results reassembled in order. If None, lists are only split
+                according to `max_compile_chunk_bytes`. `aqt_compile` only splits circuits if
+                `include_pulses=False` (as its pulse sequence cannot be split).
+            max_compile_chunk_bytes: The maximum size of the serialized circuits in each compile
+                request.
+            max_compile_workers: The maximum number of compile requests to send concurrently.
+            compile_chunk_retries: The number of times to retry each chunk of a compile request
+                if it fails with a transient error (i.e. the client runs out of retries, or can't
+                connect). Chunks which have already succeeded are not resent, and other errors
+                (e.g. invalid circuits) are raised immediately.
+            circuit_format: The format in which to send circuits to the compile endpoints: either
+                "json", "binary" (see `css.serialization.serialize_circuits_binary`), or "auto" to
+                send binary circuits if the API advertises support for them (which is checked the
+                first time circuits are compiled). `aqt_compile_iter` and `ibmq_compile_iter`
+                always send JSON.
+            compression: The encoding with which to compress the bodies of large requests (e.g.
+                to create jobs or compile circuits): "gzip", "zstd" (which requires the
+                `zstandard` package), or None to send them uncompressed.
+            compression_threshold: The minimum size (in bytes) of the request bodies to compress.
+            max_pulse_workers: The number of worker processes with which `ibmq_compile`,
+                `ibmq_compile_iter`, and `neutral_atom_compile` deserialize separately serialized
+                pulse sequences (or None to use one per CPU). Small batches are always
+                deserialized serially (see `css.serialization.deserialize_pulses`).
 
         Raises:
             EnvironmentError: if the `api_key` is None and has no corresponding environment
                 variable set.
+            ValueError: if `circuit_format` is not "json", "binary", or "auto", or `compression`
+                is not supported.
+            SuperstaQModuleNotFoundException: if `compression` is "zstd", but `zstandard` is not
+                installed.
         """
+        if circuit_format not in ("json", "binary", "auto"):
+            raise ValueError(f"Invalid circuit format: {circuit_format!r}")
+
         self.remote_host = remote_host or os.getenv("SUPERSTAQ_REMOTE_HOST") or css.API_URL
+        self.api_version = api_version
         self.api_key = api_key or os.getenv("SUPERSTAQ_API_KEY")
         if not self.api_key:
             raise EnvironmentError(
                 "Parameter api_key was not specified and the environment variable "
                 "SUPERSTAQ_API_KEY was also not set."
             )
-        self._client = superstaq_client._SuperstaQClient(
+        self._client = css.compression._CompressingSuperstaQClient(
             client_name="cirq-superstaq",
             remote_host=self.remote_host,
             api_key=self.api_key,
@@ -133,7 +193,23 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             api_version=api_version,
             max_retry_seconds=max_retry_seconds,
             verbose=verbose,
+            compression=compression,
+            compression_threshold=compression_threshold,
         )
+        self._poller = css.JobPoller()
+        self._job_store = (
+            job_store
+            if job_store is None or isinstance(job_store, css.JobStore)
+            else css.JobStore(job_store)
+        )
+        self.compile_cache = compile_cache
+        self.max_compile_chunk_size = max_compile_chunk_size
+        self.max_compile_chunk_bytes = max_compile_chunk_bytes
+        self.max_compile_workers = max_compile_workers
+        self.compile_chunk_retries = compile_chunk_retries
+        self.circuit_format = circuit_format
+        self._binary_circuits_supported: Optional[bool] = None
+        self.max_pulse_workers = max_pulse_workers
 
     def get_counts(
         self,
@@ -168,9 +244,10 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
         target: Optional[str] = None,
         ibmq_pulse: Optional[bool] = None,
         param_resolver: cirq.ParamResolver = cirq.ParamResolver({}),
-    ) -> cirq.ResultDict:
+        packed: bool = False,
+    ) -> css.CountsResult:
         """Run the given circuit on the SuperstaQ API and returns the result
-        of the ran circut as a cirq.ResultDict.
+        of the ran circut as a css.CountsResult.
 
         Args:
             circuit: The circuit to run.
@@ -178,23 +255,44 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             target: Where to run the job. Can be 'qpu' or 'simulator'.
             ibmq_pulse: Specify whether to run the job using SuperstaQ's pulse-level optimizations.
             param_resolver: A `cirq.ParamResolver` to resolve parameters in  `circuit`.
+            packed: Whether the returned result should store per-shot measurements bit-packed,
+                which uses up to 64x less memory for large numbers of repetitions.
 
         Returns:
-            A `cirq.ResultDict` for running the circuit.
+            A `css.CountsResult` for running the circuit.
         """
         counts = self.get_counts(circuit, repetitions, target, ibmq_pulse, param_resolver)
-        return counts_to_results(counts, circuit, param_resolver)
+        indices = css.result.measurement_indices(circuit)
+        return css.CountsResult(counts, indices, cirq.ParamResolver(param_resolver), packed=packed)
 
-    def sampler(self, target: str) -> cirq.Sampler:
+    def sampler(
+        self,
+        target: str,
+        packed: bool = False,
+        symbolic_sweeps: bool = False,
+        batched_polling: bool = False,
+    ) -> cirq.Sampler:
         """Returns a `cirq.Sampler` object for accessing sampler interface.
 
         Args:
             target: Backend to sample against.
+            packed: Whether results returned by the sampler should store per-shot measurements
+                bit-packed.
+            symbolic_sweeps: Whether the sampler should upload parameterized circuits along with
+                their sweeps (see `create_sweep_jobs`), rather than resolving them locally.
+            batched_polling: Whether the sampler should poll all of the outstanding jobs of a sweep
+                with a single request, if the API supports it (see `css.JobGroup`).
 
         Returns:
             A `cirq.Sampler` for the SuperstaQ API.
         """
-        return css.sampler.Sampler(service=self, target=target)
+        return css.sampler.Sampler(
+            service=self,
+            target=target,
+            packed=packed,
+            symbolic_sweeps=symbolic_sweeps,
+            batched_polling=batched_polling,
+        )
 
     def create_job(
         self,
@@ -226,11 +324,106 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
         )
         # The returned job does not have fully populated fields; they will be filled out by
         # when the new job's status is first queried
-        return self.get_job(result["job_ids"][0])
+        return self._record_new_jobs(result["job_ids"])[0]
+
+    def create_jobs(
+        self,
+        circuits: Sequence[cirq.AbstractCircuit],
+        repetitions: int = 1000,
+        target: Optional[str] = None,
+        ibmq_pulse: Optional[bool] = None,
+        max_payload_bytes: int = css.serialization.DEFAULT_MAX_CHUNK_BYTES,
+        deduplicate: bool = False,
+    ) -> List[css.job.Job]:
+        """Create new jobs to run each of the given circuits, using as few requests as possible.
+
+        All of the circuits are submitted together in a single request, unless their serialized
+        size exceeds `max_payload_bytes`, in which case they are split across multiple requests.
+
+        Args:
+            circuits: The circuits to run.
+            repetitions: The number of times to repeat each circuit. Defaults to 1000.
+            target: Where to run the jobs. Can be 'qpu' or 'simulator'.
+            ibmq_pulse: Specify whether to run the jobs using SuperstaQ's pulse-level optimizations.
+            max_payload_bytes: The maximum size of the serialized circuits in each request.
+            deduplicate: If True, only one job is created for each unique circuit. Every copy of a
+                duplicated circuit then shares the same `css.Job` (and therefore the same samples).
+
+        Returns:
+            A list of `css.Job`s (one for each circuit, in the same order), which can be queried for
+            status or results.
+
+        Raises:
+            SuperstaQException: If there was an error accessing the API.
+        """
+        indices = list(range(len(circuits)))
+        if deduplicate:
+            circuits, indices = css.fingerprint.deduplicate_circuits(circuits)
+
+        jobs: List[css.job.Job] = []
+        for _, serialized_circuits in css.serialization.serialize_circuit_chunks(
+            circuits, max_chunk_bytes=max_payload_bytes
+        ):
+            result = self._client.create_job(
+                serialized_circuits={"cirq_circuits": serialized_circuits},
+                repetitions=repetitions,
+                target=target,
+                ibmq_pulse=ibmq_pulse,
+            )
+            jobs += self._record_new_jobs(result["job_ids"])
+        return [jobs[index] for index in indices]
+
+    def create_sweep_jobs(
+        self,
+        circuit: cirq.AbstractCircuit,
+        params: cirq.Sweepable,
+        repetitions: int = 1000,
+        target: Optional[str] = None,
+        ibmq_pulse: Optional[bool] = None,
+    ) -> List[css.job.Job]:
+        """Create new jobs to run a parameterized circuit at every point of a parameter sweep.
+
+        Rather than resolving and serializing the circuit once per point, this uploads a single
+        copy of the parameterized circuit along with a compact serialization of the sweep (see
+        `css.serialization.serialize_sweep`), which is expanded by the server.
+
+        Args:
+            circuit: The parameterized circuit to run.
+            params: The parameters to run the circuit with.
+            repetitions: The number of times to repeat the circuit at each point. Defaults to 1000.
+            target: Where to run the jobs. Can be 'qpu' or 'simulator'.
+            ibmq_pulse: Specify whether to run the jobs using SuperstaQ's pulse-level optimizations.
+
+        Returns:
+            A list of `css.Job`s, one for each point of the sweep (in the same order as
+            `cirq.to_resolvers(params)`).
+
+        Raises:
+            SuperstaQException: If there was an error accessing the API.
+        """
+        result = self._client.create_job(
+            serialized_circuits={
+                "cirq_circuits": css.serialization.serialize_circuits(circuit),
+                "sweep": css.serialization.serialize_sweep(circuit, params),
+            },
+            repetitions=repetitions,
+            target=target,
+            ibmq_pulse=ibmq_pulse,
+        )
+        return self._record_new_jobs(result["job_ids"])
+
+    def _record_new_jobs(self, job_ids: List[str]) -> List[css.job.Job]:
+        """Adds newly created jobs to the job store (if any), and returns a `css.Job` for each."""
+        if self._job_store is not None:
+            self._job_store.add(job_ids)
+        return [self.get_job(job_id) for job_id in job_ids]
 
     def get_job(self, job_id: str) -> css.job.Job:
         """Gets a job that has been created on the SuperstaQ API.
 
+        If this service has a job store containing the final state of the job, the returned job is
+        fully populated from it and will not make any requests to the API.
+
         Args:
             job_id: The UUID of the job. Jobs are assigned these numbers by the server during the
             creation of the job.
@@ -242,7 +435,41 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             SuperstaQNotFoundException: If there was no job with the given `job_id`.
             SuperstaQException: If there was an error accessing the API.
         """
-        return css.job.Job(client=self._client, job_id=job_id)
+        job = css.job.Job(
+            client=self._client, job_id=job_id, poller=self._poller, store=self._job_store
+        )
+        if self._job_store is not None:
+            job._job = self._job_store.get(job_id) or job._job
+        return job
+
+    def get_jobs(self, job_ids: Sequence[str]) -> css.JobGroup:
+        """Gets a group of jobs that have been created on the SuperstaQ API.
+
+        The statuses of all of the returned jobs can be refreshed with a single request via
+        `css.JobGroup.refresh`.
+
+        Args:
+            job_ids: The UUIDs of the jobs.
+
+        Returns:
+            A `css.JobGroup` containing a `css.Job` for each job id (in the same order).
+        """
+        return css.JobGroup(self.get_job(job_id) for job_id in job_ids)
+
+    def get_stored_jobs(self) -> css.JobGroup:
+        """Gets all of the jobs recorded in this service's job store.
+
+        Returns:
+            A `css.JobGroup` containing a `css.Job` for each job in the store, in the order in
+            which they were created. Jobs which have reached a terminal state are loaded from the
+            store; the rest can be refreshed with a single request via `css.JobGroup.refresh`.
+
+        Raises:
+            ValueError: If this service does not have a job store.
+        """
+        if self._job_store is None:
+            raise ValueError("This service does not have a job store.")
+        return self.get_jobs(self._job_store.job_ids())
 
     def get_balance(self, pretty_output: bool = True) -> Union[str, float]:
         """Get the querying user's account balance in USD.
@@ -270,13 +497,16 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
         """Generates resource estimates for circuit(s).
 
         Args:
-            circuits: cirq Circuit(s).
+            circuits: cirq Circuit(s). Duplicate circuits are only estimated once.
             target: string of target representing backend device
         Returns:
             ResourceEstimate(s) containing resource costs (after compilation)
         """
-        circuit_is_list = isinstance(circuits, List)
-        serialized_circuit = css.serialization.serialize_circuits(circuits)
+        unique_circuits, indices = circuits, None
+        if not isinstance(circuits, cirq.Circuit):
+            unique_circuits, indices = css.fingerprint.deduplicate_circuits(circuits)
+
+        serialized_circuit = css.serialization.serialize_circuits(unique_circuits)
 
         request_json = {
             "cirq_circuits": serialized_circuit,
@@ -290,31 +520,312 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             for resource_estimate in json_dict["resource_estimates"]
         ]
 
-        if circuit_is_list:
+        if indices is not None and len(unique_circuits) < len(circuits):
+            return [resource_estimates[index] for index in indices]
+        if indices is not None:
             return resource_estimates
         return resource_estimates[0]
 
+    def _use_binary_circuits(self) -> bool:
+        """Returns whether to send circuits to the compile endpoints in the binary format."""
+        if self.circuit_format != "auto":
+            return self.circuit_format == "binary"
+
+        if self._binary_circuits_supported is None:
+            circuit_formats = self._client.get_backends().get("circuit_formats", [])
+            self._binary_circuits_supported = (
+                css.serialization.BINARY_CIRCUIT_FORMAT in circuit_formats
+            )
+        return self._binary_circuits_supported
+
+    def _serialize_compile_circuits(
+        self, circuits: Union[cirq.Circuit, List[cirq.Circuit]], split: bool = True
+    ) -> List[Dict[str, str]]:
+        """Serializes circuit(s) into the circuit fields of one or more compile requests.
+
+        If `split` is True, lists of circuits are split into chunks according to
+        `max_compile_chunk_size` and `max_compile_chunk_bytes` (with at least one chunk, even if the
+        list is empty).
+        """
+        if self._use_binary_circuits():
+            if isinstance(circuits, cirq.Circuit) or not split:
+                serialized_chunks = [css.serialization.serialize_circuits_binary(circuits)]
+            else:
+                chunks = css.serialization.serialize_circuit_chunks_binary(
+                    circuits,
+                    max_chunk_bytes=self.max_compile_chunk_bytes,
+                    max_chunk_size=self.max_compile_chunk_size,
+                )
+                serialized_chunks = [serialized_chunk for _, serialized_chunk in chunks] or [
+                    css.serialization.serialize_circuits_binary([])
+                ]
+            return [
+                {"cirq_circuits_binary": base64.b64encode(serialized_chunk).decode()}
+                for serialized_chunk in serialized_chunks
+            ]
+
+        if isinstance(circuits, cirq.Circuit) or not split:
+            return [{"cirq_circuits": css.serialization.serialize_circuits(circuits)}]
+
+        json_chunks = css.serialization.serialize_circuit_chunks(
+            circuits,
+            max_chunk_bytes=self.max_compile_chunk_bytes,
+            max_chunk_size=self.max_compile_chunk_size,
+        )
+        return [{"cirq_circuits": serialized_chunk} for _, serialized_chunk in json_chunks] or [
+            {"cirq_circuits": "[]"}
+        ]
+
+    def _compile_request(
+        self,
+        endpoint: str,
+        request_json: Dict[str, Any],
+        compile_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Sends a request to a compilation endpoint, using the compile cache (if any)."""
+        if self.compile_cache is None:
+            return compile_fn(request_json)
+        return self.compile_cache.get_or_compile(
+            endpoint, request_json, compile_fn, self.remote_host, self.api_version
+        )
+
+    def _compile_circuits(
+        self,
+        endpoint: str,
+        circuits: Union[cirq.Circuit, List[cirq.Circuit]],
+        target: str,
+        compile_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+        read_json_fn: Callable[[Dict[str, Any], bool], css.compiler_output.CompilerOutput],
+        deduplicate: bool = True,
+        split: bool = True,
+    ) -> css.compiler_output.CompilerOutput:
+        """Compiles circuit(s) via the given endpoint, using the compile cache (if any).
+
+        If a list of circuits is provided and `split` is True, it is split into chunks (according
+        to `max_compile_chunk_size` and `max_compile_chunk_bytes`), which are compiled
+        concurrently and then reassembled to match the original list. If `deduplicate` is True,
+        only the unique circuits are sent to the API.
+        """
+        if isinstance(circuits, cirq.Circuit):
+            (circuit_fields,) = self._serialize_compile_circuits(circuits)
+            request_json = {**circuit_fields, "backend": target}
+            return read_json_fn(self._compile_request(endpoint, request_json, compile_fn), False)
+
+        unique_circuits, indices = circuits, None
+        if deduplicate:
+            unique_circuits, indices = css.fingerprint.deduplicate_circuits(circuits)
+        serialized_chunks = self._serialize_compile_circuits(unique_circuits, split)
+
+        def compile_chunk(circuit_fields: Dict[str, str]) -> css.compiler_output.CompilerOutput:
+            return self._compile_chunk(endpoint, circuit_fields, target, compile_fn, read_json_fn)
+
+        if len(serialized_chunks) == 1:
+            outputs = [compile_chunk(serialized_chunks[0])]
+        else:
+            max_workers = min(self.max_compile_workers, len(serialized_chunks))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outputs = list(executor.map(compile_chunk, serialized_chunks))
+
+        output = css.compiler_output.merge_compiler_outputs(outputs)
+        if indices is not None and len(unique_circuits) < len(circuits):
+            return css.compiler_output.expand_compiler_output(output, indices)
+        return output
+
+    def _compile_chunk(
+        self,
+        endpoint: str,
+        circuit_fields: Dict[str, str],
+        target: str,
+        compile_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+        read_json_fn: Callable[[Dict[str, Any], bool], css.compiler_output.CompilerOutput],
+    ) -> css.compiler_output.CompilerOutput:
+        """Compiles a serialized list of circuits, retrying transient errors up to
+        `compile_chunk_retries` times.
+
+        `circuit_fields` contains the serialized circuits, as either "cirq_circuits" (JSON) or
+        "cirq_circuits_binary" (base64-encoded binary).
+        """
+        request_json = {**circuit_fields, "backend": target}
+        for attempt in range(self.compile_chunk_retries + 1):
+            try:
+                json_dict = self._compile_request(endpoint, request_json, compile_fn)
+                break
+            except css.job_group._TRANSIENT_ERRORS:
+                if attempt == self.compile_chunk_retries:
+                    raise
+        return read_json_fn(json_dict, True)
+
+    def _iter_compile_chunks(
+        self, circuits: Iterable[cirq.AbstractCircuit], deduplicate: bool = True
+    ) -> Iterator[Tuple[int, str, List[int]]]:
+        """Lazily splits circuits into contiguous chunks to be compiled.
+
+        If `deduplicate` is True, duplicate circuits within each chunk are only serialized once.
+        Chunks are bounded by `max_compile_chunk_size` (unique circuits) and
+        `max_compile_chunk_bytes`.
+
+        Yields:
+            Tuples `(start, serialized_circuits, indices)`, where `start` is the index of the first
+            circuit in the chunk, and the `i`-th circuit of the chunk is the `indices[i]`-th
+            circuit of `serialized_circuits`.
+        """
+        start = 0
+        chunk: List[str] = []
+        chunk_bytes = 0
+        chunk_indices: List[int] = []
+        unique_indices: Dict[str, int] = {}
+
+        for circuit in circuits:
+            # Without deduplication, every circuit is treated as unique
+            fingerprint = (
+                css.circuit_fingerprint(circuit) if deduplicate else str(start + len(chunk_indices))
+            )
+            if fingerprint in unique_indices:
+                chunk_indices.append(unique_indices[fingerprint])
+                continue
+
+            serialized_circuit = css.serialization.serialize_circuits(circuit)
+            circuit_bytes = len(serialized_circuit) + 2
+            if chunk and (
+                chunk_bytes + circuit_bytes > self.max_compile_chunk_bytes
+                or (
+                    self.max_compile_chunk_size is not None
+                    and len(chunk) >= self.max_compile_chunk_size
+                )
+            ):
+                yield start, "[" + ", ".join(chunk) + "]", chunk_indices
+                start += len(chunk_indices)
+                chunk, chunk_bytes, chunk_indices, unique_indices = [], 0, [], {}
+
+            unique_indices[fingerprint] = len(chunk)
+            chunk_indices.append(len(chunk))
+            chunk.append(serialized_circuit)
+            chunk_bytes += circuit_bytes
+
+        if chunk:
+            yield start, "[" + ", ".join(chunk) + "]", chunk_indices
+
+    def _compile_circuits_iter(
+        self,
+        endpoint: str,
+        circuits: Iterable[cirq.AbstractCircuit],
+        target: str,
+        compile_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+        read_json_fn: Callable[[Dict[str, Any], bool], css.compiler_output.CompilerOutput],
+        deduplicate: bool = True,
+    ) -> Generator[Tuple[int, css.compiler_output.CompilerOutput], None, None]:
+        """Compiles chunks of circuits concurrently, yielding each output as soon as it is ready.
+
+        At most `max_compile_workers` chunks are serialized or in flight at any time, so memory
+        usage is bounded by the chunk size rather than by the number of circuits. If `deduplicate`
+        is True, duplicate circuits within each chunk are only compiled once.
+        """
+        chunks = self._iter_compile_chunks(circuits, deduplicate)
+
+        def compile_chunk(
+            start: int, serialized_circuits: str, indices: List[int]
+        ) -> Tuple[int, css.compiler_output.CompilerOutput]:
+            output = self._compile_chunk(
+                endpoint, {"cirq_circuits": serialized_circuits}, target, compile_fn, read_json_fn
+            )
+            if len(set(indices)) < len(indices):
+                output = css.compiler_output.expand_compiler_output(output, indices)
+            return start, output
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_compile_workers)
+        pending: Set["concurrent.futures.Future[Tuple[int, css.compiler_output.CompilerOutput]]"]
+        pending = set()
+        try:
+            for chunk in itertools.islice(chunks, self.max_compile_workers):
+                pending.add(executor.submit(compile_chunk, *chunk))
+
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+                    for chunk in itertools.islice(chunks, 1):
+                        pending.add(executor.submit(compile_chunk, *chunk))
+        finally:
+            # If the caller stops early (or a chunk fails), don't start any more chunks
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def aqt_compile(
-        self, circuits: Union[cirq.Circuit, List[cirq.Circuit]], target: str = "keysight"
+        self,
+        circuits: Union[cirq.Circuit, List[cirq.Circuit]],
+        target: str = "keysight",
+        include_pulses: bool = True,
+        deduplicate: bool = False,
     ) -> css.compiler_output.CompilerOutput:
         """Compiles the given circuit(s) to target AQT device, optimized to its native gate set.
 
         Args:
             circuits: cirq Circuit(s) to compile.
             target: string of target backend AQT device.
+            include_pulses: whether to read the pulse sequence and cycles of the compiled
+                circuit(s). If False, only the compiled circuit(s) are returned.
+            deduplicate: whether to only compile one copy of each unique circuit. Note that the
+                .seq attribute (which cannot be expanded) then only contains the pulse sequences of
+                the unique circuits, so this is best combined with `include_pulses=False`.
         Returns:
             object whose .circuit(s) attribute is an optimized cirq Circuit(s)
             If qtrl is installed, the object's .seq attribute is a qtrl Sequence object of the
             pulse sequence corresponding to the optimized cirq.Circuit(s) and the
-            .pulse_list(s) attribute is the list(s) of cycles.
+            .pulse_list(s) attribute is the list(s) of cycles. These are only deserialized when
+            first accessed. Because a single .seq cannot be assembled from multiple requests, the
+            circuits are only split into chunks (see `max_compile_chunk_size`) if
+            `include_pulses` is False.
         """
-        serialized_circuits = css.serialization.serialize_circuits(circuits)
-        circuits_is_list = not isinstance(circuits, cirq.Circuit)
+        return self._compile_circuits(
+            "/aqt_compile",
+            circuits,
+            target,
+            self._client.aqt_compile,
+            functools.partial(css.compiler_output.read_json_aqt, include_pulses=include_pulses),
+            deduplicate=deduplicate,
+            split=not include_pulses,
+        )
 
-        json_dict = self._client.aqt_compile(
-            {"cirq_circuits": serialized_circuits, "backend": target}
+    def aqt_compile_iter(
+        self,
+        circuits: Iterable[cirq.Circuit],
+        target: str = "keysight",
+        include_pulses: bool = True,
+        deduplicate: bool = False,
+    ) -> Generator[Tuple[int, css.compiler_output.CompilerOutput], None, None]:
+        """Compiles circuits to target AQT device in chunks, yielding the output of each chunk as
+        soon as it is ready.
+
+        Chunks are compiled concurrently (see the `max_compile_*` arguments of `css.Service`), and
+        circuits are only serialized as needed, so the first compiled circuits can be used while
+        the rest are still compiling.
+
+        Args:
+            circuits: cirq Circuits to compile.
+            target: string of target backend AQT device.
+            include_pulses: whether to read the pulse sequences and cycles of the compiled
+                circuits. If False, only the compiled circuits are returned.
+            deduplicate: whether to only compile one copy of each unique circuit in each chunk
+                (in which case each `output.seq` only contains the pulse sequences of the unique
+                circuits).
+
+        Yields:
+            Tuples `(index, output)` in the order in which chunks finish compiling, where
+            `output.circuits` are the compiled circuits corresponding to
+            `circuits[index : index + len(output.circuits)]`. If qtrl is installed, `output.seq`
+            and `output.pulse_lists` contain the pulse sequence and cycles for those circuits.
+        """
+        return self._compile_circuits_iter(
+            "/aqt_compile",
+            circuits,
+            target,
+            self._client.aqt_compile,
+            functools.partial(css.compiler_output.read_json_aqt, include_pulses=include_pulses),
+            deduplicate=deduplicate,
         )
-        return css.compiler_output.read_json_aqt(json_dict, circuits_is_list)
 
     def aqt_compile_eca(
         self,
@@ -322,6 +833,7 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
         num_equivalent_circuits: int,
         random_seed: Optional[int] = None,
         target: str = "keysight",
+        include_pulses: bool = True,
     ) -> css.compiler_output.CompilerOutput:
         """Compiles the given circuit to target AQT device with Equivalent Circuit Averaging (ECA).
 
@@ -332,6 +844,8 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             num_equivalent_circuits: number of logically equivalent random circuits to generate.
             random_seed: optional seed for circuit randomizer.
             target: string of target backend AQT device.
+            include_pulses: whether to read the pulse sequence and cycles of the compiled
+                circuits. If False, only the compiled circuits are returned.
         Returns:
             object whose .circuits attribute is a list of logically equivalent cirq Circuit(s).
             If qtrl is installed, the object's .seq attribute is a qtrl Sequence object of the
@@ -350,7 +864,7 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             request_json["random_seed"] = random_seed
 
         json_dict = self._client.post_request("/aqt_compile", request_json)
-        return css.compiler_output.read_json_aqt(json_dict, True)
+        return css.compiler_output.read_json_aqt(json_dict, True, include_pulses=include_pulses)
 
     def qscout_compile(
         self, circuits: Union[cirq.Circuit, List[cirq.Circuit]], target: str = "qscout"
@@ -364,13 +878,13 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             object whose .circuit(s) attribute is an optimized cirq Circuit(s)
             and a list of jaqal programs represented as strings
         """
-        serialized_circuits = css.serialization.serialize_circuits(circuits)
-        circuits_is_list = not isinstance(circuits, cirq.Circuit)
-
-        json_dict = self._client.qscout_compile(
-            {"cirq_circuits": serialized_circuits, "backend": target}
+        return self._compile_circuits(
+            "/qscout_compile",
+            circuits,
+            target,
+            self._client.qscout_compile,
+            css.compiler_output.read_json_qscout,
         )
-        return css.compiler_output.read_json_qscout(json_dict, circuits_is_list)
 
     def cq_compile(
         self, circuits: Union[cirq.Circuit, List[cirq.Circuit]], target: str = "cq"
@@ -384,15 +898,14 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
         Returns:
             object whose .circuit(s) attribute is an optimized cirq Circuit(s)
         """
-        serialized_circuits = css.serialization.serialize_circuits(circuits)
-        circuits_is_list = not isinstance(circuits, cirq.Circuit)
-
-        json_dict = self._client.cq_compile(
-            {"cirq_circuits": serialized_circuits, "backend": target}
+        return self._compile_circuits(
+            "/cq_compile",
+            circuits,
+            target,
+            self._client.cq_compile,
+            css.compiler_output.read_json_only_circuits,
         )
 
-        return css.compiler_output.read_json_only_circuits(json_dict, circuits_is_list)
-
     def ibmq_compile(
         self, circuits: Union[cirq.Circuit, List[cirq.Circuit]], target: str = "ibmq_qasm_simulator"
     ) -> css.compiler_output.CompilerOutput:
@@ -400,14 +913,41 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
 
         Qiskit Terra must be installed to correctly deserialize the returned pulse schedule.
         """
-        serialized_circuits = css.serialization.serialize_circuits(circuits)
-        circuits_is_list = not isinstance(circuits, cirq.Circuit)
-
-        json_dict = self._client.ibmq_compile(
-            {"cirq_circuits": serialized_circuits, "backend": target}
+        return self._compile_circuits(
+            "/ibmq_compile",
+            circuits,
+            target,
+            self._client.ibmq_compile,
+            functools.partial(
+                css.compiler_output.read_json_ibmq, max_pulse_workers=self.max_pulse_workers
+            ),
         )
 
-        return css.compiler_output.read_json_ibmq(json_dict, circuits_is_list)
+    def ibmq_compile_iter(
+        self, circuits: Iterable[cirq.Circuit], target: str = "ibmq_qasm_simulator"
+    ) -> Generator[Tuple[int, css.compiler_output.CompilerOutput], None, None]:
+        """Compiles circuits for the given IBMQ target in chunks, yielding the output of each chunk
+        as soon as it is ready (see `aqt_compile_iter`).
+
+        Args:
+            circuits: cirq Circuits to compile.
+            target: string of target backend IBMQ device.
+
+        Yields:
+            Tuples `(index, output)` in the order in which chunks finish compiling, where
+            `output.circuits` are the compiled circuits corresponding to
+            `circuits[index : index + len(output.circuits)]`, and `output.pulse_sequences` their
+            pulse schedules (if Qiskit Terra is installed).
+        """
+        return self._compile_circuits_iter(
+            "/ibmq_compile",
+            circuits,
+            target,
+            self._client.ibmq_compile,
+            functools.partial(
+                css.compiler_output.read_json_ibmq, max_pulse_workers=self.max_pulse_workers
+            ),
+        )
 
     def neutral_atom_compile(
         self, circuits: Union[cirq.Circuit, List[cirq.Circuit]], target: str = "neutral_atom_qpu"
@@ -422,7 +962,9 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
             {"cirq_circuits": serialized_circuits, "backend": target}
         )
         try:
-            pulses = gss.converters.deserialize(json_dict["pulses"])
+            pulses = css.serialization.deserialize_pulses(
+                json_dict["pulses"], self.max_pulse_workers
+            )
         except ModuleNotFoundError as e:
             raise gss.SuperstaQModuleNotFoundException(
                 name=str(e.name), context="neutral_atom_compile"
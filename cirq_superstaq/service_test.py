@@ -11,14 +11,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
 import collections
 import os
+import pathlib
 import textwrap
+from typing import Any, Dict, Iterator, List
 from unittest import mock
 
 
 import cirq
 import general_superstaq as gss
+import numpy as np
 import pandas as pd
 import pytest
 import sympy
@@ -52,6 +56,15 @@ def test_counts_to_results() -> None:
     )
     assert result.histogram(key="01") == collections.Counter({0: 50, 3: 50})
 
+    result = css.service.counts_to_results(
+        collections.Counter({"01": 2, "10": 1}), circuit, cirq.ParamResolver({}), dtype=bool
+    )
+    assert result.measurements["01"].dtype == bool
+    np.testing.assert_array_equal(result.measurements["01"], [[0, 1], [0, 1], [1, 0]])
+
+    result = css.service.counts_to_results(collections.Counter(), circuit, cirq.ParamResolver({}))
+    assert result.repetitions == 0
+
 
 def test_service_run_and_get_counts() -> None:
     service = css.Service(api_key="key", remote_host="http://example.com")
@@ -80,8 +93,8 @@ def test_service_run_and_get_counts() -> None:
     service._client = mock_client
 
     a = sympy.Symbol("a")
-    q = cirq.LineQubit(0)
-    circuit = cirq.Circuit((cirq.X**a)(q), cirq.measure(q, key="a"))
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit((cirq.X**a)(q0), cirq.measure(q0, q1, key="a"))
     params = cirq.ParamResolver({"a": 0.5})
     counts = service.get_counts(
         circuit=circuit,
@@ -97,8 +110,39 @@ def test_service_run_and_get_counts() -> None:
         target="ibmq_qasm_simulator",
         param_resolver=params,
     )
+    assert isinstance(result, css.CountsResult)
+    assert result.params == params
     assert result.histogram(key="a") == collections.Counter({3: 1})
 
+    result = service.run(
+        circuit=circuit,
+        repetitions=4,
+        target="ibmq_qasm_simulator",
+        param_resolver=params,
+        packed=True,
+    )
+    assert result.packed_measurements["a"].tolist() == [[192]]
+
+    # A qubit measured more than once has a bit for each measurement
+    circuit = cirq.Circuit(cirq.measure(q0, key="x"), cirq.X(q0), cirq.measure(q0, key="y"))
+    result = service.run(circuit, repetitions=4, target="ibmq_qasm_simulator")
+    assert result.histogram(key="x") == collections.Counter({1: 1})
+    assert result.histogram(key="y") == collections.Counter({1: 1})
+
+    # Circuits without measurements don't read any bits
+    result = service.run(cirq.Circuit(cirq.X(q0)), repetitions=4, target="ibmq_qasm_simulator")
+    assert result.repetitions == 1
+    assert result.measurements == {}
+
+    # Otherwise, the returned bitstrings should have one bit per measured qubit
+    with pytest.raises(ValueError, match="one bit for each of the 3 measured qubits"):
+        _ = service.run(
+            cirq.Circuit(cirq.measure(q0, q1, key="a"), cirq.measure(q0, key="b")),
+            repetitions=4,
+            target="ibmq_qasm_simulator",
+            param_resolver=params,
+        )
+
 
 def test_service_sampler() -> None:
     service = css.Service(api_key="key", remote_host="http://example.com")
@@ -132,6 +176,143 @@ def test_service_sampler() -> None:
     )
     mock_client.create_job.assert_called_once()
 
+    sampler = service.sampler(target="ibmq_qasm_simulator", packed=True)
+    result = sampler.run(program=circuit, repetitions=4)
+    assert isinstance(result, css.CountsResult)
+    assert result.packed_measurements["a"].tolist() == [[0], [0], [0], [128]]
+
+
+def test_service_sampler_run_sweep() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    mock_client = mock.MagicMock()
+    service._client = mock_client
+    mock_client.create_job.return_value = {"job_ids": ["job_id_0", "job_id_1", "job_id_2"]}
+    job_dicts = [
+        {"job_id": f"job_id_{i}", "samples": {str(i % 2): 2}, "status": "Done"} for i in range(3)
+    ]
+    mock_client.get_job.side_effect = [
+        {"job_id": "job_id_0", "status": "Running"},
+        job_dicts[1],
+        job_dicts[2],
+        job_dicts[0],
+    ]
+
+    a = sympy.Symbol("a")
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0) ** a, cirq.measure(q0, key="m"))
+    sweep = cirq.Linspace("a", 0, 2, 3)
+    resolvers = list(cirq.to_resolvers(sweep))
+
+    sampler = service.sampler(target="ibmq_qasm_simulator")
+    with mock.patch("time.sleep"), mock.patch.object(
+        css, "CountsResult", wraps=css.CountsResult
+    ) as mock_counts_result:
+        results = sampler.run_sweep(circuit, params=sweep, repetitions=2)
+
+    # All resolved circuits should be submitted in a single request
+    mock_client.create_job.assert_called_once()
+    serialized_circuits = mock_client.create_job.call_args[1]["serialized_circuits"]
+    assert css.serialization.deserialize_circuits(serialized_circuits["cirq_circuits"]) == [
+        cirq.resolve_parameters(circuit, resolver) for resolver in resolvers
+    ]
+
+    assert [result.params for result in results] == resolvers
+    assert [result.histogram(key="m") for result in results] == [
+        collections.Counter({0: 2}),
+        collections.Counter({1: 2}),
+        collections.Counter({0: 2}),
+    ]
+
+    # Results should have been processed as their jobs completed (i.e. job_id_0 last)
+    assert [call[0][2] for call in mock_counts_result.call_args_list] == [
+        resolvers[1],
+        resolvers[2],
+        resolvers[0],
+    ]
+
+    # By default, each job should be polled separately
+    mock_client.post_request.assert_not_called()
+    assert mock_client.get_job.call_count == 4
+
+    # With batched polling, all outstanding jobs should be polled together
+    mock_client.get_job.reset_mock()
+    mock_client.post_request.side_effect = [
+        {
+            "job_id_0": {"job_id": "job_id_0", "status": "Running"},
+            **{job_dict["job_id"]: job_dict for job_dict in job_dicts[1:]},
+        },
+        {"job_id_0": job_dicts[0]},
+    ]
+    sampler = service.sampler(target="ibmq_qasm_simulator", batched_polling=True)
+    with mock.patch("time.sleep"):
+        results = sampler.run_sweep(circuit, params=sweep, repetitions=2)
+    assert [result.params for result in results] == resolvers
+    mock_client.get_job.assert_not_called()
+    assert mock_client.post_request.call_args_list == [
+        mock.call("/get_jobs", {"job_ids": ["job_id_0", "job_id_1", "job_id_2"]}),
+        mock.call("/get_jobs", {"job_ids": ["job_id_0"]}),
+    ]
+
+    # Every parameter resolver should have a job
+    mock_client.create_job.return_value = {"job_ids": ["job_id_0", "job_id_1"]}
+    sampler = service.sampler(target="ibmq_qasm_simulator", symbolic_sweeps=True)
+    with pytest.raises(gss.SuperstaQException, match="Expected 3 jobs"):
+        _ = sampler.run_sweep(circuit, params=sweep, repetitions=2)
+
+
+class _SweepExpandingClient:
+    """Local stand-in for the SuperstaQ API which expands and simulates uploaded sweeps."""
+
+    def __init__(self) -> None:
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.create_job_requests: List[Dict[str, str]] = []
+
+    def create_job(self, serialized_circuits: Dict[str, str], repetitions: int, **_: Any) -> dict:
+        self.create_job_requests.append(serialized_circuits)
+        circuits = css.serialization.deserialize_circuits(serialized_circuits["cirq_circuits"])
+        resolvers = css.serialization.deserialize_sweep(serialized_circuits["sweep"])
+
+        job_ids = []
+        for resolver in resolvers:
+            result = cirq.Simulator().run(circuits[0], resolver, repetitions=repetitions)
+            samples = result.histogram(key="m", fold_func=lambda bits: "".join(map(str, bits)))
+            job_id = f"job_id_{len(self.jobs)}"
+            self.jobs[job_id] = {"job_id": job_id, "samples": samples, "status": "Done"}
+            job_ids.append(job_id)
+
+        return {"job_ids": job_ids}
+
+    def get_job(self, job_id: str) -> dict:
+        return self.jobs[job_id]
+
+
+def test_service_create_sweep_jobs() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    client = _SweepExpandingClient()
+    service._client = client  # type: ignore[assignment]
+
+    a = sympy.Symbol("a")
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0) ** a, cirq.measure(q0, key="m"))
+
+    jobs = service.create_sweep_jobs(circuit, cirq.Points("a", [0, 1, 2, 3]), repetitions=3)
+    assert [job.counts() for job in jobs] == [{"0": 3}, {"1": 3}, {"0": 3}, {"1": 3}]
+    assert len(client.create_job_requests) == 1
+
+    sampler = service.sampler(target="ibmq_qasm_simulator", symbolic_sweeps=True)
+    sweep = [{"a": 1}, {"a": 0}]
+    results = sampler.run_sweep(circuit, params=sweep, repetitions=2)
+    assert [result.histogram(key="m") for result in results] == [
+        collections.Counter({1: 2}),
+        collections.Counter({0: 2}),
+    ]
+    assert [result.params for result in results] == list(cirq.to_resolvers(sweep))
+
+    # The circuit should have been uploaded without being resolved
+    assert len(client.create_job_requests) == 2
+    uploaded_circuits = client.create_job_requests[-1]["cirq_circuits"]
+    assert css.serialization.deserialize_circuits(uploaded_circuits) == [circuit]
+
 
 def test_service_get_job() -> None:
     service = css.Service(api_key="key", remote_host="http://example.com")
@@ -151,6 +332,26 @@ def test_service_get_job() -> None:
     mock_client.get_job.assert_called_once_with("job_id")
 
 
+def test_service_get_jobs() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    mock_client = mock.MagicMock()
+    mock_client.post_request.return_value = {
+        "job_id_0": {"job_id": "job_id_0", "status": "Done"},
+        "job_id_1": {"job_id": "job_id_1", "status": "Running"},
+    }
+    service._client = mock_client
+
+    job_group = service.get_jobs(["job_id_0", "job_id_1"])
+    assert [job.job_id() for job in job_group] == ["job_id_0", "job_id_1"]
+    mock_client.post_request.assert_not_called()
+
+    assert job_group.statuses() == ["Done", "Running"]
+    mock_client.post_request.assert_called_once_with(
+        "/get_jobs", {"job_ids": ["job_id_0", "job_id_1"]}
+    )
+    mock_client.get_job.assert_not_called()
+
+
 def test_service_create_job() -> None:
     service = css.Service(api_key="key", remote_host="http://example.com")
     mock_client = mock.MagicMock()
@@ -167,6 +368,87 @@ def test_service_create_job() -> None:
     assert create_job_kwargs["target"] == "qpu"
 
 
+def test_service_create_jobs() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    mock_client = mock.MagicMock()
+    mock_client.create_job.side_effect = [
+        {"job_ids": ["job_id_0", "job_id_1"]},
+        {"job_ids": ["job_id_2"]},
+    ]
+    service._client = mock_client
+
+    q0 = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.Y(q0)), cirq.Circuit(cirq.Z(q0))]
+    max_payload_bytes = len(css.serialization.serialize_circuits(circuits[:2]))
+    jobs = service.create_jobs(
+        circuits, repetitions=100, target="qpu", max_payload_bytes=max_payload_bytes
+    )
+    assert [job.job_id() for job in jobs] == ["job_id_0", "job_id_1", "job_id_2"]
+
+    assert mock_client.create_job.call_count == 2
+    first_call_kwargs, second_call_kwargs = [c[1] for c in mock_client.create_job.call_args_list]
+    assert first_call_kwargs["serialized_circuits"] == {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits[:2])
+    }
+    assert second_call_kwargs["serialized_circuits"] == {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits[2:])
+    }
+    assert first_call_kwargs["repetitions"] == second_call_kwargs["repetitions"] == 100
+    assert first_call_kwargs["target"] == second_call_kwargs["target"] == "qpu"
+
+
+def test_service_job_store(tmp_path: pathlib.Path) -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    with pytest.raises(ValueError, match="does not have a job store"):
+        _ = service.get_stored_jobs()
+
+    path = tmp_path / "jobs.db"
+    service = css.Service(api_key="key", remote_host="http://example.com", job_store=path)
+    assert isinstance(service._job_store, css.JobStore)
+    assert service._job_store.path == str(path)
+
+    mock_client = mock.MagicMock()
+    mock_client.create_job.return_value = {"job_ids": ["job_id_0", "job_id_1"]}
+    mock_client.post_request.return_value = {
+        "job_id_0": {"job_id": "job_id_0", "status": "Done", "samples": {"1": 10}},
+        "job_id_1": {"job_id": "job_id_1", "status": "Running"},
+    }
+    service._client = mock_client
+
+    circuits = [cirq.Circuit(cirq.X(cirq.LineQubit(0)))] * 2
+    service.create_jobs(circuits, repetitions=10, target="qpu")
+    assert service.get_stored_jobs().statuses() == ["Done", "Running"]
+
+    # A new service using the same store should load the finished job without any requests
+    new_service = css.Service(
+        api_key="key", remote_host="http://example.com", job_store=css.JobStore(path)
+    )
+    new_service._client = mock.MagicMock()
+    assert new_service.get_job("job_id_0").counts() == {"1": 10}
+    assert [job.job_id() for job in new_service.get_stored_jobs()] == ["job_id_0", "job_id_1"]
+    assert new_service.get_stored_jobs().pending_jobs()[0].job_id() == "job_id_1"
+    new_service._client.get_job.assert_not_called()
+    new_service._client.post_request.assert_not_called()
+
+
+def test_service_create_jobs_deduplicate() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    mock_client = mock.MagicMock()
+    mock_client.create_job.return_value = {"job_ids": ["job_id_0", "job_id_1"]}
+    service._client = mock_client
+
+    q0 = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.Y(q0)), cirq.Circuit(cirq.X(q0))]
+    jobs = service.create_jobs(circuits, repetitions=100, target="qpu", deduplicate=True)
+    assert [job.job_id() for job in jobs] == ["job_id_0", "job_id_1", "job_id_0"]
+    assert jobs[0] is jobs[2]
+
+    mock_client.create_job.assert_called_once()
+    assert mock_client.create_job.call_args[1]["serialized_circuits"] == {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits[:2])
+    }
+
+
 def test_service_get_balance() -> None:
     service = css.Service(api_key="key", remote_host="http://example.com")
     mock_client = mock.MagicMock()
@@ -242,6 +524,344 @@ def test_service_aqt_compile_multiple(mock_aqt_compile: mock.MagicMock) -> None:
     assert out.circuits == [cirq.Circuit(), cirq.Circuit()]
     assert not hasattr(out, "circuit") and not hasattr(out, "pulse_list")
 
+    # Circuits should only be split into chunks if pulses aren't needed
+    service.max_compile_chunk_size = 1
+    with mock.patch("importlib.util.find_spec", return_value=True):
+        _ = service.aqt_compile([cirq.Circuit(), cirq.Circuit()])
+        assert mock_aqt_compile.call_count == 2
+
+        _ = service.aqt_compile([cirq.Circuit(), cirq.Circuit()], include_pulses=False)
+        assert mock_aqt_compile.call_count == 4
+
+        service.max_compile_chunk_size = None
+        out = service.aqt_compile([cirq.Circuit(), cirq.Circuit()], include_pulses=False)
+        assert out.circuits == [cirq.Circuit(), cirq.Circuit()]
+        assert out.seq is None and out.pulse_lists is None
+
+        _, out = next(service.aqt_compile_iter([cirq.Circuit()], include_pulses=False))
+        assert out.seq is None and out.pulse_lists is None
+
+
+def test_service_compile_cache() -> None:
+    cache = css.CompileCache()
+    service = css.Service(api_key="key", remote_host="http://example.com", compile_cache=cache)
+    mock_client = mock.MagicMock()
+    service._client = mock_client
+
+    q0 = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q0))
+    mock_client.cq_compile.return_value = {
+        "cirq_circuits": css.serialization.serialize_circuits([circuit])
+    }
+    mock_client.qscout_compile.return_value = {
+        "cirq_circuits": css.serialization.serialize_circuits([circuit]),
+        "jaqal_programs": ["jaqal"],
+    }
+
+    for _ in range(3):
+        assert service.cq_compile(circuit).circuit == circuit
+        assert service.qscout_compile(circuit).jaqal_program == "jaqal"
+    mock_client.cq_compile.assert_called_once()
+    mock_client.qscout_compile.assert_called_once()
+    assert (cache.hits, cache.misses) == (4, 2)
+
+    # Different circuits or targets should not hit the cache
+    service.cq_compile(cirq.Circuit(cirq.Y(q0)))
+    service.cq_compile(circuit, target="other_cq")
+    assert mock_client.cq_compile.call_count == 3
+
+    # Nor should requests to a different API
+    other_service = css.Service(
+        api_key="key", remote_host="http://staging.example.com", compile_cache=cache
+    )
+    other_service._client = mock_client
+    other_service.cq_compile(circuit)
+    assert mock_client.cq_compile.call_count == 4
+
+    cache.clear()
+    service.cq_compile(circuit)
+    assert mock_client.cq_compile.call_count == 5
+
+
+def test_service_compile_chunks() -> None:
+    service = css.Service(
+        api_key="key",
+        remote_host="http://example.com",
+        max_compile_chunk_size=2,
+        max_compile_workers=2,
+        compile_chunk_retries=1,
+    )
+    mock_client = mock.MagicMock()
+    service._client = mock_client
+
+    q0 = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.X(q0) ** (i / 10)) for i in range(5)]
+    attempts: Dict[str, int] = collections.defaultdict(int)
+
+    def cq_compile(request_json: Dict[str, Any]) -> Dict[str, Any]:
+        serialized_circuits = request_json["cirq_circuits"]
+        attempts[serialized_circuits] += 1
+        # The second chunk fails on its first attempt
+        if serialized_circuits == css.serialization.serialize_circuits(circuits[2:4]):
+            if attempts[serialized_circuits] == 1:
+                raise TimeoutError("Reached maximum number of retries")
+        return {"cirq_circuits": serialized_circuits}
+
+    mock_client.cq_compile.side_effect = cq_compile
+    out = service.cq_compile(circuits)
+    assert out.circuits == circuits
+
+    # Only the failed chunk should have been retried
+    assert mock_client.cq_compile.call_count == 4
+    assert attempts == {
+        css.serialization.serialize_circuits(circuits[0:2]): 1,
+        css.serialization.serialize_circuits(circuits[2:4]): 2,
+        css.serialization.serialize_circuits(circuits[4:5]): 1,
+    }
+
+    # Chunks which keep failing should raise
+    mock_client.cq_compile.reset_mock()
+    mock_client.cq_compile.side_effect = TimeoutError("Reached maximum number of retries")
+    with pytest.raises(TimeoutError, match="maximum number of retries"):
+        _ = service.cq_compile(circuits)
+
+    # Non-transient errors should be raised without being retried
+    def invalid_cq_compile(request_json: Dict[str, Any]) -> Dict[str, Any]:
+        attempts[request_json["cirq_circuits"]] += 1
+        raise gss.SuperstaQException("Invalid circuit", 400)
+
+    attempts.clear()
+    mock_client.cq_compile.side_effect = invalid_cq_compile
+    with pytest.raises(gss.SuperstaQException, match="Invalid circuit"):
+        _ = service.cq_compile(circuits)
+    assert attempts and all(num_attempts == 1 for num_attempts in attempts.values())
+
+    # Chunks should be split by size too
+    service.max_compile_chunk_size = None
+    service.max_compile_chunk_bytes = len(css.serialization.serialize_circuits(circuits[:3]))
+    mock_client.cq_compile.side_effect = cq_compile
+    mock_client.cq_compile.reset_mock()
+    assert service.cq_compile(circuits).circuits == circuits
+    assert mock_client.cq_compile.call_count == 2
+
+    # An empty list should still be sent as a single request
+    assert service.cq_compile([]).circuits == []
+    mock_client.cq_compile.assert_called_with({"cirq_circuits": "[]", "backend": "cq"})
+
+
+def test_service_compile_binary_circuits() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com", circuit_format="auto")
+    mock_client = mock.MagicMock()
+    mock_client.get_backends.return_value = {
+        "superstaq_backends": {},
+        "circuit_formats": ["json", css.serialization.BINARY_CIRCUIT_FORMAT],
+    }
+    service._client = mock_client
+
+    def cq_compile(request_json: Dict[str, Any]) -> Dict[str, Any]:
+        assert "cirq_circuits" not in request_json
+        serialized_circuits = base64.b64decode(request_json["cirq_circuits_binary"])
+        compiled_circuits = css.serialization.deserialize_circuits_binary(serialized_circuits)
+        return {"cirq_circuits": css.serialization.serialize_circuits(compiled_circuits)}
+
+    mock_client.cq_compile.side_effect = cq_compile
+
+    q0 = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.X(q0) ** (i / 10)) for i in range(5)]
+    assert service.cq_compile(circuits).circuits == circuits
+    assert service.cq_compile(circuits[0]).circuit == circuits[0]
+    assert service.cq_compile([]).circuits == []
+
+    # Support for the binary format should only be checked once
+    mock_client.get_backends.assert_called_once()
+
+    # Binary chunks should be split like JSON chunks
+    service.max_compile_chunk_size = 2
+    mock_client.cq_compile.reset_mock()
+    assert service.cq_compile(circuits).circuits == circuits
+    assert mock_client.cq_compile.call_count == 3
+
+    service = css.Service(api_key="key", remote_host="http://example.com", circuit_format="auto")
+    mock_client.get_backends.return_value = {"superstaq_backends": {}}
+    service._client = mock_client
+    mock_client.cq_compile.side_effect = None
+    mock_client.cq_compile.return_value = {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits[0])
+    }
+    _ = service.cq_compile(circuits[0])
+    mock_client.cq_compile.assert_called_with(
+        {"cirq_circuits": css.serialization.serialize_circuits(circuits[0]), "backend": "cq"}
+    )
+
+    service.circuit_format = "binary"
+    _ = service.cq_compile(circuits[0])
+    serialized_circuit = css.serialization.serialize_circuits_binary(circuits[0])
+    mock_client.cq_compile.assert_called_with(
+        {"cirq_circuits_binary": base64.b64encode(serialized_circuit).decode(), "backend": "cq"}
+    )
+
+    with pytest.raises(ValueError, match="Invalid circuit format"):
+        _ = css.Service(api_key="key", remote_host="http://example.com", circuit_format="xml")
+
+
+def test_service_compile_iter() -> None:
+    service = css.Service(
+        api_key="key",
+        remote_host="http://example.com",
+        max_compile_chunk_size=2,
+        max_compile_workers=1,
+    )
+    mock_client = mock.MagicMock()
+    service._client = mock_client
+
+    def compile_fn(request_json: Dict[str, Any]) -> Dict[str, Any]:
+        serialized_circuits = request_json["cirq_circuits"]
+        num_circuits = len(css.serialization.deserialize_circuits(serialized_circuits))
+        return {
+            "cirq_circuits": serialized_circuits,
+            "state_jp": gss.converters.serialize({}),
+            "pulse_lists_jp": gss.converters.serialize([[[]]] * num_circuits),
+            "pulses": gss.converters.serialize([None] * num_circuits),
+        }
+
+    mock_client.aqt_compile.side_effect = compile_fn
+    mock_client.ibmq_compile.side_effect = compile_fn
+
+    q0 = cirq.LineQubit(0)
+    x, y, z = (cirq.Circuit(gate(q0)) for gate in (cirq.X, cirq.Y, cirq.Z))
+    circuits = [x, y, x, z, z, z, y]
+
+    outputs = dict(service.aqt_compile_iter(iter(circuits), deduplicate=True))
+    assert sorted(outputs) == [0, 3]
+    assert outputs[0].circuits == [x, y, x]
+    assert outputs[3].circuits == [z, z, z, y]
+
+    # Duplicates should only be sent once within each chunk
+    assert mock_client.aqt_compile.call_args_list == [
+        mock.call(
+            {"cirq_circuits": css.serialization.serialize_circuits([x, y]), "backend": "keysight"}
+        ),
+        mock.call(
+            {"cirq_circuits": css.serialization.serialize_circuits([z, y]), "backend": "keysight"}
+        ),
+    ]
+
+    # By default, every AQT circuit should be sent
+    mock_client.aqt_compile.reset_mock()
+    outputs = dict(service.aqt_compile_iter(iter(circuits)))
+    assert sorted(outputs) == [0, 2, 4, 6]
+    assert [outputs[i].circuits for i in (0, 2, 4, 6)] == [[x, y], [x, z], [z, z], [y]]
+    assert mock_client.aqt_compile.call_count == 4
+
+    with pytest.warns(UserWarning, match="Qiskit Terra"):
+        outputs = dict(service.ibmq_compile_iter(circuits[1:4], target="ibmq_lima"))
+    assert outputs[0].circuits == [y, x]
+    assert outputs[2].circuits == [z]
+    assert mock_client.ibmq_compile.call_args[0][0]["backend"] == "ibmq_lima"
+
+    assert list(service.aqt_compile_iter([])) == []
+
+
+def test_service_compile_iter_bounded() -> None:
+    service = css.Service(
+        api_key="key",
+        remote_host="http://example.com",
+        max_compile_chunk_size=1,
+        max_compile_workers=2,
+        compile_chunk_retries=0,
+    )
+    mock_client = mock.MagicMock()
+    mock_client.aqt_compile.side_effect = lambda request_json: {
+        "cirq_circuits": request_json["cirq_circuits"],
+        "state_jp": gss.converters.serialize({}),
+        "pulse_lists_jp": gss.converters.serialize([[[]]]),
+    }
+    service._client = mock_client
+
+    q0 = cirq.LineQubit(0)
+    num_consumed = 0
+
+    def circuits() -> Iterator[cirq.Circuit]:
+        nonlocal num_consumed
+        for i in range(100):
+            num_consumed += 1
+            yield cirq.Circuit(cirq.X(q0) ** (i / 100))
+
+    # Circuits should only be consumed as chunks finish
+    outputs = service.aqt_compile_iter(circuits())
+    index, output = next(outputs)
+    assert len(output.circuits) == 1
+    assert num_consumed <= 4
+    outputs.close()
+    assert mock_client.aqt_compile.call_count <= 4
+
+    mock_client.aqt_compile.side_effect = TimeoutError("Reached maximum number of retries")
+    with pytest.raises(TimeoutError, match="maximum number of retries"):
+        _ = list(service.aqt_compile_iter(circuits()))
+
+
+def test_service_compile_deduplicate() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    mock_client = mock.MagicMock()
+    service._client = mock_client
+
+    q0 = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.Y(q0))]
+    mock_client.aqt_compile.return_value = {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits),
+        "state_jp": gss.converters.serialize({}),
+        "pulse_lists_jp": gss.converters.serialize([[["x"]], [["y"]]]),
+    }
+    mock_client.qscout_compile.return_value = {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits[::-1]),
+        "jaqal_programs": ["y", "x"],
+    }
+
+    # AQT circuits are only deduplicated if requested (so that .seq matches .circuits)
+    _ = service.aqt_compile([circuits[0], circuits[1], circuits[0].copy()])
+    mock_client.aqt_compile.assert_called_once_with(
+        {
+            "cirq_circuits": css.serialization.serialize_circuits(circuits + circuits[:1]),
+            "backend": "keysight",
+        }
+    )
+
+    out = service.aqt_compile([circuits[0], circuits[1], circuits[0].copy()], deduplicate=True)
+    assert out.circuits == [circuits[0], circuits[1], circuits[0]]
+    mock_client.aqt_compile.assert_called_with(
+        {"cirq_circuits": css.serialization.serialize_circuits(circuits), "backend": "keysight"}
+    )
+
+    out = service.qscout_compile([circuits[1], circuits[0], circuits[1], circuits[1]])
+    assert out.circuits == [circuits[1], circuits[0], circuits[1], circuits[1]]
+    assert out.jaqal_programs == ["y", "x", "y", "y"]
+    mock_client.qscout_compile.assert_called_once_with(
+        {
+            "cirq_circuits": css.serialization.serialize_circuits(circuits[::-1]),
+            "backend": "qscout",
+        }
+    )
+
+    mock_client.resource_estimate.return_value = {
+        "resource_estimates": [
+            {"num_single_qubit_gates": 1, "num_two_qubit_gates": 0, "depth": 1},
+            {"num_single_qubit_gates": 2, "num_two_qubit_gates": 0, "depth": 2},
+        ]
+    }
+    estimates = service.resource_estimate(circuits + circuits, "qasm_simulator")
+    assert estimates == [
+        ResourceEstimate(1, 0, 1),
+        ResourceEstimate(2, 0, 2),
+        ResourceEstimate(1, 0, 1),
+        ResourceEstimate(2, 0, 2),
+    ]
+    mock_client.resource_estimate.assert_called_once_with(
+        {
+            "cirq_circuits": css.serialization.serialize_circuits(circuits),
+            "backend": "qasm_simulator",
+        }
+    )
+
 
 @mock.patch(
     "general_superstaq.superstaq_client._SuperstaQClient.post_request",
@@ -257,6 +877,10 @@ def test_service_aqt_compile_eca(mock_aqt_compile: mock.MagicMock) -> None:
     assert out.circuits == [cirq.Circuit()]
     assert not hasattr(out, "circuit") and not hasattr(out, "pulse_list")
 
+    with mock.patch("importlib.util.find_spec", return_value=True):
+        out = service.aqt_compile_eca(cirq.Circuit(), 1, include_pulses=False)
+        assert out.seq is None and out.pulse_lists is None
+
 
 @mock.patch(
     "general_superstaq.superstaq_client._SuperstaQClient.resource_estimate",
@@ -374,6 +998,32 @@ def test_service_neutral_atom_compile(mock_neutral_atom_compile: mock.MagicMock)
         _ = service.neutral_atom_compile(cirq.Circuit())
 
 
+def test_service_parallel_pulse_deserialization() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com", max_pulse_workers=2)
+    mock_client = mock.MagicMock()
+    service._client = mock_client
+
+    circuits = [cirq.Circuit(cirq.X(q)) for q in cirq.LineQubit.range(100)]
+    pulses = [gss.converters.serialize(duration) for duration in range(100)]
+    mock_client.neutral_atom_compile.return_value = {"pulses": pulses}
+    assert service.neutral_atom_compile(circuits) == list(range(100))
+
+    mock_client.ibmq_compile.return_value = {
+        "cirq_circuits": css.serialization.serialize_circuits(circuits),
+        "pulses": pulses,
+    }
+    with mock.patch(
+        "cirq_superstaq.serialization.deserialize_pulses", return_value=list(range(100))
+    ) as mock_deserialize, mock.patch(
+        "importlib.util.find_spec", return_value=True
+    ), mock.patch.dict(
+        "sys.modules", {"qiskit": mock.MagicMock(__version__="0.20.0")}
+    ):
+        out = service.ibmq_compile(circuits)
+        assert out.pulse_sequences == list(range(100))
+    mock_deserialize.assert_called_once_with(pulses, 2)
+
+
 @mock.patch.dict(os.environ, {"SUPERSTAQ_API_KEY": "tomyheart"})
 def test_service_api_key_via_env() -> None:
     service = css.Service(remote_host="http://example.com")
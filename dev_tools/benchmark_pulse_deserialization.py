@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Compares serial and parallel deserialization of (synthetic) per-circuit pulse payloads.
+
+Usage: python dev_tools/benchmark_pulse_deserialization.py [--num-circuits N]
+    [--num-instructions I] [--workers W] [--repeats R]
+"""
+
+import argparse
+import random
+import timeit
+from typing import List
+
+import general_superstaq as gss
+
+import cirq_superstaq as css
+
+
+def _synthetic_pulses(num_circuits: int, num_instructions: int) -> List[str]:
+    """Returns serialized stand-ins for pulse schedules (lists of timed instructions)."""
+    rng = random.Random(0)
+    channels = [f"d{i}" for i in range(8)] + [f"u{i}" for i in range(8)]
+    pulses = []
+    for _ in range(num_circuits):
+        schedule = [
+            (
+                16 * i,
+                {
+                    "name": rng.choice(["play", "shift_phase", "delay", "acquire"]),
+                    "channel": rng.choice(channels),
+                    "duration": rng.randrange(16, 320, 16),
+                    "parameters": [rng.random() for _ in range(4)],
+                },
+            )
+            for i in range(num_instructions)
+        ]
+        pulses.append(gss.converters.serialize(schedule))
+    return pulses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-circuits", type=int, default=1000)
+    parser.add_argument("--num-instructions", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    serialized_pulses = _synthetic_pulses(args.num_circuits, args.num_instructions)
+    total_bytes = sum(len(pulse) for pulse in serialized_pulses)
+
+    timings = {}
+    for name, max_workers in [("serial", 1), ("parallel", args.workers)]:
+        timings[name] = min(
+            timeit.repeat(
+                lambda: css.serialization.deserialize_pulses(serialized_pulses, max_workers),
+                number=1,
+                repeat=args.repeats,
+            )
+        )
+        print(f"{name:>10}: {timings[name]:.4f}s")
+
+    speedup = timings["serial"] / timings["parallel"]
+    print(f"{args.num_circuits} payloads ({total_bytes} bytes), {speedup:.1f}x speedup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Compares the speed of `css.serialization.serialize_circuits` with serializing via `cirq.to_json`.
+
+Usage: python dev_tools/benchmark_serialization.py [--num-circuits N] [--depth D] [--repeats R]
+"""
+
+import argparse
+import timeit
+
+import cirq
+
+import cirq_superstaq as css
+
+
+def _random_circuits(num_circuits: int, depth: int) -> list:
+    qubits = cirq.LineQubit.range(8)
+    superstaq_ops = [
+        css.ZZSwapGate(0.3).on(qubits[0], qubits[1]),
+        css.AceCRMinusPlus(qubits[2], qubits[3]),
+        css.ParallelRGate(0.1, 0.2, 2).on(qubits[4], qubits[5]),
+        css.Barrier(8).on(*qubits),
+    ]
+    return [
+        cirq.testing.random_circuit(qubits, depth, 0.8, random_state=seed) + superstaq_ops
+        for seed in range(num_circuits)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-circuits", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    circuits = _random_circuits(args.num_circuits, args.depth)
+    serialized_circuits = css.serialization.serialize_circuits(circuits)
+    assert serialized_circuits == css.serialization._serialize_circuits_via_to_json(circuits)
+
+    timings = {}
+    for name, serialize_fn in [
+        ("cirq.to_json", css.serialization._serialize_circuits_via_to_json),
+        ("serialize_circuits", css.serialization.serialize_circuits),
+    ]:
+        timings[name] = min(
+            timeit.repeat(lambda: serialize_fn(circuits), number=1, repeat=args.repeats)
+        )
+        print(f"{name:>20}: {timings[name]:.4f}s")
+
+    speedup = timings["cirq.to_json"] / timings["serialize_circuits"]
+    print(f"{len(serialized_circuits)} bytes, {speedup:.1f}x speedup")
+
+
+if __name__ == "__main__":
+    main()